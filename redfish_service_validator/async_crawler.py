@@ -0,0 +1,532 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Async Crawler
+
+File : async_crawler.py
+
+Brief : This file contains the definitions and functionalities for traversing
+        the service with an asyncio event loop and a non-blocking HTTP
+        transport.
+"""
+
+import asyncio
+import collections
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import redfish
+import requests
+
+from redfish_service_validator import logger
+from redfish_service_validator import validate
+from redfish_service_validator.crawler import CrawlScheduler
+from redfish_service_validator.request_control import RequestBudgetExhausted
+from redfish_service_validator.service_session import PAYLOAD_CHUNK_SIZE
+from redfish_service_validator.service_session import get_header_size
+from redfish_service_validator.service_session import new_transfer
+from redfish_service_validator.traffic_archive import NotRecordedError
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
+
+# Content codings requested from the service; aiohttp would also ask for Brotli if it's installed, which the
+# Decompressor doesn't handle
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+class Decompressor(object):
+    """
+    Decompresses the body of a response one chunk at a time
+
+    Args:
+        content_encoding: The Content-Encoding header of the response
+    """
+
+    def __init__(self, content_encoding):
+        self._content_encoding = (content_encoding or "").strip().lower()
+        self._decompressor = None
+        if self._content_encoding in ["gzip", "x-gzip"]:
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self._content_encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+        self._started = False
+
+    def decompress(self, chunk):
+        """
+        Decompresses the next chunk of the body
+
+        Args:
+            chunk: The next chunk as received from the service
+
+        Returns:
+            The decompressed data
+        """
+        if self._decompressor is None:
+            return chunk
+        if self._content_encoding == "deflate" and not self._started:
+            self._started = True
+            try:
+                return self._decompressor.decompress(chunk)
+            except zlib.error:
+                # Some services send raw deflate data without the zlib wrapper
+                self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._decompressor.decompress(chunk)
+
+    def flush(self):
+        """
+        Gets the rest of the decompressed data once the body has been read
+
+        Returns:
+            The decompressed data
+        """
+        if self._decompressor is None:
+            return b""
+        return self._decompressor.flush()
+
+
+async def read_body(resp, max_payload_bytes=None):
+    """
+    Reads the body of a response, stopping once it goes over the payload size limit
+
+    Args:
+        resp: The response from aiohttp
+        max_payload_bytes: The maximum number of bytes to read for the body, after decompression; None for no limit
+
+    Returns:
+        The number of bytes received on the wire
+        The decompressed body; empty if the body went over the limit
+        A boolean indicating if the body went over the limit
+    """
+    decompressor = Decompressor(resp.headers.get("Content-Encoding"))
+    wire_size = 0
+    body = bytearray()
+    async for chunk in resp.content.iter_chunked(PAYLOAD_CHUNK_SIZE):
+        wire_size += len(chunk)
+        body += decompressor.decompress(chunk)
+        if max_payload_bytes is not None and len(body) > max_payload_bytes:
+            # Leave the rest unread; the connection is closed along with the response
+            resp.close()
+            return wire_size, b"", True
+    body += decompressor.flush()
+    if max_payload_bytes is not None and len(body) > max_payload_bytes:
+        return wire_size, b"", True
+    return wire_size, bytes(body), False
+
+
+class AsyncTransport(object):
+    """
+    Non-blocking HTTP transport for reading resources from the service
+
+    Design note: Requests share the concurrency controller, request budget, and retry policy with the Redfish client
+    used on the validator thread.  Responses are decompressed here rather than by aiohttp so the bytes on the wire can
+    be counted and the payload size limit applies to the body as it arrives.  Tasks waiting for a slot queue up in
+    order; each release, from either thread, hands the freed slots to the tasks at the front of the queue rather than
+    waking every waiting task to compete for them.
+
+    Args:
+        sut: The system under test
+        max_in_flight: The maximum number of requests to have in flight
+    """
+
+    def __init__(self, sut, max_in_flight):
+        self._sut = sut
+        self._base_url = sut.rhost.rstrip("/")
+        self._max_in_flight = max_in_flight
+        self._controller = sut.session.controller
+        self._budget = sut.session.budget
+        self._retry_policy = sut.session.retry_policy
+        self._waiters = collections.deque()
+        self._loop = None
+        self._session = None
+        self._proxy = None
+        if sut.proxies:
+            self._proxy = sut.proxies.get(self._base_url.split(":")[0])
+
+    async def __aenter__(self):
+        timeout = aiohttp.ClientTimeout()
+        if self._sut.timeout:
+            timeout = aiohttp.ClientTimeout(total=self._sut.timeout)
+        self._loop = asyncio.get_running_loop()
+        self._controller.add_listener(self._on_release)
+        self._session = aiohttp.ClientSession(
+            timeout=timeout,
+            connector=aiohttp.TCPConnector(ssl=False, limit=self._max_in_flight),
+            auto_decompress=False,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        self._controller.remove_listener(self._on_release)
+        await self._session.close()
+
+    async def get(self, uri, headers=None, link_check=False):
+        """
+        Performs a GET request on the service, retrying it as allowed by the retry policy
+
+        Args:
+            uri: The URI to get
+            headers: Additional HTTP headers for the request
+            link_check: Indicates if the request is only for checking a reference link
+
+        Returns:
+            The response from the service
+            The time, in milliseconds, for the service to respond
+            The number of retries performed
+        """
+        retries = 0
+        while True:
+            response, response_time, error = await self._send(uri, headers)
+            status = None
+            retry_after = None
+            if response is not None:
+                status = response.status
+                retry_after = response.getheader("Retry-After")
+            delay, reason = self._retry_policy.get_delay(retries, link_check, status, retry_after, error)
+            if delay is None:
+                if error is not None:
+                    # Same exception as the Redfish client when it gives up on a request
+                    raise redfish.rest.v1.RetriesExhaustedError() from error
+                return response, response_time, retries
+            retries += 1
+            logger.debug("Retrying {} in {:.1f}s after {}; retry {}".format(uri, delay, reason, retries))
+            await asyncio.sleep(delay)
+
+    async def _send(self, uri, extra_headers=None, replay_client=None):
+        """
+        Sends a single GET request to the service once the request controls allow it; if the session expired, the
+        request is sent again after logging in again
+
+        Args:
+            uri: The URI to get
+            extra_headers: Additional HTTP headers for the request
+            replay_client: The Redfish client to send the request again with after logging in again
+
+        Returns:
+            The response from the service, or None if the request failed; its 'transfer' attribute holds the bytes
+            transferred, and its 'oversized' attribute indicates if the body was dropped for going over the payload
+            size limit
+            The time, in milliseconds, for the service to respond
+            The exception raised for the request, or None if a response was received
+        """
+        client = replay_client or self._sut.session.next_client()
+        session_key = client.get_session_key()
+        headers = {"Accept": "*/*", "Accept-Encoding": ACCEPT_ENCODING}
+        headers.update(extra_headers or {})
+        headers.update(self._sut.get_auth_headers(client))
+        url = yarl.URL(requests.utils.requote_uri(self._base_url + uri.replace("//", "/")), encoded=True)
+        await self._acquire()
+        try:
+            delay = self._budget.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except BaseException:
+            # Give back the slot if the budget ran out or the task was cancelled while waiting for its turn
+            self._controller.release()
+            raise
+        response = None
+        response_time = None
+        error = None
+        try:
+            _t0 = time.time()
+            async with self._session.get(url, headers=headers, proxy=self._proxy) as resp:
+                wire_size, body, oversized = await read_body(resp, self._sut.session.max_payload_bytes)
+                response_time = round((time.time() - _t0) * 1000)  # ms
+                response = redfish.rest.v1.StaticRestResponse(
+                    Status=resp.status, Content=body.decode("utf-8", "ignore"), Headers=dict(resp.headers)
+                )
+                response.oversized = oversized
+                response.transfer = new_transfer()
+                response.transfer["BytesSent"] = get_header_size(
+                    "GET {} HTTP/1.1".format(url.raw_path_qs), resp.request_info.headers
+                )
+                header_size = get_header_size("HTTP/1.1 {} {}".format(resp.status, resp.reason), resp.headers)
+                response.transfer["BytesReceived"] = header_size + wire_size
+                response.transfer["BytesUncompressed"] = header_size + len(body)
+                self._sut.session.add_transfer(response.transfer)
+                self._sut.session.record(uri, response, response_time)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            error = err
+        finally:
+            if response is not None:
+                self._controller.release(response_time, response.status, response.getheader("Retry-After"))
+            else:
+                self._controller.release(error=error)
+
+        if replay_client is None and response is not None and response.status == 401:
+            # Log in again on another thread; workers on the validator thread might be doing the same
+            loop = asyncio.get_running_loop()
+            lost_time = response_time / 1000
+            if await loop.run_in_executor(None, self._sut.session.reauthenticate, client, session_key, lost_time):
+                return await self._send(uri, extra_headers, replay_client=client)
+        return response, response_time, error
+
+    async def _acquire(self):
+        """
+        Waits until another request is allowed in flight
+        """
+        if not self._waiters and self._controller.try_acquire():
+            return
+        waiter = self._loop.create_future()
+        self._waiters.append(waiter)
+        # A slot may have been released before the task joined the queue
+        self._hand_off()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the task was cancelled; pass it on
+                self._controller.release()
+            raise
+
+    def _on_release(self):
+        """
+        Schedules handing freed slots to waiting tasks; called from the thread that released a slot
+        """
+        if self._waiters:
+            self._loop.call_soon_threadsafe(self._hand_off)
+
+    def _hand_off(self):
+        """
+        Gives freed slots to the tasks that have waited the longest
+        """
+        while self._waiters:
+            if self._waiters[0].done():
+                # Cancelled while waiting
+                self._waiters.popleft()
+                continue
+            if not self._controller.try_acquire():
+                return
+            self._waiters.popleft().set_result(None)
+
+
+async def claim(sut, uri):
+    """
+    Claims a URI for reading, waiting on the validator thread if it's already reading the URI
+
+    Args:
+        sut: The system under test
+        uri: The URI to claim
+
+    Returns:
+        A boolean indicating if the caller owns the request and needs to release the URI when finished
+    """
+    while True:
+        resource, pending = sut.claim_resource(uri)
+        if resource is not None:
+            return False
+        if pending is None:
+            return True
+        await asyncio.get_running_loop().run_in_executor(None, pending.wait)
+
+
+async def fetch(sut, transport, uri, link_check=False):
+    """
+    Reads a resource and adds it to the resource cache, along with the members of a resource collection and the
+    targets of reference links that are not going to be tested; the same steps as SystemUnderTest.get_resource,
+    SystemUnderTest.expand_collection, and SystemUnderTest.get_link_resource with requests sent by the transport
+
+    Args:
+        sut: The system under test
+        transport: The transport for accessing the service
+        uri: The URI to read
+        link_check: Indicates if the resource is only read for checking a reference link
+
+    Returns:
+        The URI that was read
+    """
+    if not await claim(sut, uri):
+        return uri
+    try:
+        resource, request_uri, headers = sut.start_resource_read(uri)
+        if request_uri is not None:
+            try:
+                try:
+                    response, response_time, retries = await transport.get(request_uri, headers, link_check)
+                except NotRecordedError:
+                    if request_uri == uri:
+                        raise
+                    response, response_time, retries = None, None, 0
+                if sut.needs_full_read(uri, request_uri, response):
+                    response, response_time, more_retries = await transport.get(uri, headers, link_check)
+                    retries += more_retries
+                sut.set_resource_response(uri, resource, response, response_time, retries)
+            except RequestBudgetExhausted:
+                raise
+            except Exception as err:
+                sut.set_resource_exception(uri, resource, err)
+        resource = sut.cache_resource(uri, resource)
+    finally:
+        sut.end_circuit_trial(uri)
+        sut.release_resource(uri)
+    if link_check:
+        return uri
+
+    # Read the targets of reference links that validation needs and the traversal doesn't read
+    payload, _ = validate.validate_response(resource)
+    if payload is not None and not resource["Unchanged"] and not sut.time_is_up():
+        sut.apply_collection_limits(payload, uri)
+        links = [
+            fetch_link(sut, transport, link_uri, prop_name)
+            for link_uri, prop_name in sut.find_link_uris(payload)
+            if not sut.is_resource_tested(link_uri, prop_name)
+        ]
+        for result in await asyncio.gather(*links, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+
+    # Read the members of resource collections in one request if possible
+    expand_uri = sut.get_expand_uri(uri)
+    if expand_uri is None or not await claim(sut, expand_uri):
+        return uri
+    try:
+        if sut.get_expand_uri(uri) is not None:
+            logger.debug("Caching members of {} with $expand...".format(uri))
+            try:
+                response, _, _ = await transport.get(expand_uri)
+            except Exception as err:
+                logger.debug("Could not read {}; {}".format(expand_uri, err))
+            else:
+                sut.cache_expanded_members(uri, expand_uri, response)
+    finally:
+        sut.release_resource(expand_uri)
+    return uri
+
+
+async def fetch_link(sut, transport, uri, prop_name):
+    """
+    Reads the target of a reference link for checking its type; the same steps as SystemUnderTest.get_link_resource
+    with requests sent by the transport
+
+    Args:
+        sut: The system under test
+        transport: The transport for accessing the service
+        uri: The URI of the reference link
+        prop_name: The name of the navigation property containing the reference link
+    """
+    if sut.get_cached_link_resource(uri) is not None:
+        return
+    select_uri = sut.get_link_select_uri(uri, prop_name)
+    if select_uri is None:
+        await fetch(sut, transport, uri, link_check=True)
+        return
+    await claim(sut, select_uri)
+    try:
+        if sut.get_cached_link_resource(uri) is not None:
+            return
+        logger.debug("Caching {} for a reference link check...".format(uri))
+        resource = sut.create_resource_entry(uri)
+        if not sut.check_circuit(uri, resource):
+            try:
+                response, response_time, retries = await transport.get(select_uri, link_check=True)
+                if not sut.is_link_response_usable(select_uri, response):
+                    await fetch(sut, transport, uri, link_check=True)
+                    return
+                sut.set_resource_response(uri, resource, response, response_time, retries)
+            except RequestBudgetExhausted:
+                raise
+            except Exception as err:
+                sut.set_resource_exception(uri, resource, err)
+        sut.cache_link_resource(uri, resource)
+    finally:
+        sut.end_circuit_trial(uri)
+        sut.release_resource(select_uri)
+
+
+def crawl(sut, mode, start_uri, workers, order="DFS"):
+    """
+    Performs validation of the service with an asyncio event loop
+
+    Args:
+        sut: The system under test
+        mode: The traversal mode for the service
+        start_uri: The starting URI for validation
+        workers: The maximum number of requests to have in flight
+        order: The order for fetching URIs
+    """
+    logger.info("Crawling the service with the asyncio engine; {} requests in flight".format(workers))
+    asyncio.run(crawl_async(sut, mode, start_uri, workers, order))
+
+
+async def crawl_async(sut, mode, start_uri, workers, order="DFS"):
+    """
+    Coroutine for performing validation of the service
+
+    Design note: Every discovered URI gets its own task right away; the transport limits how many requests are in
+    flight.  The targets of reference links that are not going to be tested are read by the same task as the resource
+    holding them, so validation finds every link it checks in the cache instead of going back to the service one
+    request at a time.  Validation runs on a single worker thread so it doesn't stall the event loop, and results are
+    still tracked one resource at a time.
+
+    Args:
+        sut: The system under test
+        mode: The traversal mode for the service
+        start_uri: The starting URI for validation
+        workers: The maximum number of requests to have in flight
+        order: The order for fetching URIs
+    """
+    loop = asyncio.get_running_loop()
+    sut.set_traversal(mode, start_uri)
+    scheduler = CrawlScheduler(sut, mode, start_uri, order)
+    fetches = set()
+    fetch_uris = {}
+    validation = None
+
+    def pending():
+        return scheduler.remaining() + [fetch_uris[task] for task in fetches]
+
+    with ThreadPoolExecutor(max_workers=1) as validator:
+        async with AsyncTransport(sut, workers) as transport:
+            try:
+                while scheduler.has_frontier() or fetches or scheduler.has_ready() or validation is not None:
+                    if sut.time_is_up():
+                        # Finish the requests and validation in flight, but don't start anything new
+                        if validation is not None:
+                            await validation
+                            validation = None
+                        if fetches:
+                            await asyncio.wait(fetches)
+                        for task in list(fetches):
+                            fetches.discard(task)
+                            scheduler.add_response(task.result())
+                        sut.set_unvisited(scheduler.remaining())
+                        break
+
+                    while scheduler.has_frontier():
+                        uri = scheduler.next_uri()
+                        task = asyncio.ensure_future(fetch(sut, transport, uri))
+                        fetches.add(task)
+                        fetch_uris[task] = uri
+                    if validation is None and scheduler.has_ready():
+                        validation = loop.run_in_executor(
+                            validator, sut.validate_resource, mode, start_uri, scheduler.next_ready()
+                        )
+
+                    waiting = set(fetches)
+                    if validation is not None:
+                        waiting.add(validation)
+                    done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task is validation:
+                            task.result()
+                            validation = None
+                            sut.save_progress(pending)
+                        else:
+                            fetches.discard(task)
+                            del fetch_uris[task]
+                            scheduler.add_response(task.result())
+            finally:
+                sut.save_progress(pending, force=True)
+                # Cancel anything still outstanding so the session closes cleanly
+                for task in fetches:
+                    task.cancel()
+                if fetches:
+                    await asyncio.gather(*fetches, return_exceptions=True)
@@ -0,0 +1,183 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Checkpoint
+
+File : checkpoint.py
+
+Brief : This file contains the definitions and functionalities for saving
+        the progress of a run so an interrupted run can be resumed.
+"""
+
+import json
+import threading
+import time
+
+import redfish
+
+from redfish_service_validator import logger
+from redfish_service_validator.traffic_archive import SKIPPED_HEADERS
+
+CHECKPOINT_FILE = "Checkpoint.jsonl"
+CHECKPOINT_VERSION = 1
+CHECKPOINT_INTERVAL = 30  # Seconds between progress records
+
+
+def save_resource(uri, resource):
+    """
+    Converts the information about a tested resource to a form that can be saved
+
+    Args:
+        uri: The URI of the resource
+        resource: The resource information after testing
+
+    Returns:
+        A dictionary that can be saved as JSON
+    """
+    saved = dict(resource)
+    saved["Uri"] = resource["Uri"] or uri
+    if resource["Exception"] is not None:
+        saved["Exception"] = str(resource["Exception"])
+    response = resource["Response"]
+    if response is not None:
+        headers = {}
+        for name, value in response.getheaders():
+            if name.lower() not in SKIPPED_HEADERS:
+                headers[name] = value
+        saved["Response"] = {"Status": response.status, "Headers": headers, "Payload": response.text}
+    return saved
+
+
+def restore_resource(saved):
+    """
+    Converts the saved information about a tested resource back to the form used in the resource cache
+
+    Args:
+        saved: The dictionary made by save_resource
+
+    Returns:
+        The resource information, without the test results and their tallies
+    """
+    resource = dict(saved)
+    if saved["Response"] is not None:
+        resource["Response"] = redfish.rest.v1.StaticRestResponse(
+            Status=saved["Response"]["Status"], Content=saved["Response"]["Payload"], Headers=saved["Response"]["Headers"]
+        )
+    resource["Results"] = {}
+    for result in ["Pass", "Warn", "Fail", "Skip"]:
+        resource[result] = 0
+    return resource
+
+
+def load(path):
+    """
+    Reads a checkpoint
+
+    Args:
+        path: The file holding the checkpoint
+
+    Returns:
+        A dictionary with the details of the run, the tested resources keyed by URI, and the last progress record
+    """
+    checkpoint = None
+    with open(path) as checkpoint_file:
+        for line in checkpoint_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # The run stopped in the middle of writing the record
+                continue
+            if "Checkpoint" in record:
+                if record["Checkpoint"].get("Version") != CHECKPOINT_VERSION:
+                    raise ValueError("{} is not a supported checkpoint".format(path))
+                checkpoint = {"Run": record["Checkpoint"], "Resources": {}, "Progress": None}
+            elif checkpoint is None:
+                raise ValueError("{} does not start with the details of the run".format(path))
+            elif "Resource" in record:
+                checkpoint["Resources"][record["Resource"]["Uri"]] = record["Resource"]
+            elif "Progress" in record:
+                checkpoint["Progress"] = record["Progress"]
+    if checkpoint is None:
+        raise ValueError("{} is empty".format(path))
+    return checkpoint
+
+
+class CrawlCheckpoint(object):
+    """
+    Saves the progress of a run as it's tested
+
+    Design note: The checkpoint is a file of JSON records, one per line, that's only ever appended to, so an
+    interruption at any point loses at most the record being written.  Each resource is saved as soon as it's tested,
+    and the URIs waiting to be tested and the running totals are saved periodically.  Resuming does not need the saved
+    URIs: the traversal is rebuilt by following the links in the saved payloads, which also rebuilds what the
+    traversal learns along the way, such as the URIs found in annotations.
+
+    Args:
+        path: The file holding the checkpoint
+        run: A dictionary with the details of the run; None to add to an existing checkpoint
+    """
+
+    def __init__(self, path, run=None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._last_progress = time.monotonic()
+        self._file = open(path, "w" if run is not None else "a")
+        if run is not None:
+            run = dict(run, Version=CHECKPOINT_VERSION)
+            self._write({"Checkpoint": run})
+
+    def _write(self, record):
+        """
+        Appends a record to the checkpoint
+
+        Args:
+            record: The record to append
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps(record, sort_keys=True) + "\n")
+            self._file.flush()
+
+    def add_resource(self, uri, resource):
+        """
+        Saves a tested resource
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information after testing
+        """
+        self._write({"Resource": save_resource(uri, resource)})
+
+    def is_due(self):
+        """
+        Checks if it's time to save the progress of the run
+
+        Returns:
+            A boolean indicating if the progress is to be saved
+        """
+        return time.monotonic() - self._last_progress >= CHECKPOINT_INTERVAL
+
+    def save_progress(self, pending, counters):
+        """
+        Saves the progress of the run
+
+        Args:
+            pending: The URIs found but not tested yet
+            counters: A dictionary of the running totals
+        """
+        self._last_progress = time.monotonic()
+        self._write({"Progress": {"Time": time.time(), "Pending": pending, "Counters": counters}})
+        logger.debug("Saved a checkpoint; {} resources waiting to be tested".format(len(pending)))
+
+    def close(self):
+        """
+        Closes the checkpoint
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
@@ -19,11 +19,17 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from redfish_service_validator.request_control import RequestBudgetExhausted
 from redfish_service_validator.system_under_test import SystemUnderTest
+from redfish_service_validator import async_crawler
+from redfish_service_validator import checkpoint
+from redfish_service_validator import crawler
 from redfish_service_validator import logger
 from redfish_service_validator import metadata
 from redfish_service_validator import report
+from redfish_service_validator import result_cache
 from redfish_service_validator import schema_pack
+from redfish_service_validator import traffic_archive
 
 tool_version = "3.1.6"
 
@@ -36,11 +42,23 @@ def main():
     # Get the input arguments
     argget = argparse.ArgumentParser(description="Validate Redfish services against schemas")
     argget.add_argument(
-        "--user", "-u", "-user", "--username", type=str, required=True, help="The username for authentication"
+        "--user",
+        "-u",
+        "-user",
+        "--username",
+        type=str,
+        help="The username for authentication; required unless 'replay' is used",
+    )
+    argget.add_argument(
+        "--password", "-p", type=str, help="The password for authentication; required unless 'replay' is used"
     )
-    argget.add_argument("--password", "-p", type=str, required=True, help="The password for authentication")
     argget.add_argument(
-        "--rhost", "-r", "--ip", "-i", type=str, required=True, help="The address of the Redfish service (with scheme)"
+        "--rhost",
+        "-r",
+        "--ip",
+        "-i",
+        type=str,
+        help="The address of the Redfish service (with scheme); required unless 'replay' is used",
     )
     argget.add_argument(
         "--authtype", type=str, default="Session", choices=["Basic", "Session"], help="The authorization type"
@@ -78,17 +96,169 @@ def main():
     argget.add_argument(
         "--collectionlimit",
         type=str,
-        default=["LogEntry", "20"],
+        default=[],
         help="Applies a limit to testing resources in collections; format: RESOURCE1 COUNT1 RESOURCE2 COUNT2 ...",
         nargs="+",
     )
+    argget.add_argument(
+        "--log-recheck",
+        type=int,
+        default=5,
+        help="The number of log entries tested in previous runs to test again in each log entry collection; log "
+        "entries added since the previous run are always tested unless 'collectionlimit' is used for LogEntry; "
+        "default: 5",
+    )
+    argget.add_argument(
+        "--no-log-history",
+        action="store_true",
+        help="Don't keep the newest log entry tested in each log entry collection between runs; every run tests up to "
+        "{} of the newest entries in each log entry collection".format(crawler.LOG_ENTRY_FALLBACK_LIMIT),
+    )
     argget.add_argument("--nooemcheck", action="store_true", help="Don't check OEM items")
+    argget.add_argument(
+        "--expand",
+        action="store_true",
+        help="Use $expand to read the members of resource collections if the service supports it; the Allow header "
+        "and response time of expanded members are not checked",
+    )
     argget.add_argument(
         "--timeout",
         "-timeout",
         type=int,
         help="The timeout, in seconds, for the service to respond to HTTP requests",
     )
+    argget.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of requests to have in flight with the service at once; default: 1",
+    )
+    argget.add_argument(
+        "--sessions",
+        type=int,
+        default=1,
+        help="The number of sessions to open with the service for reading resources; use with 'workers' for services "
+        "that handle one request at a time per session; default: 1",
+    )
+    argget.add_argument(
+        "--max-rps",
+        type=float,
+        help="The maximum number of requests per second to send to the service",
+    )
+    argget.add_argument(
+        "--max-requests",
+        type=int,
+        help="The maximum number of requests to send to the service; testing stops once the limit is reached",
+    )
+    argget.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="The maximum number of times to retry reading a resource after a timeout, a connection error, or an "
+        "HTTP 429, 502, 503, or 504 response; default: 3",
+    )
+    argget.add_argument(
+        "--link-retries",
+        type=int,
+        default=1,
+        help="The maximum number of times to retry reading a resource that's only checked as the target of a "
+        "reference link; default: 1",
+    )
+    argget.add_argument(
+        "--circuit-breaker",
+        type=int,
+        default=0,
+        help="Skips the rest of a resource's subordinate resources for a cool-down period after this many timeouts or "
+        "HTTP 5xx responses in a row under it; default: 0, which never skips resources",
+    )
+    argget.add_argument(
+        "--circuit-cooldown",
+        type=int,
+        default=60,
+        help="The time, in seconds, to skip resources once the 'circuit-breaker' limit is reached; default: 60",
+    )
+    argget.add_argument(
+        "--max-duration",
+        type=int,
+        help="The time, in seconds, allowed for testing; once it runs out, requests in flight are finished, "
+        "no new resources are tested, and the reports list the resources not tested",
+    )
+    argget.add_argument(
+        "--order",
+        type=str,
+        default="DFS",
+        choices=crawler.ORDERS,
+        help="The order for visiting resources; 'DFS' follows each link as it's found, 'BFS' visits resources level "
+        "by level, 'Priority' visits resources closest to the service root first, 'Longest' visits resources that were "
+        "slowest in previous runs first, and 'Important' visits resources closest to the service root first while "
+        "leaving log entries, assemblies, and OEM resources until last; default: DFS",
+    )
+    argget.add_argument(
+        "--no-response-time-history",
+        action="store_true",
+        help="Don't keep the response time of each resource between runs; 'Longest' and 'Important' then order "
+        "resources without the response times of previous runs",
+    )
+    argget.add_argument(
+        "--include",
+        type=str,
+        nargs="+",
+        help="Only follows URIs matching one of the specified patterns, along with the resources leading to them; "
+        "patterns are regular expressions matched against the start of the URI, and '{id}' matches one segment",
+    )
+    argget.add_argument(
+        "--exclude",
+        type=str,
+        nargs="+",
+        help="Does not follow URIs matching any of the specified patterns, or anything under them; same format as "
+        "'--include'",
+    )
+    argget.add_argument(
+        "--max-depth",
+        type=int,
+        help="The maximum number of segments below the service root for URIs to follow",
+    )
+    argget.add_argument(
+        "--max-payload-bytes",
+        type=int,
+        help="The maximum size, in bytes, of a response body; larger responses are not read past the limit or tested, "
+        "and are reported with a warning",
+    )
+    argget.add_argument(
+        "--record",
+        type=str,
+        help="Records every response read from the service to the specified archive file for use with 'replay'",
+    )
+    argget.add_argument(
+        "--replay",
+        type=str,
+        help="Reads every response from the specified archive file made with 'record' instead of the service; "
+        "nothing is sent over the network",
+    )
+    argget.add_argument(
+        "--etag-cache",
+        action="store_true",
+        help="Reads resources with the ETags from the previous run and reuses the previous results for resources the "
+        "service reports as unchanged; results are not reused after the validator, the schema files, or the testing "
+        "options change",
+    )
+    argget.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Saves the progress of the run, including each payload read, to the report directory so the run can be "
+        "continued with 'resume' if it's interrupted",
+    )
+    argget.add_argument(
+        "--resume",
+        type=str,
+        help="Continues an interrupted run from the checkpoint in the specified report directory; resources tested "
+        "before the interruption are not read again, and the reports are written to the same directory",
+    )
+    argget.add_argument(
+        "--asyncio",
+        action="store_true",
+        help="Crawl the service with an asyncio event loop; requires the 'aiohttp' package",
+    )
     argget.add_argument(
         "--skipschema",
         action="store_true",
@@ -100,6 +270,14 @@ def main():
         help="Controls the verbosity of the debugging output; if not specified only INFO and higher are logged",
     )
     args = argget.parse_args()
+    if not args.replay:
+        missing = [name for name in ["user", "password", "rhost"] if getattr(args, name) is None]
+        if missing:
+            argget.error("the following arguments are required: {}".format(", ".join("--" + name for name in missing)))
+    if args.record and args.replay:
+        argget.error("'record' and 'replay' cannot be used together")
+    if args.resume and not (Path(args.resume) / checkpoint.CHECKPOINT_FILE).is_file():
+        argget.error("'{}' does not contain a checkpoint to resume".format(args.resume))
     code, file = run_validator(vars(args))
     if code != 0:
         sys.exit(code)
@@ -111,6 +289,12 @@ def run_validator(args):
         traverse_mode, starting_uri = args["payload"]
     else:
         traverse_mode, starting_uri = None, "/redfish/v1/"
+    settings = {
+        "collectionlimit": args["collectionlimit"],
+        "nooemcheck": args["nooemcheck"],
+        "log_recheck": args["log_recheck"],
+        "no_log_history": args["no_log_history"],
+    }
 
     # Set up external proxy info
     proxies = None
@@ -129,9 +313,20 @@ def run_validator(args):
     # Get the current time for report files
     test_time = datetime.now()
 
-    # Create report directory with timestamped subfolder (YYYY-MM-DD-HHMMSS)
-    report_dir = Path(args["logdir"]) / test_time.strftime("%Y-%m-%d-%H%M%S")
-    report_dir.mkdir(parents=True, exist_ok=True)
+    # Create report directory with timestamped subfolder (YYYY-MM-DD-HHMMSS); a resumed run keeps the directory and
+    # time of the run it continues
+    saved_checkpoint = None
+    checkpoint_error = None
+    if args["resume"]:
+        report_dir = Path(args["resume"])
+        try:
+            saved_checkpoint = checkpoint.load(report_dir / checkpoint.CHECKPOINT_FILE)
+            test_time = datetime.fromtimestamp(saved_checkpoint["Run"]["TestTime"])
+        except Exception as err:
+            checkpoint_error = err
+    else:
+        report_dir = Path(args["logdir"]) / test_time.strftime("%Y-%m-%d-%H%M%S")
+        report_dir.mkdir(parents=True, exist_ok=True)
 
     # Set the logging level
     log_level = logging.INFO
@@ -141,8 +336,59 @@ def run_validator(args):
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     logger.logger = redfish.redfish_logger(log_file, log_format, log_level)
     logger.log_print("Redfish Service Validator, Version {}\n".format(tool_version))
+    if checkpoint_error is not None:
+        logger.critical("Could not read the checkpoint: {}".format(checkpoint_error))
+        return 1, None
+
+    # Set up the traffic archive
+    recorder = None
+    replay = None
+    try:
+        if args["replay"]:
+            replay = traffic_archive.TrafficArchive(args["replay"])
+            args["rhost"] = args["rhost"] or replay.service
+        elif args["record"]:
+            recorder = traffic_archive.TrafficRecorder(args["record"], args["rhost"])
+    except Exception as err:
+        logger.critical("Could not open the traffic archive: {}".format(err))
+        return 1, None
+    if saved_checkpoint is not None:
+        # Continue the traversal from the interrupted run
+        run = saved_checkpoint["Run"]
+        if args["rhost"] != run["Service"]:
+            logger.critical("The checkpoint is for {}, not {}".format(run["Service"], args["rhost"]))
+            return 1, None
+        traverse_mode, starting_uri = run["Traversal"]
+        if run["Settings"] != settings:
+            logger.warning("The checkpoint was made with different testing options; the results may not match")
+    crawl_checkpoint = None
+    try:
+        if saved_checkpoint is not None:
+            # Keep saving progress so the resumed run can be resumed again
+            crawl_checkpoint = checkpoint.CrawlCheckpoint(report_dir / checkpoint.CHECKPOINT_FILE)
+        elif args["checkpoint"]:
+            run = {
+                "Service": args["rhost"],
+                "TestTime": test_time.timestamp(),
+                "Traversal": [traverse_mode, starting_uri],
+                "Settings": settings,
+            }
+            crawl_checkpoint = checkpoint.CrawlCheckpoint(report_dir / checkpoint.CHECKPOINT_FILE, run)
+    except Exception as err:
+        logger.warning("Could not create the checkpoint; the run can't be resumed if interrupted: {}".format(err))
+
+    cache = None
+    if args["etag_cache"]:
+        if recorder is not None or replay is not None:
+            # Archives hold full responses; nothing is gained from conditional requests
+            logger.info("Not using the ETag cache with 'record' or 'replay'")
+        else:
+            cache = result_cache.ResultCache(Path(args["logdir"]) / result_cache.CACHE_FILE, args["rhost"])
     logger.info("System: {}".format(args["rhost"]))
     logger.info("User: {}".format(args["user"]))
+    if args["asyncio"] and async_crawler.aiohttp is None:
+        logger.critical("The asyncio engine requires the 'aiohttp' package; install it with 'pip install aiohttp'")
+        return 1, None
 
     # Set up the system
     try:
@@ -157,36 +403,90 @@ def run_validator(args):
             args["mockup"],
             args["collectionlimit"],
             args["nooemcheck"],
+            args["expand"],
+            args["workers"],
+            args["max_rps"],
+            args["max_requests"],
+            args["retries"],
+            args["link_retries"],
+            args["sessions"],
+            args["circuit_breaker"],
+            args["circuit_cooldown"],
+            args["max_duration"],
+            None if args["no_response_time_history"] else Path(args["logdir"]) / crawler.HISTORY_FILE,
+            args["include"],
+            args["exclude"],
+            args["max_depth"],
+            args["max_payload_bytes"],
+            recorder,
+            replay,
+            cache,
+            crawl_checkpoint,
+            None if args["no_log_history"] else Path(args["logdir"]) / crawler.LOG_HISTORY_FILE,
+            args["log_recheck"],
         )
     except Exception as err:
         logger.critical("Could not set up the service: {}".format(err))
+        if recorder is not None:
+            recorder.close()
+        if crawl_checkpoint is not None:
+            crawl_checkpoint.close()
         return 1, None
 
-    # Update the schema cache
-    if not args["skipschema"]:
-        schema_pack.update_dsp8010_files(args["schema_directory"], proxies)
-        schema_pack.update_service_metadata(args["schema_directory"], sut.session, proxies)
-    else:
-        logger.log_print("Skipping schema download; using cached schemas only\n")
-
-    # Build the schema database
-    metadata.parse_schema_files(args["schema_directory"])
+    # Log out of every session when done, even if testing is interrupted
+    try:
+        # Update the schema cache
+        if not args["skipschema"]:
+            if replay is None:
+                schema_pack.update_dsp8010_files(args["schema_directory"], proxies)
+            schema_pack.update_service_metadata(args["schema_directory"], sut.session, proxies)
+        else:
+            logger.log_print("Skipping schema download; using cached schemas only\n")
 
-    # Validate the service
-    sut.validate(traverse_mode, starting_uri, starting_uri)
+        # Build the schema database
+        metadata.parse_schema_files(args["schema_directory"])
+        if cache is not None:
+            cache.start(result_cache.get_fingerprint(tool_version, args["schema_directory"], settings))
+        if saved_checkpoint is not None:
+            sut.restore_checkpoint(saved_checkpoint["Resources"])
 
-    # Results
-    logger.log_print("")
-    print_summary(sut)
-    logger.log_print("")
-    results_file = report.html_report(sut, report_dir, test_time, tool_version, args)
-    xlsx_file = report.xlsx_report(sut, report_dir, test_time, tool_version, args)
-    logger.log_print("HTML Report:  {}".format(results_file))
-    logger.log_print("Excel Report: {}".format(xlsx_file))
-    logger.log_print("Debug Log:    {}".format(log_file))
-    logger.log_print("")
+        # Validate the service
+        try:
+            if args["asyncio"] and replay is not None:
+                # Replayed responses are read from the archive; there are no requests to wait on
+                logger.info("Replaying with workers instead of the asyncio engine")
+                crawler.crawl(sut, traverse_mode, starting_uri, max(args["workers"], 1), args["order"])
+            elif args["asyncio"]:
+                async_crawler.crawl(sut, traverse_mode, starting_uri, args["workers"], args["order"])
+            elif args["workers"] > 1:
+                crawler.crawl(sut, traverse_mode, starting_uri, args["workers"], args["order"])
+            else:
+                sut.validate(traverse_mode, starting_uri, starting_uri, args["order"])
+        except RequestBudgetExhausted as err:
+            # Stop testing, but still report on everything tested so far
+            logger.critical("Stopping the test after {} requests; {}".format(sut.request_count, err))
+        if replay is None:
+            # Replayed response times are already in the history
+            sut.save_history()
+        if cache is not None:
+            cache.save()
 
-    sut.logout()
+        # Results
+        logger.log_print("")
+        print_summary(sut)
+        logger.log_print("")
+        results_file = report.html_report(sut, report_dir, test_time, tool_version, args)
+        xlsx_file = report.xlsx_report(sut, report_dir, test_time, tool_version, args)
+        logger.log_print("HTML Report:  {}".format(results_file))
+        logger.log_print("Excel Report: {}".format(xlsx_file))
+        logger.log_print("Debug Log:    {}".format(log_file))
+        logger.log_print("")
+    finally:
+        sut.logout()
+        if recorder is not None:
+            recorder.close()
+        if crawl_checkpoint is not None:
+            crawl_checkpoint.close()
 
     return int(sut.fail_count > 0), str(results_file)
 
@@ -0,0 +1,760 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Crawler
+
+File : crawler.py
+
+Brief : This file contains the definitions and functionalities for traversing
+        the service with multiple requests in flight.
+"""
+
+import functools
+import hashlib
+import heapq
+import json
+import re
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from redfish_service_validator import logger
+from redfish_service_validator import validate
+
+
+ORDERS = ["DFS", "BFS", "Priority", "Longest", "Important"]
+
+HISTORY_FILE = "ResponseTimeHistory.json"
+LOG_HISTORY_FILE = "LogEntryHistory.json"
+
+# Members of log entry collections to test when there are no entries from previous runs to compare with, or when the
+# entries can't be compared by identifier
+LOG_ENTRY_FALLBACK_LIMIT = 20
+
+# Path segments for resources that are slow to test and rarely the focus of a test run
+LOW_VALUE_SEGMENTS = ["Entries", "Assembly", "Oem"]
+
+# Identifiers in URI templates, such as "{ComputerSystemId}", match any single segment
+URI_TEMPLATE_ID_REGEX = r"\{[A-Za-z0-9]+\}"
+URI_SEGMENT_REGEX = "[^/]+"
+
+SERVICE_ROOT_DEPTH = 2  # "/redfish/v1"
+
+PERCENT_ENCODING_REGEX = r"%[0-9a-fA-F]{2}"
+
+
+def uri_depth(uri):
+    """
+    Gets the sort key for a URI for "Priority" ordering; URIs closer to the service root are visited first
+
+    Args:
+        uri: The URI to inspect
+
+    Returns:
+        The number of segments in the URI
+    """
+    return len([segment for segment in uri.split("/") if segment])
+
+
+@functools.lru_cache(maxsize=None)
+def canonical_uri(uri):
+    """
+    Gets the key for a URI so that different spellings of the same resource are only read and tested once
+
+    Design note: Percent-encoding is normalized (unreserved characters decoded, everything else encoded with
+    uppercase hex digits), repeated and trailing slashes are removed, and query parameters are sorted; an empty query
+    is dropped.  Reserved characters are left as they are since an encoded "/" is not the same as a segment boundary.
+
+    Args:
+        uri: The URI to inspect
+
+    Returns:
+        The canonical form of the URI
+    """
+    path, _, query = uri.partition("?")
+    path = re.sub("/{2,}", "/", requests.utils.requote_uri(path))
+    path = re.sub(PERCENT_ENCODING_REGEX, lambda match: match[0].upper(), path)
+    if path != "/":
+        path = path.rstrip("/")
+    params = [param for param in requests.utils.requote_uri(query).split("&") if param]
+    if not params:
+        return path
+    params = [re.sub(PERCENT_ENCODING_REGEX, lambda match: match[0].upper(), param) for param in params]
+    return "{}?{}".format(path, "&".join(sorted(params)))
+
+
+class UriFilter(object):
+    """
+    Decides which URIs found in payloads are followed during a traversal
+
+    Design note: Patterns are regular expressions, where identifiers in braces, such as "{id}", match a single
+    segment; a pattern matches a URI if it matches the start of the URI up to a segment boundary, so a pattern for a
+    resource covers everything under it.  When include patterns are given, the resources leading to an included
+    resource are also followed; this is checked one segment at a time, so it only works for patterns where each
+    segment is a regular expression on its own.
+
+    Args:
+        include: A list of patterns for URIs to follow; None or empty to follow everything not excluded
+        exclude: A list of patterns for URIs to not follow
+        max_depth: The maximum number of segments below the service root; None for no limit
+    """
+
+    def __init__(self, include=None, exclude=None, max_depth=None):
+        self._include = [self._compile(pattern) for pattern in include or []]
+        self._include_segments = [self._compile_segments(pattern) for pattern in include or []]
+        self._exclude = [self._compile(pattern) for pattern in exclude or []]
+        self._max_depth = max_depth
+
+    @staticmethod
+    def _compile(pattern):
+        """
+        Compiles a pattern for matching URIs
+
+        Args:
+            pattern: The pattern to compile
+
+        Returns:
+            The compiled regular expression
+        """
+        try:
+            return re.compile("(?:{})(?:/|$)".format(re.sub(URI_TEMPLATE_ID_REGEX, URI_SEGMENT_REGEX, pattern)))
+        except re.error as err:
+            raise ValueError("Invalid URI pattern '{}'; {}".format(pattern, err))
+
+    @staticmethod
+    def _compile_segments(pattern):
+        """
+        Compiles each segment of a pattern for finding the resources leading to an included resource
+
+        Args:
+            pattern: The pattern to compile
+
+        Returns:
+            A list of compiled regular expressions; None if the segments aren't regular expressions on their own
+        """
+        try:
+            return [
+                re.compile(re.sub(URI_TEMPLATE_ID_REGEX, URI_SEGMENT_REGEX, segment))
+                for segment in pattern.rstrip("/").split("/")
+            ]
+        except re.error:
+            return None
+
+    def allows(self, uri):
+        """
+        Checks if a URI is followed
+
+        Args:
+            uri: The URI to check
+
+        Returns:
+            A boolean indicating if the URI is followed
+        """
+        path = uri.split("?")[0]
+        if self._max_depth is not None and uri_depth(path) - SERVICE_ROOT_DEPTH > self._max_depth:
+            return False
+        if any(pattern.match(path) for pattern in self._exclude):
+            return False
+        if not self._include:
+            return True
+        if any(pattern.match(path) for pattern in self._include):
+            return True
+
+        # Follow the resources leading to an included resource
+        segments = path.rstrip("/").split("/")
+        for pattern_segments in self._include_segments:
+            if pattern_segments is None or len(segments) >= len(pattern_segments):
+                continue
+            if all(pattern_segments[i].fullmatch(segment) for i, segment in enumerate(segments)):
+                return True
+        return False
+
+
+class ResponseTimeHistory(object):
+    """
+    Keeps the response times of resources between runs so the order of a traversal can account for slow resources
+
+    Design note: Response times are kept per service and per URI template, where the member identifiers of resource
+    collections are replaced with "{id}", so a slow member type is known before any of its members are read.
+    Collections are learned from the responses of previous runs.  Each run is averaged with the stored time so the
+    history follows changes to the service without one slow run taking over.
+
+    Args:
+        path: The file holding the history; None to not keep the history between runs
+        rhost: The address of the Redfish service
+    """
+
+    def __init__(self, path=None, rhost=None):
+        self._path = path
+        self._rhost = rhost
+        self._services = {}
+        self._collections = set()
+        self._response_times = {}
+        if path is None:
+            return
+        try:
+            with open(path) as history_file:
+                history = json.load(history_file)
+            self._services = dict(history)
+            service = self._services.get(rhost, {})
+            self._collections = set(service.get("Collections", []))
+            self._response_times = dict(service.get("ResponseTimes", {}))
+        except FileNotFoundError:
+            pass
+        except Exception as err:
+            logger.warning("Could not read the response time history from {}; {}".format(path, err))
+
+    def get_template(self, uri):
+        """
+        Gets the template for a URI
+
+        Args:
+            uri: The URI to inspect
+
+        Returns:
+            The URI with the member identifiers of known resource collections replaced with "{id}"
+        """
+        segments = uri.split("?")[0].split("#")[0].rstrip("/").split("/")
+        template = segments[:1]
+        for segment in segments[1:]:
+            if "/".join(template) in self._collections:
+                template.append("{id}")
+            else:
+                template.append(segment)
+        return "/".join(template)
+
+    def get_response_time(self, uri):
+        """
+        Gets the expected response time for a URI
+
+        Args:
+            uri: The URI to inspect
+
+        Returns:
+            The response time, in milliseconds, from previous runs; the average of all templates for unknown URIs
+        """
+        response_time = self._response_times.get(self.get_template(uri))
+        if response_time is None and self._response_times:
+            response_time = sum(self._response_times.values()) / len(self._response_times)
+        return response_time or 0
+
+    def longest_first(self, uri):
+        """
+        Gets the sort key for a URI for "Longest" ordering; URIs expected to take the longest are visited first
+
+        Args:
+            uri: The URI to inspect
+
+        Returns:
+            A tuple for sorting URIs
+        """
+        return -self.get_response_time(uri), uri_depth(uri)
+
+    def most_important_first(self, uri):
+        """
+        Gets the sort key for a URI for "Important" ordering; URIs closer to the service root are visited first, and
+        the quickest URIs are visited first among those at the same depth; log entries, assemblies, and OEM resources
+        are left until last
+
+        Args:
+            uri: The URI to inspect
+
+        Returns:
+            A tuple for sorting URIs
+        """
+        low_value = any(segment in LOW_VALUE_SEGMENTS for segment in uri.split("/"))
+        return low_value, uri_depth(uri), self.get_response_time(uri)
+
+    def get_priority(self, order):
+        """
+        Gets the function for the sort key of a URI for an order
+
+        Args:
+            order: The order for visiting URIs
+
+        Returns:
+            The function for the sort key; None for the default
+        """
+        if order == "Longest":
+            return self.longest_first
+        if order == "Important":
+            return self.most_important_first
+        return None
+
+    def update(self, resources):
+        """
+        Adds the response times from a run
+
+        Args:
+            resources: The resource cache, keyed by URI
+        """
+        # Parents are inspected before children so nested collections get the right templates
+        uris = sorted(resources, key=uri_depth)
+        for uri in uris:
+            payload, _ = validate.validate_response(resources[uri])
+            if payload is not None and isinstance(payload.get("Members"), list):
+                self._collections.add(self.get_template(uri))
+
+        # Resources read from a mockup or with $expand don't have a response time of their own
+        run_times = {}
+        for uri in uris:
+            resource = resources[uri]
+            if resource["Mockup"] or resource["ResponseTime"] is None:
+                continue
+            run_times.setdefault(self.get_template(uri), []).append(resource["ResponseTime"])
+        for template, times in run_times.items():
+            response_time = sum(times) / len(times)
+            if template in self._response_times:
+                response_time = (self._response_times[template] + response_time) / 2
+            self._response_times[template] = round(response_time)
+
+    def save(self):
+        """
+        Saves the history for the next run
+        """
+        if self._path is None:
+            return
+        self._services[self._rhost] = {"Collections": sorted(self._collections), "ResponseTimes": self._response_times}
+        try:
+            with open(self._path, "w") as history_file:
+                json.dump(self._services, history_file, indent=2, sort_keys=True)
+        except Exception as err:
+            logger.warning("Could not save the response time history to {}; {}".format(self._path, err))
+
+
+class LogEntryHistory(object):
+    """
+    Keeps the newest log entry tested in each log entry collection between runs so later runs only test the entries
+    added since then, along with a few older entries
+
+    Design note: Entries are compared by their identifiers, taken from the last segment of the member URIs, so the
+    entries to test are picked from the collection without reading any of them.  This relies on the identifiers being
+    numbers assigned in increasing order; collections with other identifiers, and collections without a newest entry
+    from a previous run, are tested up to LOG_ENTRY_FALLBACK_LIMIT members from the first page, as with a collection
+    limit.  Once a collection listed newest first reaches the newest entry tested before, the later pages only hold
+    older entries and are not read.  The older entries tested again are picked with a hash of the run count, so they
+    change from run to run but are the same for a resumed run.  If a full collection only holds entries older than the
+    newest one tested, the log was cleared and is tested as if for the first time.
+
+    Args:
+        path: The file holding the history; None to not keep the history between runs
+        rhost: The address of the Redfish service
+        recheck: The number of older entries to test again in each collection
+    """
+
+    def __init__(self, path=None, rhost=None, recheck=5):
+        self._path = path
+        self._rhost = rhost
+        self._recheck = recheck
+        self._services = {}
+        self._selected = {}
+        self._lock = threading.Lock()
+        if path is None:
+            return
+        try:
+            with open(path) as history_file:
+                self._services = dict(json.load(history_file))
+        except FileNotFoundError:
+            pass
+        except Exception as err:
+            logger.warning("Could not read the log entry history from {}; {}".format(path, err))
+
+    def get_entry_id(self, uri):
+        """
+        Gets the identifier of a log entry from its URI
+
+        Args:
+            uri: The URI of the log entry
+
+        Returns:
+            The identifier as a number; None if it's not a number
+        """
+        if not isinstance(uri, str):
+            return None
+        entry_id = canonical_uri(uri).rsplit("/", 1)[-1]
+        if not entry_id.isdigit():
+            return None
+        return int(entry_id)
+
+    def select_members(self, uri, payload):
+        """
+        Picks the members of a log entry collection to test; the link to the next page is removed from the payload if
+        the later pages don't hold entries to test
+
+        Args:
+            uri: The URI of the log entry collection or one of its pages
+            payload: The payload of the log entry collection
+
+        Returns:
+            The list of members to test
+        """
+        members = payload["Members"]
+        ids = [self.get_entry_id(member.get("@odata.id")) if isinstance(member, dict) else None for member in members]
+        if None in ids:
+            payload.pop("Members@odata.nextLink", None)
+            return members[:LOG_ENTRY_FALLBACK_LIMIT]
+        if not ids:
+            return members
+        key = canonical_uri(uri.split("?")[0])
+        state = self._services.get(self._rhost, {}).get(key)
+        last_id = None
+        runs = 0
+        if state is not None:
+            last_id = state["LastId"]
+            runs = state["Runs"]
+        reset = False
+        if last_id is not None and max(ids) < last_id and "?" not in uri and "Members@odata.nextLink" not in payload:
+            logger.info("{} was cleared since the previous run; testing the newest entries".format(uri))
+            last_id = None
+            reset = True
+
+        if last_id is None:
+            # Nothing to compare with; test the newest entries on the first page
+            new_ids = sorted(ids, reverse=True)[:LOG_ENTRY_FALLBACK_LIMIT]
+            recheck_ids = []
+            payload.pop("Members@odata.nextLink", None)
+        else:
+            # Test the new entries, and a few of the old ones again
+            new_ids = [entry_id for entry_id in ids if entry_id > last_id]
+            old_ids = [entry_id for entry_id in ids if entry_id <= last_id]
+            recheck_ids = sorted(
+                old_ids,
+                key=lambda entry_id: hashlib.sha256("{}:{}".format(runs, entry_id).encode("utf-8")).hexdigest(),
+            )[: self._recheck]
+            if old_ids and ids[0] > ids[-1]:
+                # Listed newest first; the later pages only hold entries tested before
+                payload.pop("Members@odata.nextLink", None)
+        with self._lock:
+            selected = self._selected.setdefault(key, {"Reset": False, "New": set()})
+            selected["Reset"] = selected["Reset"] or reset
+            selected["New"].update(new_ids)
+        if last_id is not None:
+            logger.debug(
+                "Testing {} entries added to {} since entry {} and {} older entries".format(
+                    len(new_ids), uri, last_id, len(recheck_ids)
+                )
+            )
+        keep = set(new_ids + recheck_ids)
+        return [member for member, entry_id in zip(members, ids) if entry_id in keep]
+
+    def update(self, resources):
+        """
+        Adds the log entries tested in a run
+
+        Args:
+            resources: The resource cache, keyed by URI
+        """
+        tested = {}
+        for uri, resource in resources.items():
+            if not resource["Validated"]:
+                continue
+            key = canonical_uri(uri).rsplit("/", 1)[0]
+            entry_id = self.get_entry_id(uri)
+            if key not in self._selected or entry_id is None:
+                continue
+            payload, _ = validate.validate_response(resource)
+            if payload is None or not str(payload.get("@odata.type", "")).startswith("#LogEntry."):
+                continue
+            tested.setdefault(key, []).append(entry_id)
+
+        logs = self._services.setdefault(self._rhost, {})
+        for key, selected in self._selected.items():
+            state = logs.get(key, {"LastId": None, "Runs": 0})
+            last_id = None if selected["Reset"] else state["LastId"]
+            entry_ids = tested.get(key, [])
+            untested = selected["New"] - set(entry_ids)
+            if untested:
+                # New entries that weren't tested are left for the next run
+                entry_ids = [entry_id for entry_id in entry_ids if entry_id < min(untested)]
+            for entry_id in entry_ids:
+                if last_id is None or entry_id > last_id:
+                    last_id = entry_id
+            logs[key] = {"LastId": last_id, "Runs": state["Runs"] + 1}
+
+    def save(self):
+        """
+        Saves the history for the next run
+        """
+        if self._path is None:
+            return
+        try:
+            with open(self._path, "w") as history_file:
+                json.dump(self._services, history_file, indent=2, sort_keys=True)
+        except Exception as err:
+            logger.warning("Could not save the log entry history to {}; {}".format(self._path, err))
+
+
+class Frontier(object):
+    """
+    Holds the URIs waiting to be visited during a traversal
+
+    Design note: "DFS" visits URIs in the same order as a recursive traversal; URIs found in a resource are pushed in
+    reverse so the first one found is visited first.  The other orders only queue a URI the first time it's seen.
+
+    Args:
+        order: The order for visiting URIs; "DFS", "BFS", "Priority", "Longest", or "Important"
+        priority: A function that gets the sort key for a URI for orders other than "DFS" and "BFS"
+    """
+
+    def __init__(self, order="DFS", priority=None):
+        if order not in ORDERS:
+            raise ValueError("Unknown traversal order '{}'".format(order))
+        self._order = order
+        self._priority = priority or uri_depth
+        self._items = deque() if order == "BFS" else []
+        self._queued = set()
+        self._count = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def push(self, uris):
+        """
+        Adds URIs to the frontier
+
+        Args:
+            uris: The URIs to add, in the order they were found
+        """
+        if self._order == "DFS":
+            self._items.extend(reversed(uris))
+            return
+        for uri in uris:
+            if uri in self._queued:
+                continue
+            self._queued.add(uri)
+            if self._order == "BFS":
+                self._items.append(uri)
+            else:
+                heapq.heappush(self._items, (self._priority(uri), self._count, uri))
+                self._count += 1
+
+    def pop(self):
+        """
+        Gets the next URI to visit
+
+        Returns:
+            The URI to visit
+        """
+        if self._order == "DFS":
+            return self._items.pop()
+        if self._order == "BFS":
+            return self._items.popleft()
+        return heapq.heappop(self._items)[2]
+
+    def peek(self):
+        """
+        Gets the next URI to visit without removing it from the frontier
+
+        Returns:
+            The URI to visit, or None if the frontier is empty
+        """
+        if not self._items:
+            return None
+        if self._order == "DFS":
+            return self._items[-1]
+        if self._order == "BFS":
+            return self._items[0]
+        return self._items[0][2]
+
+    def remaining(self):
+        """
+        Gets the URIs still waiting to be visited
+
+        Returns:
+            A list of URIs in the order they would be visited
+        """
+        if self._order == "DFS":
+            return list(reversed(self._items))
+        if self._order == "BFS":
+            return list(self._items)
+        return [item[2] for item in sorted(self._items)]
+
+
+class CrawlScheduler(object):
+    """
+    Tracks the state of a traversal where resources are fetched ahead of being validated
+
+    Design note: When a response arrives, the links in its payload are queued for fetching right away.  The resource
+    is then held back from validation until those links are cached so that reference link checks during validation
+    do not go back to the service one request at a time.
+
+    Args:
+        sut: The system under test
+        mode: The traversal mode for the service
+        start_uri: The starting URI for validation
+        order: The order for fetching URIs
+    """
+
+    def __init__(self, sut, mode, start_uri, order="DFS"):
+        self._sut = sut
+        self._mode = mode
+        self._start_uri = start_uri
+        self._frontier = Frontier(order, sut.history.get_priority(order))
+        self._frontier.push([sut.get_uri_spelling(start_uri)])
+        self._discovery_order = {sut.get_uri_spelling(start_uri): 0}
+        self._fetched = set()
+        self._blocked = {}
+        self._waiters = {}
+        self._ready = []
+
+    def has_frontier(self):
+        """
+        Checks if there are URIs waiting to be fetched
+
+        Returns:
+            A boolean indicating if there are URIs to fetch
+        """
+        return len(self._frontier) > 0
+
+    def has_ready(self):
+        """
+        Checks if there are resources ready to be validated
+
+        Returns:
+            A boolean indicating if there are resources to validate
+        """
+        return len(self._ready) > 0
+
+    def next_uri(self):
+        """
+        Gets the next URI to fetch
+
+        Returns:
+            The URI to fetch
+        """
+        return self._frontier.pop()
+
+    def next_ready(self):
+        """
+        Gets the next resource to validate; resources are handed out in the order they were discovered
+
+        Returns:
+            The URI of the resource to validate
+        """
+        return heapq.heappop(self._ready)[1]
+
+    def remaining(self):
+        """
+        Gets the URIs that were found but not validated
+
+        Returns:
+            A list of URIs; resources already fetched come first, in the order they were discovered
+        """
+        fetched = sorted(
+            [item[1] for item in self._ready] + list(self._blocked), key=lambda uri: self._discovery_order[uri]
+        )
+        return fetched + self._frontier.remaining()
+
+    def add_response(self, uri):
+        """
+        Processes a resource after its response has been cached
+
+        Args:
+            uri: The URI of the resource
+        """
+        self._fetched.add(uri)
+
+        # Queue up the links from the payload and hold validation until they're cached
+        pending = set()
+        new_uris = []
+        payload, _ = validate.validate_response(self._sut.get_resource(uri))
+        if payload is not None:
+            self._sut.apply_collection_limits(payload, uri)
+            for next_uri in self._sut.find_next_uris(self._mode, self._start_uri, payload):
+                if next_uri not in self._discovery_order:
+                    self._discovery_order[next_uri] = len(self._discovery_order)
+                    new_uris.append(next_uri)
+                if next_uri not in self._fetched:
+                    pending.add(next_uri)
+                    self._waiters.setdefault(next_uri, set()).add(uri)
+        self._frontier.push(new_uris)
+        if pending:
+            self._blocked[uri] = pending
+        else:
+            heapq.heappush(self._ready, (self._discovery_order[uri], uri))
+
+        # Release any resources that were waiting on this response
+        for waiter in self._waiters.pop(uri, set()):
+            self._blocked[waiter].discard(uri)
+            if not self._blocked[waiter]:
+                del self._blocked[waiter]
+                heapq.heappush(self._ready, (self._discovery_order[waiter], waiter))
+
+
+def read_resource(sut, uri):
+    """
+    Reads a resource and adds it to the resource cache, along with the members of a resource collection
+
+    Args:
+        sut: The system under test
+        uri: The URI to read
+
+    Returns:
+        The URI that was read
+    """
+    sut.get_resource(uri)
+    sut.expand_collection(uri)
+    return uri
+
+
+def crawl(sut, mode, start_uri, workers, order="DFS"):
+    """
+    Performs validation of the service with a pool of workers fetching resources
+
+    Design note: Workers only perform the HTTP requests; validation and result tracking stay on the calling thread so
+    the results and counters are built the same way as a serial traversal
+
+    Args:
+        sut: The system under test
+        mode: The traversal mode for the service
+        start_uri: The starting URI for validation
+        workers: The maximum number of requests to have in flight
+        order: The order for fetching URIs
+    """
+    logger.info("Crawling the service with {} workers".format(workers))
+    scheduler = CrawlScheduler(sut, mode, start_uri, order)
+    in_flight = {}
+
+    def pending():
+        return scheduler.remaining() + list(in_flight.values())
+
+    def collect(future):
+        # A failed read raises here, on the calling thread, as it would in a serial traversal
+        uri = future.result()
+        del in_flight[future]
+        scheduler.add_response(uri)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while scheduler.has_frontier() or in_flight or scheduler.has_ready():
+                if sut.time_is_up():
+                    # Finish the requests in flight, but don't start anything new
+                    wait(in_flight)
+                    for future in list(in_flight):
+                        collect(future)
+                    sut.set_unvisited(scheduler.remaining())
+                    break
+
+                # Keep the pool busy without queueing more requests than there are workers
+                while scheduler.has_frontier() and len(in_flight) < workers:
+                    uri = scheduler.next_uri()
+                    in_flight[executor.submit(read_resource, sut, uri)] = uri
+
+                # Collect responses; only wait for one if there's nothing ready to validate
+                if in_flight:
+                    done, _ = wait(
+                        in_flight, timeout=0 if scheduler.has_ready() else None, return_when=FIRST_COMPLETED
+                    )
+                    for future in done:
+                        collect(future)
+
+                # Validate one resource at a time so the pool is refilled between each
+                if scheduler.has_ready():
+                    sut.validate_resource(mode, start_uri, scheduler.next_ready())
+                    sut.save_progress(pending)
+        finally:
+            sut.save_progress(pending, force=True)
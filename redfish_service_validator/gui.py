@@ -336,7 +336,34 @@ class RSVGui:
 
         # Launch the validator
         try:
-            args = {"collectionlimit": ["LogEntry", "20"], "timeout": None}
+            args = {
+                "collectionlimit": [],
+                "log_recheck": 5,
+                "no_log_history": False,
+                "timeout": None,
+                "workers": 1,
+                "asyncio": False,
+                "order": "DFS",
+                "no_response_time_history": False,
+                "expand": False,
+                "max_rps": None,
+                "max_requests": None,
+                "retries": 3,
+                "link_retries": 1,
+                "sessions": 1,
+                "circuit_breaker": 0,
+                "circuit_cooldown": 60,
+                "max_duration": None,
+                "include": None,
+                "exclude": None,
+                "max_depth": None,
+                "max_payload_bytes": None,
+                "record": None,
+                "replay": None,
+                "etag_cache": False,
+                "checkpoint": False,
+                "resume": None,
+            }
             for section in self.config:
                 for option in self.config[section]:
                     if self.config[section][option]["value"] == "":
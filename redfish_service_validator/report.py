@@ -168,8 +168,27 @@ _RSV_EXTRA_JS = r"""
 html_template = None
 
 
+def format_bytes(count):
+    """
+    Formats a number of bytes for display.
+
+    Args:
+        count: The number of bytes
+
+    Returns:
+        The number of bytes as a string with units
+    """
+    if count is None:
+        return "-"
+    for unit in ["B", "KB", "MB"]:
+        if count < 1024:
+            return "{:.0f} {}".format(count, unit) if unit == "B" else "{:.1f} {}".format(count, unit)
+        count /= 1024
+    return "{:.1f} GB".format(count)
+
+
 def build_resource_header(
-    uri, resource_type, uri_summary, payload_id, results_id, status_code=None, response_time=None
+    uri, resource_type, uri_summary, payload_id, results_id, status_code=None, response_time=None, transfer=None
 ):
     """Builds the enterprise-styled resource card header row."""
     # Status code badge
@@ -183,6 +202,12 @@ def build_resource_header(
     time_badge = '<span class="badge badge-time">&#128336; {} ms</span>'.format(
         response_time if response_time is not None else "-"
     )
+    # Bytes received badge; the uncompressed size is shown when the response was compressed
+    if transfer is not None and transfer.get("BytesReceived") is not None:
+        size = format_bytes(transfer["BytesReceived"])
+        if transfer["BytesUncompressed"] != transfer["BytesReceived"]:
+            size += " ({} uncompressed)".format(format_bytes(transfer["BytesUncompressed"]))
+        time_badge += ' <span class="badge badge-time">&#8681; {}</span>'.format(size)
     return """
   <div class="resource-card">
     <div class="resource-header">
@@ -250,6 +275,31 @@ def build_not_tested_section(sut, uris):
     return ""
 
 
+def build_unvisited_section(uris):
+    """
+    Creates the list of resources not tested because testing stopped at the time limit.
+
+    Args:
+        uris: The URIs of the resources not tested
+
+    Returns:
+        The HTML string to insert after the resource results
+    """
+    if not uris:
+        return ""
+    rows = ""
+    for uri in uris:
+        rows += "<tr><td>{}</td></tr>".format(html_mod.escape(uri))
+    return (
+        '<div class="section-heading" style="margin-top:24px">Resources Not Visited'
+        '<span class="sh-count">{}</span></div>'
+        '<table class="prop-table">'
+        "<tr><th>URI (testing stopped at the time limit)</th></tr>"
+        "{}"
+        "</table>"
+    ).format(len(uris), rows)
+
+
 def build_error_tally(error_classes, panel_title=None):
     """
     Creates a table of error/warning type counts.
@@ -276,6 +326,125 @@ def build_error_tally(error_classes, panel_title=None):
     ).format(heading, rows)
 
 
+def build_concurrency_tally(history, panel_title=None):
+    """
+    Creates a table of the changes made to the number of requests allowed in flight with the service.
+
+    Args:
+        history: A list of the changes made to the concurrency limit
+        panel_title: Optional heading for the tally panel
+
+    Returns:
+        The HTML string to insert in the results summary
+    """
+    if not history:
+        return ""
+    rows = ""
+    for change in history:
+        rows += "<tr><td>{}s: {}</td><td>{}</td></tr>".format(
+            change["Time"], html_mod.escape(change["Reason"]), change["Limit"]
+        )
+    heading = "<h3>{}</h3>".format(html_mod.escape(panel_title)) if panel_title else ""
+    return (
+        '<div class="tally-panel">{}'
+        '<table class="tally-table">'
+        '<tr><th>Change</th><th style="text-align:right;width:80px">Limit</th></tr>'
+        "{}"
+        "</table></div>"
+    ).format(heading, rows)
+
+
+def build_retry_tally(retry_counts, panel_title=None):
+    """
+    Creates a table of the number of retries performed for each reason.
+
+    Args:
+        retry_counts: A dictionary of the number of retries for each reason
+        panel_title: Optional heading for the tally panel
+
+    Returns:
+        The HTML string to insert in the results summary
+    """
+    if not retry_counts:
+        return ""
+    rows = ""
+    for reason in sorted(retry_counts.keys()):
+        rows += "<tr><td>{}</td><td>{}</td></tr>".format(html_mod.escape(reason), retry_counts[reason])
+    heading = "<h3>{}</h3>".format(html_mod.escape(panel_title)) if panel_title else ""
+    return (
+        '<div class="tally-panel">{}'
+        '<table class="tally-table">'
+        '<tr><th>Reason</th><th style="text-align:right;width:80px">Retries</th></tr>'
+        "{}"
+        "</table></div>"
+    ).format(heading, rows)
+
+
+def build_session_tally(sut, panel_title=None):
+    """
+    Creates a table of the sessions used with the service and the time lost to expired sessions.
+
+    Args:
+        sut: The system under test
+        panel_title: Optional heading for the tally panel
+
+    Returns:
+        The HTML string to insert in the results summary
+    """
+    if sut.session_count <= 1 and not sut.reauth_count:
+        return ""
+    rows = "<tr><td>Sessions</td><td>{}</td></tr>".format(sut.session_count)
+    rows += "<tr><td>Re-authentications</td><td>{}</td></tr>".format(sut.reauth_count)
+    rows += "<tr><td>Time lost to expired sessions (s)</td><td>{:.1f}</td></tr>".format(sut.reauth_time)
+    heading = "<h3>{}</h3>".format(html_mod.escape(panel_title)) if panel_title else ""
+    return (
+        '<div class="tally-panel">{}'
+        '<table class="tally-table">'
+        '<tr><th>Metric</th><th style="text-align:right;width:80px">Value</th></tr>'
+        "{}"
+        "</table></div>"
+    ).format(heading, rows)
+
+
+def build_transfer_tally(sut, panel_title=None):
+    """
+    Creates a table of the bytes received from the service for each resource type, largest first.
+
+    Args:
+        sut: The system under test
+        panel_title: Optional heading for the tally panel
+
+    Returns:
+        The HTML string to insert in the results summary
+    """
+    transfer = sut.transfer
+    if not transfer["BytesReceived"]:
+        return ""
+    rows = "<tr><td>All requests (sent: {})</td><td>{}</td><td>{}</td></tr>".format(
+        format_bytes(transfer["BytesSent"]),
+        format_bytes(transfer["BytesReceived"]),
+        format_bytes(transfer["BytesUncompressed"]),
+    )
+    transfer_by_type = sut.transfer_by_type
+    for resource_type in sorted(transfer_by_type, key=lambda name: -transfer_by_type[name]["BytesReceived"]):
+        totals = transfer_by_type[resource_type]
+        rows += "<tr><td>{} ({})</td><td>{}</td><td>{}</td></tr>".format(
+            html_mod.escape(resource_type),
+            totals["Resources"],
+            format_bytes(totals["BytesReceived"]),
+            format_bytes(totals["BytesUncompressed"]),
+        )
+    heading = "<h3>{}</h3>".format(html_mod.escape(panel_title)) if panel_title else ""
+    return (
+        '<div class="tally-panel">{}'
+        '<table class="tally-table">'
+        '<tr><th>Type (resources)</th><th style="text-align:right;width:80px">Received</th>'
+        '<th style="text-align:right;width:80px">Uncompressed</th></tr>'
+        "{}"
+        "</table></div>"
+    ).format(heading, rows)
+
+
 def html_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None):
     """
     Creates the HTML report for the system under test
@@ -296,8 +465,14 @@ def html_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
     # Build the error summary details — combined side-by-side panel
     error_tally = build_error_tally(sut._error_classes, "Failure Types")
     warning_tally = build_error_tally(sut._warning_classes, "Warning Types")
-    if error_tally or warning_tally:
-        combined_tally = '<div class="tally-two-col">{}{}</div>'.format(error_tally, warning_tally)
+    concurrency_tally = build_concurrency_tally(sut.concurrency_history, "Concurrency")
+    retry_tally = build_retry_tally(sut.retry_counts, "Retries")
+    session_tally = build_session_tally(sut, "Sessions")
+    transfer_tally = build_transfer_tally(sut, "Bandwidth")
+    if error_tally or warning_tally or concurrency_tally or retry_tally or session_tally or transfer_tally:
+        combined_tally = '<div class="tally-two-col">{}{}{}{}{}{}</div>'.format(
+            error_tally, warning_tally, concurrency_tally, retry_tally, session_tally, transfer_tally
+        )
     else:
         combined_tally = ""
 
@@ -329,18 +504,25 @@ def html_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
             uri_summary += ' <span class="badge badge-fail">&#10007; Fail: {}</span>'.format(
                 sut._resources[uri]["Fail"]
             )
+        if sut._resources[uri].get("Retries"):
+            uri_summary += ' <span class="badge badge-warn">&#8635; Retries: {}</span>'.format(
+                sut._resources[uri]["Retries"]
+            )
+        if sut._resources[uri].get("Unchanged"):
+            uri_summary += ' <span class="badge badge-skip">&#8634; Unchanged; results from previous run</span>'
 
         # Insert the URI results header
         results_id = "results{}".format(index)
         payload_id = "payload{}".format(index)
         html += build_resource_header(
-            uri,
+            sut._resources[uri]["Uri"] or uri,
             resource_type,
             uri_summary,
             payload_id,
             results_id,
             status_code=sut._resources[uri].get("StatusCode"),
             response_time=sut._resources[uri].get("ResponseTime"),
+            transfer=sut._resources[uri],
         )
 
         # Insert the URI results details
@@ -398,6 +580,8 @@ def html_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
         "username",
         "verbose",
         "collectionlimit",
+        "log_recheck",
+        "no_log_history",
         "configuri",
         "ext_http_proxy",
         "forceauth",
@@ -408,6 +592,28 @@ def html_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
         "serv_https_proxy",
         "uricheck",
         "usessl",
+        "workers",
+        "asyncio",
+        "order",
+        "no_response_time_history",
+        "expand",
+        "max_rps",
+        "max_requests",
+        "retries",
+        "link_retries",
+        "sessions",
+        "circuit_breaker",
+        "circuit_cooldown",
+        "max_duration",
+        "include",
+        "exclude",
+        "max_depth",
+        "max_payload_bytes",
+        "record",
+        "replay",
+        "etag_cache",
+        "checkpoint",
+        "resume",
     ]
     config_rows_html = ""
     if args:
@@ -428,7 +634,8 @@ def html_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
     main_content = (
         '<div id="resourceList">{}</div>'
         '<div class="filter-no-match" id="filterNoMatch">No resources match your filter.</div>'
-    ).format(html)
+        "{}"
+    ).format(html, build_unvisited_section(sut.unvisited))
     main_prefix = (
         '<div class="section-heading">Resources Validated' '<span class="sh-count" id="totalCount"></span></div>'
     )
@@ -550,12 +757,31 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
         ("Fail", sut.fail_count),
         ("Not Tested", sut.skip_count),
     ]
+    if sut.unvisited:
+        summary_rows.append(("Not Visited", len(sut.unvisited)))
+    if sut.unchanged_count:
+        summary_rows.append(("Unchanged Resources", sut.unchanged_count))
+    if sut.reauth_count:
+        summary_rows += [
+            (None, None),
+            ("Re-authentications", sut.reauth_count),
+            ("Time Lost (s)", round(sut.reauth_time, 1)),
+        ]
+    transfer = sut.transfer
+    if transfer["BytesReceived"]:
+        summary_rows += [
+            (None, None),
+            ("Bytes Sent", transfer["BytesSent"]),
+            ("Bytes Received", transfer["BytesReceived"]),
+            ("Bytes Uncompressed", transfer["BytesUncompressed"]),
+        ]
 
     result_colors = {
         "Pass": (C_PASS_BG, C_PASS_FG),
         "Warning": (C_WARN_BG, C_WARN_FG),
         "Fail": (C_FAIL_BG, C_FAIL_FG),
         "Not Tested": (C_SKIP_BG, C_SKIP_FG),
+        "Not Visited": (C_SKIP_BG, C_SKIP_FG),
     }
 
     ws_summary.merge_cells("A1:B1")
@@ -604,6 +830,8 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
             "username",
             "verbose",
             "collectionlimit",
+            "log_recheck",
+            "no_log_history",
             "configuri",
             "ext_http_proxy",
             "forceauth",
@@ -614,9 +842,31 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
             "serv_https_proxy",
             "uricheck",
             "usessl",
+            "workers",
+            "asyncio",
+            "order",
+            "no_response_time_history",
+            "expand",
+            "max_rps",
+            "max_requests",
+            "retries",
+            "link_retries",
+            "sessions",
+            "circuit_breaker",
+            "circuit_cooldown",
+            "max_duration",
+            "include",
+            "exclude",
+            "max_depth",
+            "max_payload_bytes",
+            "record",
+            "replay",
+            "etag_cache",
+            "checkpoint",
+            "resume",
         ]
         # Blank separator row
-        cfg_start = len([r for r in summary_rows if r[0] is not None]) + 3
+        cfg_start = len(summary_rows) + 2
         ws_summary.merge_cells("A{}:B{}".format(cfg_start, cfg_start))
         cfg_hdr = ws_summary["A{}".format(cfg_start)]
         cfg_hdr.value = "Configuration"
@@ -650,8 +900,8 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
     # ════════════════════════════════════════════════════════════════════
     ws = wb.create_sheet(title="Results")
 
-    # Column widths: S#, URI, HTTP Status, Response Time (ms), Resource Type, Property, Value, Result, Message
-    col_widths = [6, 55, 14, 18, 30, 35, 50, 12, 60]
+    # Column widths: S#, URI, HTTP Status, Response Time (ms), Retries, Resource Type, Property, Value, Result, Message
+    col_widths = [6, 55, 14, 18, 10, 30, 35, 50, 12, 60]
     for ci, w in enumerate(col_widths, start=1):
         ws.column_dimensions[get_column_letter(ci)].width = w
 
@@ -659,7 +909,18 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
     _write_header(
         ws,
         1,
-        ["S#", "URI", "HTTP Status", "Response Time (ms)", "Resource Type", "Property", "Value", "Result", "Message"],
+        [
+            "S#",
+            "URI",
+            "HTTP Status",
+            "Response Time (ms)",
+            "Retries",
+            "Resource Type",
+            "Property",
+            "Value",
+            "Result",
+            "Message",
+        ],
     )
     ws.row_dimensions[1].height = 18
     ws.freeze_panes = "A2"
@@ -710,14 +971,15 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
             status_code = resource.get("StatusCode")
             resp_time = resource.get("ResponseTime")
             sn_cell = ws.cell(row=row_num, column=1, value=serial_num)
-            uri_cell = ws.cell(row=row_num, column=2, value=uri)
+            uri_cell = ws.cell(row=row_num, column=2, value=resource["Uri"] or uri)
             sc_cell = ws.cell(row=row_num, column=3, value=status_code if status_code is not None else "")
             rt_cell = ws.cell(row=row_num, column=4, value=resp_time if resp_time is not None else "")
-            rtype_cell = ws.cell(row=row_num, column=5, value=rtype)
-            prop_cell = ws.cell(row=row_num, column=6, value=prop_name)
-            val_cell = ws.cell(row=row_num, column=7, value=val_str)
-            res_cell = ws.cell(row=row_num, column=8, value=result)
-            msg_cell = ws.cell(row=row_num, column=9, value=message)
+            retry_cell = ws.cell(row=row_num, column=5, value=resource.get("Retries", 0))
+            rtype_cell = ws.cell(row=row_num, column=6, value=rtype)
+            prop_cell = ws.cell(row=row_num, column=7, value=prop_name)
+            val_cell = ws.cell(row=row_num, column=8, value=val_str)
+            res_cell = ws.cell(row=row_num, column=9, value=result)
+            msg_cell = ws.cell(row=row_num, column=10, value=message)
 
             # S# cell
             sn_cell.fill = _fill("C7D9F1" if not first_row else C_URI_BG)
@@ -757,6 +1019,12 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
             rt_cell.alignment = _data()
             rt_cell.border = _border()
 
+            # Retries cell — amber tint if the response needed retries
+            retry_cell.fill = _fill(C_WARN_BG) if resource.get("Retries") else _fill("FFFFFF")
+            retry_cell.font = _font(color=C_WARN_FG) if resource.get("Retries") else _font()
+            retry_cell.alignment = _data()
+            retry_cell.border = _border()
+
             # Result cell colouring
             fill, font = result_fill.get(result, (_fill("FFFFFF"), _font()))
             res_cell.fill = fill
@@ -769,7 +1037,89 @@ def xlsx_report(sut: SystemUnderTest, report_dir, time, tool_version, args=None)
             row_num += 1
 
     # Auto-filter on header row
-    ws.auto_filter.ref = "A1:{}1".format(get_column_letter(9))
+    ws.auto_filter.ref = "A1:{}1".format(get_column_letter(10))
+
+    # ════════════════════════════════════════════════════════════════════
+    # Sheet 3 — Concurrency
+    # ════════════════════════════════════════════════════════════════════
+    history = sut.concurrency_history
+    if history:
+        ws_conc = wb.create_sheet(title="Concurrency")
+        ws_conc.sheet_view.showGridLines = False
+        for ci, w in enumerate([12, 10, 60], start=1):
+            ws_conc.column_dimensions[get_column_letter(ci)].width = w
+        _write_header(ws_conc, 1, ["Time (s)", "Limit", "Reason"])
+        ws_conc.freeze_panes = "A2"
+        for r_idx, change in enumerate(history, start=2):
+            for c_idx, value in enumerate([change["Time"], change["Limit"], change["Reason"]], start=1):
+                cell = ws_conc.cell(row=r_idx, column=c_idx, value=value)
+                cell.alignment = _data() if c_idx < 3 else _left()
+                cell.border = _border()
+
+    # ════════════════════════════════════════════════════════════════════
+    # Sheet 4 — Bandwidth
+    # ════════════════════════════════════════════════════════════════════
+    if transfer["BytesReceived"]:
+        ws_bw = wb.create_sheet(title="Bandwidth")
+        ws_bw.sheet_view.showGridLines = False
+        for ci, w in enumerate([55, 30, 14, 16, 20], start=1):
+            ws_bw.column_dimensions[get_column_letter(ci)].width = w
+        _write_header(ws_bw, 1, ["URI", "Resource Type", "Bytes Sent", "Bytes Received", "Bytes Uncompressed"])
+        ws_bw.freeze_panes = "A2"
+
+        # Resource types first, then each URI, largest first
+        bw_rows = []
+        transfer_by_type = sut.transfer_by_type
+        for resource_type in sorted(transfer_by_type, key=lambda name: -transfer_by_type[name]["BytesReceived"]):
+            totals = transfer_by_type[resource_type]
+            bw_rows.append(
+                (
+                    "All {} resources ({})".format(resource_type, totals["Resources"]),
+                    resource_type,
+                    totals["BytesSent"],
+                    totals["BytesReceived"],
+                    totals["BytesUncompressed"],
+                )
+            )
+        bw_type_count = len(bw_rows)
+        measured = [resource for resource in sut._resources.values() if resource["BytesReceived"] is not None]
+        for resource in sorted(measured, key=lambda resource: -resource["BytesReceived"]):
+            try:
+                rtype = resource["Response"].dict["@odata.type"][1:].split(".")[0]
+            except Exception:
+                rtype = "Unknown"
+            bw_rows.append(
+                (
+                    resource["Uri"],
+                    rtype,
+                    resource["BytesSent"],
+                    resource["BytesReceived"],
+                    resource["BytesUncompressed"],
+                )
+            )
+        for r_idx, row in enumerate(bw_rows, start=2):
+            for c_idx, value in enumerate(row, start=1):
+                cell = ws_bw.cell(row=r_idx, column=c_idx, value=value)
+                cell.alignment = _left() if c_idx < 3 else _data()
+                cell.border = _border()
+                if r_idx - 2 < bw_type_count:
+                    cell.fill = _fill(C_URI_BG)
+                    cell.font = _font(bold=True, color="0D1B2A")
+        ws_bw.auto_filter.ref = "A1:{}1".format(get_column_letter(5))
+
+    # ════════════════════════════════════════════════════════════════════
+    # Sheet 5 — Not Visited
+    # ════════════════════════════════════════════════════════════════════
+    if sut.unvisited:
+        ws_unvisited = wb.create_sheet(title="Not Visited")
+        ws_unvisited.sheet_view.showGridLines = False
+        ws_unvisited.column_dimensions["A"].width = 80
+        _write_header(ws_unvisited, 1, ["URI (testing stopped at the time limit)"])
+        ws_unvisited.freeze_panes = "A2"
+        for r_idx, uri in enumerate(sut.unvisited, start=2):
+            cell = ws_unvisited.cell(row=r_idx, column=1, value=uri)
+            cell.alignment = _left()
+            cell.border = _border()
 
     wb.save(str(xlsx_file))
     return xlsx_file
@@ -0,0 +1,568 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Request Control
+
+File : request_control.py
+
+Brief : This file contains the definitions and functionalities for
+        controlling how requests are sent to the service.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import redfish
+import requests
+
+from redfish_service_validator import logger
+
+MULTIPLICATIVE_DECREASE = 0.5  # Factor applied to the concurrency limit when the service shows signs of overload
+LATENCY_SPIKE_FACTOR = 3  # A response this many times slower than typical is treated as a sign of overload
+LATENCY_SMOOTHING = 0.1  # Weight of a new response time in the typical response time
+LATENCY_SAMPLES = 5  # Number of response times needed before checking for latency spikes
+
+# Conditions to retry and the most retries allowed for each; None allows as many as the kind of request allows
+RETRY_STATUSES = {429: None, 502: 2, 503: None, 504: 2}
+RETRY_ERRORS = {"Timeout": 2, "Connection error": None}
+RETRY_BASE_DELAY = 1.0  # Delay, in seconds, before the first retry; doubled for each retry after
+RETRY_MAX_DELAY = 30.0  # Longest delay, in seconds, between retries, including delays requested with Retry-After
+
+CIRCUIT_ERRORS = ["Timeout", "Connection error"]  # Kinds of request errors that count against a circuit breaker
+
+
+class ConcurrencyController(object):
+    """
+    Controls the number of requests in flight with the service using additive increase, multiplicative decrease
+
+    Design note: The limit starts at one request and grows by one for each full window of responses whose latency
+    stays near the typical response time.  It's cut in half on HTTP 503, a Retry-After header, a request error, or a
+    latency spike; further cuts are held off until the requests that were in flight at the time of the cut complete,
+    which is told from the response time of each request, or from the number of responses for requests that failed.
+
+    Args:
+        maximum: The maximum number of requests to have in flight
+    """
+
+    def __init__(self, maximum):
+        self._maximum = max(1, maximum)
+        self._limit = 1.0
+        self._in_flight = 0
+        self._typical_time = None
+        self._samples = 0
+        self._hold_off = 0
+        self._last_cut = float("-inf")
+        self._start = time.time()
+        self._history = []
+        self._listeners = []
+        self._condition = threading.Condition()
+        if self._maximum > 1:
+            self._record("Initial limit")
+
+    @property
+    def maximum(self):
+        """
+        Accesses the maximum number of requests to have in flight
+
+        Returns:
+            The maximum number of requests
+        """
+        return self._maximum
+
+    @property
+    def limit(self):
+        """
+        Accesses the current number of requests allowed in flight
+
+        Returns:
+            The current limit
+        """
+        return int(self._limit)
+
+    @property
+    def history(self):
+        """
+        Accesses the changes made to the limit
+
+        Returns:
+            A list of dictionaries with the time of the change, in seconds, the new limit, and the reason
+        """
+        with self._condition:
+            return list(self._history)
+
+    def acquire(self):
+        """
+        Waits until another request is allowed in flight
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def try_acquire(self):
+        """
+        Claims a slot for a request if another request is allowed in flight
+
+        Returns:
+            A boolean indicating if the slot was claimed
+        """
+        with self._condition:
+            if self._in_flight >= int(self._limit):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, response_time=None, status=None, retry_after=None, error=None):
+        """
+        Releases the slot for a request and adjusts the limit based on the outcome
+
+        Args:
+            response_time: The time, in milliseconds, for the service to respond
+            status: The HTTP status of the response
+            retry_after: The Retry-After header of the response
+            error: The exception raised for the request
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._update(response_time, status, retry_after, error)
+            self._condition.notify_all()
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+
+    def add_listener(self, listener):
+        """
+        Adds a function to call, from the releasing thread, each time a slot is released
+
+        Args:
+            listener: The function to call; it takes no arguments
+        """
+        with self._condition:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Removes a function added with add_listener
+
+        Args:
+            listener: The function to remove
+        """
+        with self._condition:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _update(self, response_time, status, retry_after, error):
+        """
+        Adjusts the limit based on the outcome of a request
+
+        Args:
+            response_time: The time, in milliseconds, for the service to respond
+            status: The HTTP status of the response
+            retry_after: The Retry-After header of the response
+            error: The exception raised for the request
+        """
+        reason = None
+        if error is not None:
+            reason = "Request error: {}".format(type(error).__name__)
+        elif status == 503:
+            reason = "HTTP 503"
+        elif retry_after:
+            reason = "Retry-After: {}".format(retry_after)
+        elif response_time is not None:
+            if self._samples >= LATENCY_SAMPLES and response_time > LATENCY_SPIKE_FACTOR * self._typical_time:
+                reason = "Latency spike: {} ms, typical {} ms".format(response_time, round(self._typical_time))
+            # Spikes count toward the typical time too so a lasting change in latency becomes the new typical
+            if self._typical_time is None:
+                self._typical_time = float(response_time)
+            else:
+                self._typical_time += LATENCY_SMOOTHING * (response_time - self._typical_time)
+            self._samples += 1
+
+        if self._hold_off > 0:
+            self._hold_off -= 1
+        # Cut once per window; responses to requests sent before the cut are expected to look the same
+        if response_time is not None:
+            in_window = time.monotonic() - response_time / 1000 < self._last_cut
+        else:
+            in_window = self._hold_off > 0
+        if in_window:
+            return
+        if reason is not None and self._maximum > 1:
+            previous = int(self._limit)
+            self._limit = max(1.0, self._limit * MULTIPLICATIVE_DECREASE)
+            self._hold_off = previous
+            self._last_cut = time.monotonic()
+            if int(self._limit) != previous:
+                self._record(reason)
+        elif response_time is not None and self._limit < self._maximum:
+            previous = int(self._limit)
+            self._limit = min(float(self._maximum), self._limit + 1.0 / int(self._limit))
+            if int(self._limit) != previous:
+                self._record("Stable latency")
+
+    def _record(self, reason):
+        """
+        Records a change to the limit
+
+        Args:
+            reason: The reason for the change
+        """
+        entry = {"Time": round(time.time() - self._start, 1), "Limit": int(self._limit), "Reason": reason}
+        self._history.append(entry)
+        logger.debug("Concurrency limit set to {} at {}s; {}".format(entry["Limit"], entry["Time"], reason))
+
+
+class RequestBudgetExhausted(Exception):
+    """
+    Raised when the tool has sent as many requests to the service as it's allowed
+    """
+
+    pass
+
+
+class RequestBudget(object):
+    """
+    Limits the rate and total number of requests sent to the service
+
+    Design note: The rate is enforced with a token bucket that holds a single token, so requests are spaced evenly and
+    the service never sees a burst above the rate.  Callers reserve a token and then wait out the delay themselves so
+    the same budget can be shared by threads and the asyncio engine.
+
+    Args:
+        max_rps: The maximum number of requests per second; None for no limit
+        max_requests: The maximum number of requests in total; None for no limit
+    """
+
+    def __init__(self, max_rps=None, max_requests=None):
+        self._rate = max_rps
+        self._tokens = 1.0
+        self._last = time.monotonic()
+        self._max_requests = max_requests
+        self._count = 0
+        self._exhausted = False
+        self._lock = threading.Lock()
+
+    @property
+    def count(self):
+        """
+        Accesses the number of requests sent
+
+        Returns:
+            The number of requests
+        """
+        return self._count
+
+    @property
+    def exhausted(self):
+        """
+        Accesses whether or not the request budget ran out
+
+        Returns:
+            A boolean indicating if a request was refused
+        """
+        return self._exhausted
+
+    def reserve(self):
+        """
+        Reserves a token for a request
+
+        Returns:
+            The time, in seconds, to wait before sending the request
+        """
+        with self._lock:
+            if self._max_requests is not None and self._count >= self._max_requests:
+                self._exhausted = True
+                raise RequestBudgetExhausted("The limit of {} requests was reached".format(self._max_requests))
+            self._count += 1
+            if not self._rate:
+                return 0
+            now = time.monotonic()
+            self._tokens = min(1.0, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self._rate
+
+    def take(self):
+        """
+        Waits until a request is allowed to be sent
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RetryPolicy(object):
+    """
+    Decides when and how long to wait before retrying a request to the service
+
+    Design note: Delays grow exponentially with jitter so retries from several workers don't arrive at the same time;
+    a Retry-After header from the service takes the place of the computed delay.  Requests made only to check the type
+    of a reference link get their own, usually smaller, number of retries than requests for resources being tested.
+
+    Args:
+        retries: The maximum number of retries for reading resources being tested
+        link_retries: The maximum number of retries for reference link checks
+        statuses: The HTTP statuses to retry, mapped to the most retries allowed for each
+        errors: The kinds of request errors to retry, mapped to the most retries allowed for each
+    """
+
+    def __init__(self, retries=3, link_retries=1, statuses=None, errors=None):
+        self._retries = retries
+        self._link_retries = link_retries
+        self._statuses = RETRY_STATUSES if statuses is None else statuses
+        self._errors = RETRY_ERRORS if errors is None else errors
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    @property
+    def counts(self):
+        """
+        Accesses the number of retries performed
+
+        Returns:
+            A dictionary of the number of retries for each reason
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def get_delay(self, retries, link_check, status=None, retry_after=None, error=None):
+        """
+        Determines if a request needs to be retried
+
+        Args:
+            retries: The number of retries already performed for the request
+            link_check: Indicates if the request is only for checking a reference link
+            status: The HTTP status of the response
+            retry_after: The Retry-After header of the response
+            error: The exception raised for the request
+
+        Returns:
+            The time, in seconds, to wait before retrying; None if the request is not to be retried
+            The reason for the retry
+        """
+        if error is not None:
+            reason = get_error_kind(error)
+            if reason not in self._errors:
+                return None, reason
+            limit = self._errors[reason]
+        elif status in self._statuses:
+            reason = "HTTP {}".format(status)
+            limit = self._statuses[status]
+        else:
+            return None, None
+        max_retries = self._link_retries if link_check else self._retries
+        if limit is not None:
+            max_retries = min(max_retries, limit)
+        if retries >= max_retries:
+            return None, reason
+
+        delay = get_retry_after(retry_after)
+        if delay is None:
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2**retries))
+            delay = random.uniform(delay / 2, delay)
+        with self._lock:
+            self._counts[reason] = self._counts.get(reason, 0) + 1
+        return delay, reason
+
+
+class CircuitBreaker(object):
+    """
+    Stops sending requests for a part of the service after repeated failures in that part
+
+    Design note: Failures are counted against the parent of the URI that failed, so members of the same collection or
+    subordinate resources of the same resource trip the breaker together.  Once open, every URI under that parent is
+    skipped until the cool-down ends; the next URI under it is then sent as a trial, which closes the breaker if it
+    succeeds and opens it again if it fails.  A trial that ends without an outcome, such as when the request budget runs
+    out, is released so the next URI under that parent becomes the trial.  Failures directly beneath the service root
+    don't count so the whole service is never skipped.
+
+    Args:
+        threshold: The number of failures in a row that opens the breaker; 0 to never open it
+        cooldown: The time, in seconds, to skip requests once the breaker opens
+    """
+
+    def __init__(self, threshold=0, cooldown=60.0):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = {}
+        self._opened = {}
+        self._trials = {}
+        self._lock = threading.Lock()
+
+    def check(self, uri):
+        """
+        Checks if a request for a URI is to be skipped; if the cool-down has ended, the request becomes the trial
+
+        Args:
+            uri: The URI to check
+
+        Returns:
+            The prefix of the open breaker if the request is to be skipped, otherwise None
+        """
+        if not self._threshold:
+            return None
+        with self._lock:
+            prefix = self._find_open(uri)
+            if prefix is None or self._trials.get(uri) == prefix:
+                # Requests for the URI sent as the trial, such as a fallback after $select, are part of the trial
+                return None
+            if prefix in self._trials.values():
+                return prefix
+            if time.monotonic() - self._opened[prefix] < self._cooldown:
+                return prefix
+            logger.debug("Sending {} as a trial for {}".format(uri, prefix))
+            self._trials[uri] = prefix
+            return None
+
+    def is_open(self, uri):
+        """
+        Checks if a URI is under an open breaker without starting a trial
+
+        Args:
+            uri: The URI to check
+
+        Returns:
+            A boolean indicating if the breaker is open
+        """
+        if not self._threshold:
+            return False
+        with self._lock:
+            return self._find_open(uri) is not None
+
+    def record(self, uri, status=None, error=None):
+        """
+        Records the outcome of a request; timeouts, connection errors, and HTTP 5xx other than 501 count as failures
+
+        Args:
+            uri: The URI of the request
+            status: The HTTP status of the response
+            error: The exception raised for the request
+        """
+        if not self._threshold:
+            return
+        failed = False
+        if error is not None:
+            failed = get_error_kind(error) in CIRCUIT_ERRORS
+        elif status is not None:
+            failed = status >= 500 and status != 501
+        prefix = get_parent_uri(uri)
+        with self._lock:
+            trial_prefix = self._trials.pop(uri, None)
+            if trial_prefix is not None:
+                if failed:
+                    self._open(trial_prefix, "the trial request for {} failed".format(uri))
+                else:
+                    logger.debug("Closing the circuit breaker for {}".format(trial_prefix))
+                    self._opened.pop(trial_prefix, None)
+                    self._failures[trial_prefix] = 0
+            if not failed:
+                self._failures[prefix] = 0
+                return
+            self._failures[prefix] = self._failures.get(prefix, 0) + 1
+            if self._failures[prefix] >= self._threshold and prefix not in self._opened and prefix.count("/") > 2:
+                self._open(prefix, "{} requests in a row failed".format(self._failures[prefix]))
+
+    def release(self, uri):
+        """
+        Releases the trial for a URI if its outcome was never recorded
+
+        Args:
+            uri: The URI of the request
+        """
+        if not self._threshold:
+            return
+        with self._lock:
+            prefix = self._trials.pop(uri, None)
+        if prefix is not None:
+            logger.debug("Releasing the trial for {}; {} was not read".format(prefix, uri))
+
+    def _find_open(self, uri):
+        """
+        Finds the open breaker that covers a URI
+
+        Args:
+            uri: The URI to check
+
+        Returns:
+            The prefix of the open breaker, or None if the URI isn't under an open breaker
+        """
+        path = uri.split("?")[0].rstrip("/")
+        for prefix in self._opened:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix
+        return None
+
+    def _open(self, prefix, reason):
+        """
+        Opens the breaker for a prefix
+
+        Args:
+            prefix: The prefix of the URIs to skip
+            reason: The reason the breaker is opened
+        """
+        self._opened[prefix] = time.monotonic()
+        self._failures[prefix] = 0
+        logger.critical("Skipping requests under {} for {} seconds; {}".format(prefix, self._cooldown, reason))
+
+
+def get_parent_uri(uri):
+    """
+    Gets the URI of the parent of a resource
+
+    Args:
+        uri: The URI of the resource
+
+    Returns:
+        The URI of the parent
+    """
+    return uri.split("?")[0].rstrip("/").rsplit("/", 1)[0]
+
+
+def get_error_kind(error):
+    """
+    Classifies an exception raised when sending a request
+
+    Args:
+        error: The exception
+
+    Returns:
+        "Timeout", "Connection error", or the name of the exception type
+    """
+    if isinstance(error, redfish.rest.v1.RetriesExhaustedError) and error.__cause__ is not None:
+        error = error.__cause__
+    if isinstance(error, (requests.exceptions.Timeout, TimeoutError)):
+        return "Timeout"
+    if isinstance(error, (requests.exceptions.ConnectionError, ConnectionError)):
+        return "Connection error"
+    if type(error).__module__.split(".")[0] == "aiohttp":
+        # Client errors from the asyncio engine
+        return "Connection error"
+    return type(error).__name__
+
+
+def get_retry_after(retry_after):
+    """
+    Gets the delay requested by a Retry-After header
+
+    Args:
+        retry_after: The value of the Retry-After header
+
+    Returns:
+        The time, in seconds, to wait; None if the header is not present or not valid
+    """
+    if not retry_after:
+        return None
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except Exception:
+            return None
+    return min(RETRY_MAX_DELAY, max(0.0, delay))
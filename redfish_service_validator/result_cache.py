@@ -0,0 +1,206 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Result Cache
+
+File : result_cache.py
+
+Brief : This file contains the definitions and functionalities for keeping
+        the ETags and test results of resources between runs so unchanged
+        resources are not downloaded and tested again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+import redfish
+
+from redfish_service_validator import logger
+from redfish_service_validator.crawler import canonical_uri
+
+CACHE_FILE = "ValidationCache.json"
+CACHE_VERSION = 1
+
+# Response headers kept with a cached payload
+KEPT_HEADERS = ["ETag", "Allow", "Content-Type"]
+
+
+def get_fingerprint(tool_version, schema_dir, settings):
+    """
+    Gets the fingerprint of everything besides the payload that the results of a resource depend on
+
+    Args:
+        tool_version: The version of the validator
+        schema_dir: The directory containing the schema files used for testing
+        settings: A dictionary of the options that change how resources are tested
+
+    Returns:
+        A string identifying the validator version, the schema files, and the options
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"Version": tool_version, "Settings": settings}, sort_keys=True).encode("utf-8"))
+    for filename in sorted(os.listdir(schema_dir)):
+        if not filename.lower().endswith(".xml"):
+            continue
+        digest.update(filename.encode("utf-8"))
+        with open(os.path.join(schema_dir, filename), "rb") as schema_file:
+            digest.update(schema_file.read())
+    return digest.hexdigest()
+
+
+class ResultCache(object):
+    """
+    Keeps the ETag, payload, and test results of each resource between runs
+
+    Design note: Entries are kept per service and keyed by canonical URI.  The entries from the previous run are only
+    used once the fingerprint of the validator version, schema files, and test options is known to match, so a
+    resource is tested again whenever anything that could change its results changes.  Results of reference link
+    checks are reused along with everything else, so a change to a linked resource is not noticed until the resource
+    holding the link changes.
+
+    Args:
+        path: The file holding the cache
+        rhost: The address of the Redfish service
+    """
+
+    def __init__(self, path, rhost):
+        self._path = path
+        self._rhost = rhost
+        self._services = {}
+        self._previous = {}
+        self._entries = {}
+        self._fingerprint = None
+        self._lock = threading.Lock()
+        try:
+            with open(path) as cache_file:
+                cache = json.load(cache_file)
+            if cache.get("Version") == CACHE_VERSION:
+                self._services = dict(cache.get("Services", {}))
+        except FileNotFoundError:
+            pass
+        except Exception as err:
+            logger.warning("Could not read the validation cache from {}; {}".format(path, err))
+
+    def start(self, fingerprint):
+        """
+        Starts using the entries from the previous run if they were made under the same conditions
+
+        Args:
+            fingerprint: The fingerprint from get_fingerprint for this run
+        """
+        self._fingerprint = fingerprint
+        service = self._services.get(self._rhost)
+        if service is None:
+            return
+        if service.get("Fingerprint") != fingerprint:
+            logger.info("Not reusing previous results; the validator, schemas, or options changed")
+            return
+        self._previous = dict(service.get("Resources", {}))
+        self._entries = dict(self._previous)
+        logger.info("Reusing results for resources unchanged since the previous run")
+
+    def get_etag(self, uri):
+        """
+        Gets the ETag of a resource from the previous run
+
+        Args:
+            uri: The URI of the resource
+
+        Returns:
+            The ETag; None if the previous results can't be used
+        """
+        entry = self._previous.get(canonical_uri(uri))
+        if entry is None:
+            return None
+        return entry["ETag"]
+
+    def get_response(self, uri):
+        """
+        Gets the response of a resource from the previous run
+
+        Args:
+            uri: The URI of the resource
+
+        Returns:
+            The response held from the previous run; None if the previous results can't be used
+        """
+        entry = self._previous.get(canonical_uri(uri))
+        if entry is None:
+            return None
+        return redfish.rest.v1.StaticRestResponse(Status=200, Content=entry["Payload"], Headers=entry["Headers"])
+
+    def get_results(self, uri):
+        """
+        Gets the results of a resource from the previous run
+
+        Args:
+            uri: The URI of the resource
+
+        Returns:
+            A dictionary of the results from the previous run, keyed by property path; None if there are none
+        """
+        entry = self._previous.get(canonical_uri(uri))
+        if entry is None:
+            return None
+        return entry["Results"]
+
+    def add(self, uri, resource):
+        """
+        Keeps the results of a resource for the next run
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information after testing
+        """
+        key = canonical_uri(uri)
+        response = resource["Response"]
+        etag = None
+        if (
+            response is not None
+            and response.status == 200
+            and not resource["Mockup"]
+            and not resource["Oversized"]
+            and not resource["CircuitOpen"]
+        ):
+            etag = response.getheader("ETag")
+            if etag is None:
+                try:
+                    etag = response.dict.get("@odata.etag")
+                except Exception:
+                    etag = None
+        with self._lock:
+            if not isinstance(etag, str):
+                # Nothing to check the resource against next time
+                self._entries.pop(key, None)
+                return
+            headers = {}
+            for name in KEPT_HEADERS:
+                value = response.getheader(name)
+                if value is not None:
+                    headers[name] = value
+            self._entries[key] = {
+                "Uri": resource["Uri"] or uri,
+                "ETag": etag,
+                "Headers": headers,
+                "Payload": response.text,
+                "Results": resource["Results"],
+            }
+
+    def save(self):
+        """
+        Saves the cache for the next run
+        """
+        if self._fingerprint is None:
+            return
+        with self._lock:
+            self._services[self._rhost] = {"Fingerprint": self._fingerprint, "Resources": self._entries}
+            cache = {"Version": CACHE_VERSION, "Services": self._services}
+            try:
+                with open(self._path, "w") as cache_file:
+                    json.dump(cache, cache_file, indent=1, sort_keys=True)
+            except Exception as err:
+                logger.warning("Could not save the validation cache to {}; {}".format(self._path, err))
@@ -0,0 +1,463 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Service Session
+
+File : service_session.py
+
+Brief : This file contains the definitions and functionalities for sending
+        requests to the service.
+"""
+
+import threading
+import time
+
+from redfish_service_validator import logger
+from redfish_service_validator.request_control import RequestBudgetExhausted
+
+PAYLOAD_CHUNK_SIZE = 65536  # Number of bytes read at a time when a payload size limit is set
+
+
+def get_header_size(start_line, headers):
+    """
+    Gets the number of bytes for the start line and headers of an HTTP message
+
+    Args:
+        start_line: The request line or status line
+        headers: The headers of the message
+
+    Returns:
+        The number of bytes
+    """
+    size = len(start_line) + 4  # CRLF after the start line and after the headers
+    for name, value in headers.items():
+        size += len(name) + len(value) + 4  # ": " and CRLF
+    return size
+
+
+def new_transfer():
+    """
+    Creates a new record of the bytes transferred with the service
+
+    Returns:
+        A dictionary of byte counts; "BytesReceived" is what was on the wire, and "BytesUncompressed" is what the
+        received bytes would have been without compression
+    """
+    return {"BytesSent": 0, "BytesReceived": 0, "BytesUncompressed": 0}
+
+
+def measure_transfer(response):
+    """
+    Measures the bytes transferred for a request sent with a Redfish client
+
+    Args:
+        response: The response from the Redfish client
+
+    Returns:
+        A dictionary of byte counts; None if the response did not come from the service
+    """
+    http_response = getattr(response, "_http_response", None)
+    if http_response is None or http_response.request is None:
+        return None
+    request = http_response.request
+    transfer = new_transfer()
+    transfer["BytesSent"] = get_header_size("{} {} HTTP/1.1".format(request.method, request.path_url), request.headers)
+    if request.body:
+        transfer["BytesSent"] += len(request.body)
+    status_line = "HTTP/1.1 {} {}".format(http_response.status_code, http_response.reason)
+    header_size = get_header_size(status_line, http_response.headers)
+    body_size = len(http_response.content or b"")
+    try:
+        # Number of bytes read from the connection, before decompression
+        wire_size = http_response.raw.tell()
+    except Exception:
+        wire_size = 0
+    if not wire_size:
+        try:
+            wire_size = int(http_response.headers.get("Content-Length", body_size))
+        except ValueError:
+            wire_size = body_size
+    transfer["BytesReceived"] = header_size + wire_size
+    transfer["BytesUncompressed"] = header_size + body_size
+    return transfer
+
+
+class ServiceSession(object):
+    """
+    Wraps the Redfish clients so every request the tool sends to the service passes through the request controls
+
+    Design note: GET requests are spread across a pool of Redfish clients, each with its own session and connections,
+    by sending each request on the client with the fewest requests in flight.  Anything other than GET is passed
+    straight to the first client; login requests are counted against the budget by the caller, and logging out is
+    always allowed so sessions aren't left behind on the service.
+
+    If a session expires during testing, the first request to get HTTP 401 logs in again while requests from other
+    workers that hit the same expired session wait for it; each of those requests is then sent once more.
+
+    With a payload size limit, bodies are read in chunks as they arrive, before the Redfish client sees them; once a
+    body goes over the limit, the rest is not read and the response is marked as oversized with an empty body.
+
+    Args:
+        redfish_obj: The first Redfish client; used for everything other than GET requests
+        controller: The concurrency controller
+        budget: The request budget
+        retry_policy: The retry policy
+        max_payload_bytes: The maximum number of bytes to read for a response body; None for no limit
+        recorder: The traffic recorder to add each GET response to; None to not record responses
+    """
+
+    def __init__(self, redfish_obj, controller, budget, retry_policy, max_payload_bytes=None, recorder=None):
+        self._redfish_obj = redfish_obj
+        self._controller = controller
+        self._budget = budget
+        self._retry_policy = retry_policy
+        self._clients = [redfish_obj]
+        self._busy = [0]
+        self._next_client = 0
+        self._pool_lock = threading.Lock()
+        self._auth_lock = threading.Lock()
+        self._reauth_count = 0
+        self._reauth_time = 0.0
+        self._transfer = new_transfer()
+        self._transfer_lock = threading.Lock()
+        self._max_payload_bytes = max_payload_bytes
+        self._recorder = recorder
+        self.limit_payloads(redfish_obj)
+
+    def __getattr__(self, name):
+        return getattr(self._redfish_obj, name)
+
+    @property
+    def controller(self):
+        """
+        Accesses the concurrency controller
+
+        Returns:
+            The concurrency controller
+        """
+        return self._controller
+
+    @property
+    def budget(self):
+        """
+        Accesses the request budget
+
+        Returns:
+            The request budget
+        """
+        return self._budget
+
+    @property
+    def retry_policy(self):
+        """
+        Accesses the retry policy
+
+        Returns:
+            The retry policy
+        """
+        return self._retry_policy
+
+    @property
+    def clients(self):
+        """
+        Accesses the Redfish clients in the pool
+
+        Returns:
+            A list of Redfish clients
+        """
+        with self._pool_lock:
+            return list(self._clients)
+
+    @property
+    def reauth_count(self):
+        """
+        Accesses the number of times a session was logged in again after it expired
+
+        Returns:
+            The number of re-authentications
+        """
+        return self._reauth_count
+
+    @property
+    def reauth_time(self):
+        """
+        Accesses the time spent by requests on expired sessions, including waiting for the session to be logged in
+        again
+
+        Returns:
+            The time, in seconds
+        """
+        return self._reauth_time
+
+    @property
+    def max_payload_bytes(self):
+        """
+        Accesses the maximum number of bytes to read for a response body
+
+        Returns:
+            The number of bytes; None for no limit
+        """
+        return self._max_payload_bytes
+
+    @property
+    def transfer(self):
+        """
+        Accesses the bytes transferred for the GET requests sent to the service
+
+        Returns:
+            A dictionary of byte counts
+        """
+        with self._transfer_lock:
+            return dict(self._transfer)
+
+    def add_transfer(self, transfer):
+        """
+        Adds the bytes transferred for a request to the totals
+
+        Args:
+            transfer: A dictionary of byte counts; None if nothing was measured
+        """
+        if transfer is None:
+            return
+        with self._transfer_lock:
+            for name, count in transfer.items():
+                self._transfer[name] += count
+
+    def record(self, path, response, response_time):
+        """
+        Adds a GET response to the traffic recorder, if recording
+
+        Args:
+            path: The URI requested
+            response: The response from the service
+            response_time: The time, in milliseconds, for the service to respond
+        """
+        if self._recorder is not None:
+            self._recorder.add(path, response, response_time)
+
+    def add_client(self, redfish_obj):
+        """
+        Adds a logged in Redfish client to the pool
+
+        Args:
+            redfish_obj: The Redfish client
+        """
+        self.limit_payloads(redfish_obj)
+        with self._pool_lock:
+            self._clients.append(redfish_obj)
+            self._busy.append(0)
+
+    def limit_payloads(self, redfish_obj):
+        """
+        Applies the payload size limit to the responses received by a Redfish client
+
+        Args:
+            redfish_obj: The Redfish client
+        """
+        # Replayed responses don't come from requests
+        if self._max_payload_bytes is not None and hasattr(redfish_obj, "_session"):
+            redfish_obj._session.hooks["response"].append(self.read_limited_body)
+
+    def read_limited_body(self, http_response, *args, **kwargs):
+        """
+        Reads the body of a response up to the payload size limit; called by requests before the body is read
+
+        Args:
+            http_response: The response from requests
+            args: Additional positional arguments from requests
+            kwargs: Additional keyword arguments from requests
+
+        Returns:
+            The response from requests with its body read
+        """
+        body = bytearray()
+        http_response.oversized = False
+        for chunk in http_response.iter_content(PAYLOAD_CHUNK_SIZE):
+            body += chunk
+            if len(body) > self._max_payload_bytes:
+                # Drop what was read and the rest of the body along with the connection
+                logger.debug("Stopped reading {} at {} bytes".format(http_response.url, len(body)))
+                http_response.oversized = True
+                http_response.close()
+                body = bytearray()
+                break
+        http_response._content = bytes(body)
+        return http_response
+
+    def next_client(self):
+        """
+        Gets a Redfish client from the pool in turn for requests sent outside of the wrapper
+
+        Returns:
+            A Redfish client
+        """
+        with self._pool_lock:
+            client = self._clients[self._next_client % len(self._clients)]
+            self._next_client += 1
+            return client
+
+    def logout(self):
+        """
+        Logs out every session in the pool; sessions that fail to log out don't stop the others
+        """
+        with self._pool_lock:
+            clients = list(reversed(self._clients))
+            self._clients = [self._redfish_obj]
+            self._busy = [0]
+        for client in clients:
+            try:
+                client.logout()
+            except Exception as err:
+                logger.debug("Could not log out of the service; {}".format(err))
+
+    def reauthenticate(self, redfish_obj, session_key, lost_time=0):
+        """
+        Logs a Redfish client in again after its session expired
+
+        Args:
+            redfish_obj: The Redfish client that got HTTP 401
+            session_key: The session key used for the request that got HTTP 401
+            lost_time: The time, in seconds, already spent on the request that got HTTP 401
+
+        Returns:
+            A boolean indicating if the request can be sent again with a new session
+        """
+        if not session_key:
+            # Basic authentication; the credentials themselves were rejected
+            return False
+        _t0 = time.time()
+        with self._auth_lock:
+            try:
+                if redfish_obj.get_session_key() != session_key:
+                    # Another worker already logged in again
+                    return redfish_obj.get_session_key() is not None
+                logger.info("The session with the service expired; logging in again")
+                self._budget.take()
+                # Drop the expired session so it isn't sent with the login request
+                redfish_obj.set_session_key(None)
+                redfish_obj.set_session_location(None)
+                try:
+                    redfish_obj.login(auth="session")
+                except RequestBudgetExhausted:
+                    raise
+                except Exception as err:
+                    logger.critical("Could not log in to the service again; {}".format(err))
+                    return False
+                self._reauth_count += 1
+                return True
+            finally:
+                self._reauth_time += lost_time + time.time() - _t0
+
+    def get(self, path, *args, **kwargs):
+        """
+        Performs a GET request on the service
+
+        Args:
+            path: The URI to get
+            args: Additional positional arguments for the Redfish client
+            kwargs: Additional keyword arguments for the Redfish client
+
+        Returns:
+            The response from the service
+        """
+        return self.get_timed(path, *args, **kwargs)[0]
+
+    def get_timed(self, path, *args, link_check=False, **kwargs):
+        """
+        Performs a GET request on the service, retrying it as allowed by the retry policy, and measures the time for
+        the service to respond
+
+        Args:
+            path: The URI to get
+            args: Additional positional arguments for the Redfish client
+            link_check: Indicates if the request is only for checking a reference link
+            kwargs: Additional keyword arguments for the Redfish client
+
+        Returns:
+            The response from the service; its 'transfer' attribute holds the bytes transferred for the last attempt,
+            and its 'oversized' attribute indicates if the body was dropped for going over the payload size limit
+            The time, in milliseconds, for the service to respond; time spent waiting to send the request is excluded
+            The number of retries performed
+        """
+        # Retries are handled here rather than by the Redfish client
+        kwargs.setdefault("max_retry", 0)
+        retries = 0
+        while True:
+            response, response_time, error = self._send(path, *args, **kwargs)
+            status = None
+            retry_after = None
+            if response is not None:
+                status = response.status
+                retry_after = response.getheader("Retry-After")
+            delay, reason = self._retry_policy.get_delay(retries, link_check, status, retry_after, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response, response_time, retries
+            retries += 1
+            logger.debug("Retrying {} in {:.1f}s after {}; retry {}".format(path, delay, reason, retries))
+            time.sleep(delay)
+
+    def _send(self, path, *args, replay_client=None, **kwargs):
+        """
+        Sends a single GET request to the service once the request controls allow it; if the session expired, the
+        request is sent again after logging in again
+
+        Args:
+            path: The URI to get
+            args: Additional positional arguments for the Redfish client
+            replay_client: The Redfish client to send the request again with after logging in again
+            kwargs: Additional keyword arguments for the Redfish client
+
+        Returns:
+            The response from the service, or None if the request failed
+            The time, in milliseconds, for the service to respond
+            The exception raised for the request, or None if a response was received
+        """
+        self._controller.acquire()
+        try:
+            self._budget.take()
+        except RequestBudgetExhausted:
+            self._controller.release()
+            raise
+        with self._pool_lock:
+            if replay_client in self._clients:
+                index = self._clients.index(replay_client)
+            else:
+                index = self._busy.index(min(self._busy))
+            client = self._clients[index]
+            self._busy[index] += 1
+        session_key = client.get_session_key()
+        response = None
+        response_time = None
+        error = None
+        try:
+            _t0 = time.time()
+            response = client.get(path, *args, **kwargs)
+            # Replayed responses carry what was measured when they were recorded
+            response_time = getattr(response, "response_time", None)
+            if response_time is None:
+                response_time = round((time.time() - _t0) * 1000)
+            if not hasattr(response, "transfer"):
+                response.transfer = measure_transfer(response)
+                response.oversized = getattr(response._http_response, "oversized", False)
+            self.add_transfer(response.transfer)
+            self.record(path, response, response_time)
+        except Exception as err:
+            error = err
+        finally:
+            # Give back the client and the slot even if the request was interrupted
+            with self._pool_lock:
+                if index < len(self._busy) and self._clients[index] is client:
+                    self._busy[index] -= 1
+            if response is not None:
+                self._controller.release(response_time, response.status, response.getheader("Retry-After"))
+            else:
+                self._controller.release(error=error)
+
+        if replay_client is None and response is not None and response.status == 401:
+            if self.reauthenticate(client, session_key, response_time / 1000):
+                return self._send(path, *args, replay_client=client, **kwargs)
+        return response, response_time, error
@@ -11,19 +11,65 @@ Brief : This file contains the definitions for tracking data for the test
         system.
 """
 
+import json
 import re
+import threading
 import time
 import redfish
-import redfish_utilities
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from redfish_service_validator import checkpoint
+from redfish_service_validator import crawler
 from redfish_service_validator import logger
+from redfish_service_validator import metadata
+from redfish_service_validator.request_control import CircuitBreaker
+from redfish_service_validator.request_control import ConcurrencyController
+from redfish_service_validator.request_control import RequestBudget
+from redfish_service_validator.request_control import RequestBudgetExhausted
+from redfish_service_validator.request_control import RetryPolicy
+from redfish_service_validator.service_session import ServiceSession
+from redfish_service_validator.service_session import measure_transfer
+from redfish_service_validator.service_session import new_transfer
+from redfish_service_validator.traffic_archive import NotRecordedError
+from redfish_service_validator.traffic_archive import ReplayClient
 from redfish_service_validator import validate
 
 
 class SystemUnderTest(object):
     def __init__(
-        self, rhost, username, password, timeout, authtype, http_proxy, https_proxy, mockup, collection_limits, no_oem
+        self,
+        rhost,
+        username,
+        password,
+        timeout,
+        authtype,
+        http_proxy,
+        https_proxy,
+        mockup,
+        collection_limits,
+        no_oem,
+        expand=False,
+        workers=1,
+        max_rps=None,
+        max_requests=None,
+        retries=3,
+        link_retries=1,
+        sessions=1,
+        circuit_threshold=0,
+        circuit_cooldown=60,
+        max_duration=None,
+        history_file=None,
+        include=None,
+        exclude=None,
+        max_depth=None,
+        max_payload_bytes=None,
+        recorder=None,
+        replay=None,
+        result_cache=None,
+        crawl_checkpoint=None,
+        log_history_file=None,
+        log_recheck=5,
     ):
         """
         Constructor for new system under test
@@ -39,9 +85,39 @@ class SystemUnderTest(object):
             mockup: The mockup directory
             collection_limits: Limits for validating members in a collection
             no_oem: Indicator to skip OEM extensions
+            expand: Indicator to use $expand for reading collection members when the service supports it
+            workers: The maximum number of requests to have in flight with the service
+            max_rps: The maximum number of requests per second to send to the service
+            max_requests: The maximum number of requests to send to the service
+            retries: The maximum number of retries for reading resources being tested
+            link_retries: The maximum number of retries for reference link checks
+            sessions: The number of sessions to open with the service for reading resources
+            circuit_threshold: The number of failed requests in a row under a resource that skips the rest of it
+            circuit_cooldown: The time, in seconds, to skip requests under a resource after too many failures
+            max_duration: The time, in seconds, allowed for testing; None for no limit
+            history_file: The file holding the response times from previous runs; None to not keep them
+            include: Patterns for the URIs to follow during the traversal; None to follow everything not excluded
+            exclude: Patterns for the URIs to not follow during the traversal
+            max_depth: The maximum number of segments below the service root for URIs to follow; None for no limit
+            max_payload_bytes: The maximum number of bytes to read for a response body; None for no limit
+            recorder: The traffic recorder for the responses from the service; None to not record responses
+            replay: The traffic archive to read responses from instead of the service; None to use the service
+            result_cache: The ETags and results of resources from previous runs; None to test every resource
+            crawl_checkpoint: The checkpoint for saving the progress of the run; None to not save progress
+            log_history_file: The file holding the newest log entries tested in previous runs; None to not keep them
+            log_recheck: The number of log entries tested in previous runs to test again in each log entry collection
         """
         self._rhost = rhost
         self._username = username
+        self._timeout = timeout
+        self._deadline = None
+        if max_duration:
+            # Leave time for requests in flight to finish
+            self._deadline = time.monotonic() + max_duration - min(timeout or 0, max_duration / 2)
+        self._unvisited = []
+        self._history = crawler.ResponseTimeHistory(history_file, rhost)
+        self._log_history = crawler.LogEntryHistory(log_history_file, rhost, log_recheck)
+        self._uri_filter = crawler.UriFilter(include, exclude, max_depth)
         proxies = None
         if http_proxy or https_proxy:
             proxies = {}
@@ -49,11 +125,40 @@ class SystemUnderTest(object):
                 proxies["http"] = http_proxy
             if https_proxy:
                 proxies["https"] = https_proxy
-        self._redfish_obj = redfish.redfish_client(
-            base_url=rhost, username=username, password=password, proxies=proxies, timeout=timeout, max_retry=3
+        self._proxies = proxies
+        budget = RequestBudget(max_rps, max_requests)
+        budget.take()  # Creating the client reads the service root
+        if replay is not None:
+            # Nothing to connect to or log in to
+            redfish_obj = ReplayClient(replay)
+            root_time = redfish_obj.root_time
+        else:
+            _t0 = time.time()
+            redfish_obj = redfish.redfish_client(
+                base_url=rhost, username=username, password=password, proxies=proxies, timeout=timeout, max_retry=3
+            )
+            root_time = round((time.time() - _t0) * 1000)
+        self._redfish_obj = ServiceSession(
+            redfish_obj,
+            ConcurrencyController(workers),
+            budget,
+            RetryPolicy(retries, link_retries),
+            max_payload_bytes,
+            recorder,
         )
-        self._redfish_obj.login(auth=authtype.lower())
+        if replay is None:
+            budget.take()
+            self._redfish_obj.login(auth=authtype.lower())
+            try:
+                self.add_sessions(sessions - 1, username, password, authtype.lower())
+            except BaseException:
+                # Don't leave sessions behind on the service if setup is interrupted
+                self.logout()
+                raise
         self._mockup_dir = mockup
+        self._max_payload_bytes = max_payload_bytes
+        self._result_cache = result_cache
+        self._checkpoint = crawl_checkpoint
         self._no_oem = no_oem
         self._service_root = self._redfish_obj.root_resp.dict
         self._pass_count = 0
@@ -63,25 +168,14 @@ class SystemUnderTest(object):
         self._error_classes = {}
         self._warning_classes = {}
 
-        # Find the manager to populate service info
-        self._product = None
-        self._product = self._service_root.get("Product", "N/A")
-        self._fw_version = None
-        self._model = None
-        self._manufacturer = None
-        if "Managers" in self._service_root:
-            try:
-                manager_ids = redfish_utilities.get_manager_ids(self._redfish_obj)
-                if len(manager_ids) > 0:
-                    manager = redfish_utilities.get_manager(self._redfish_obj, manager_ids[0])
-                    self._fw_version = manager.dict.get("FirmwareVersion", "N/A")
-                    self._model = manager.dict.get("Model", "N/A")
-                    self._manufacturer = manager.dict.get("Manufacturer", "N/A")
-            except:
-                pass
-
         # Set up the resource cache
+        self._circuit_breaker = CircuitBreaker(circuit_threshold, circuit_cooldown)
         self._resources = {}
+        self._resource_lock = threading.Lock()
+        self._in_flight = {}
+        self._link_resources = {}
+        self._uri_spellings = {}
+        self._traversal = None
         self._annotation_uris = []
         self._collection_capabilities_uris = []
 
@@ -94,6 +188,58 @@ class SystemUnderTest(object):
                 continue
             self._collection_limits[resource_type] = limit
 
+        self._collection_limit_uris = None
+
+        # Determine the query parameters supported by the service
+        protocol_features = self._service_root.get("ProtocolFeaturesSupported")
+        if not isinstance(protocol_features, dict):
+            protocol_features = {}
+        self._top_supported = protocol_features.get("TopSkipQuery") is True
+        self._select_supported = protocol_features.get("SelectQuery") is True and not mockup
+
+        # Determine if collection members can be read with $expand; mockups are read one resource at a time
+        self._expand_query = None
+        expand_support = protocol_features.get("ExpandQuery")
+        if expand and not mockup and isinstance(expand_support, dict) and expand_support.get("NoLinks") is True:
+            self._expand_query = "$expand=.($levels=1)" if expand_support.get("Levels") is True else "$expand=."
+            logger.debug("Using '{}' to read collection members".format(self._expand_query))
+
+        # Keep the service root read when the client was created so it's not read again during testing
+        self.get_uri_spelling(self._redfish_obj.default_prefix)
+        root_resource = self.create_resource_entry(self._redfish_obj.default_prefix)
+        root_resp = self._redfish_obj.root_resp
+        if not hasattr(root_resp, "transfer"):
+            root_resp.transfer = measure_transfer(root_resp)
+        self._redfish_obj.add_transfer(root_resp.transfer)
+        self._redfish_obj.record(self._redfish_obj.default_prefix, root_resp, root_time)
+        if not self.read_mockup(self._redfish_obj.default_prefix, root_resource):
+            self.set_resource_response(
+                self._redfish_obj.default_prefix, root_resource, self._redfish_obj.root_resp, root_time
+            )
+        self.cache_resource(self._redfish_obj.default_prefix, root_resource)
+
+        # Find the manager to populate service info; the resources are cached for testing when they're read
+        self._product = None
+        self._product = self._service_root.get("Product", "N/A")
+        self._fw_version = None
+        self._model = None
+        self._manufacturer = None
+        if "Managers" in self._service_root:
+            try:
+                managers = self.read_setup_resource(self._service_root["Managers"]["@odata.id"])
+                if managers.status == 200 and len(managers.dict.get("Members", [])) > 0:
+                    manager = self.read_setup_resource(managers.dict["Members"][0]["@odata.id"])
+                    if manager.status == 200:
+                        self._fw_version = manager.dict.get("FirmwareVersion", "N/A")
+                        self._model = manager.dict.get("Model", "N/A")
+                        self._manufacturer = manager.dict.get("Manufacturer", "N/A")
+            except RequestBudgetExhausted:
+                # Don't leave sessions behind on the service; the budget is too small to test anything
+                self.logout()
+                raise
+            except Exception:
+                pass
+
     @property
     def rhost(self):
         """
@@ -164,6 +310,139 @@ class SystemUnderTest(object):
         """
         return self._redfish_obj
 
+    @property
+    def proxies(self):
+        """
+        Accesses the HTTP proxy information for accessing the service
+
+        Returns:
+            A dictionary of proxies by scheme; None if no proxies are used
+        """
+        return self._proxies
+
+    @property
+    def timeout(self):
+        """
+        Accesses the HTTP timeout limit
+
+        Returns:
+            The HTTP timeout limit, in seconds; None if not specified
+        """
+        return self._timeout
+
+    @property
+    def concurrency_history(self):
+        """
+        Accesses the changes made to the number of requests allowed in flight with the service
+
+        Returns:
+            A list of dictionaries with the time of the change, in seconds, the new limit, and the reason
+        """
+        return self._redfish_obj.controller.history
+
+    @property
+    def request_count(self):
+        """
+        Accesses the number of requests sent to the service
+
+        Returns:
+            The number of requests
+        """
+        return self._redfish_obj.budget.count
+
+    @property
+    def budget_exhausted(self):
+        """
+        Accesses whether or not testing stopped because the request budget ran out
+
+        Returns:
+            A boolean indicating if the request budget ran out
+        """
+        return self._redfish_obj.budget.exhausted
+
+    @property
+    def retry_counts(self):
+        """
+        Accesses the number of retries performed for requests to the service
+
+        Returns:
+            A dictionary of the number of retries for each reason
+        """
+        return self._redfish_obj.retry_policy.counts
+
+    @property
+    def transfer(self):
+        """
+        Accesses the bytes transferred for the GET requests sent to the service
+
+        Returns:
+            A dictionary of byte counts
+        """
+        return self._redfish_obj.transfer
+
+    @property
+    def transfer_by_type(self):
+        """
+        Accesses the bytes transferred for the resources read from the service, by resource type
+
+        Returns:
+            A dictionary of byte counts, along with the number of resources in "Resources", for each resource type
+        """
+        with self._resource_lock:
+            resources = list(self._resources.values())
+        transfer_by_type = {}
+        for resource in resources:
+            if resource["BytesReceived"] is None:
+                continue
+            try:
+                resource_type = resource["Response"].dict["@odata.type"][1:].split(".")[0]
+            except Exception:
+                resource_type = "Unknown"
+            totals = transfer_by_type.setdefault(resource_type, {"Resources": 0, **new_transfer()})
+            totals["Resources"] += 1
+            for name in new_transfer():
+                totals[name] += resource[name]
+        return transfer_by_type
+
+    @property
+    def unvisited(self):
+        """
+        Accesses the resources left untested when testing stopped at the time limit
+
+        Returns:
+            A list of URIs
+        """
+        return self._unvisited
+
+    @property
+    def history(self):
+        """
+        Accesses the response times from previous runs
+
+        Returns:
+            The response time history
+        """
+        return self._history
+
+    def save_history(self):
+        """
+        Adds the response times and log entries from this run to the history and saves it for the next run
+        """
+        self._history.update(self._resources)
+        self._history.save()
+        self._log_history.update(self._resources)
+        self._log_history.save()
+
+    @property
+    def unchanged_count(self):
+        """
+        Accesses the number of resources whose results were reused from a previous run
+
+        Returns:
+            The number of resources the service reported as unchanged
+        """
+        return sum(1 for resource in self._resources.values() if resource["Unchanged"])
+
     @property
     def service_root(self):
         """
@@ -224,9 +503,90 @@ class SystemUnderTest(object):
         """
         return self._skip_count
 
+    @property
+    def session_count(self):
+        """
+        Accesses the number of sessions open with the service
+
+        Returns:
+            The number of sessions
+        """
+        return len(self._redfish_obj.clients)
+
+    @property
+    def reauth_count(self):
+        """
+        Accesses the number of times a session was logged in again after it expired
+
+        Returns:
+            The number of re-authentications
+        """
+        return self._redfish_obj.reauth_count
+
+    @property
+    def reauth_time(self):
+        """
+        Accesses the time lost to expired sessions
+
+        Returns:
+            The time, in seconds
+        """
+        return self._redfish_obj.reauth_time
+
+    def add_sessions(self, count, username, password, authtype):
+        """
+        Opens additional sessions with the service so requests aren't serialized behind a single session
+
+        Design note: The Redfish data model doesn't describe how many sessions a service allows, so sessions are added
+        until the requested count is reached or the service refuses one.  New clients reuse the service root that was
+        already read instead of reading it again.
+
+        Args:
+            count: The number of sessions to add
+            username: The username for authentication
+            password: The password for authentication
+            authtype: The authorization type to use
+        """
+        if count <= 0:
+            return
+        primary = self._redfish_obj.clients[0]
+        session_service_uri = primary.root_resp.dict.get("SessionService", {}).get("@odata.id")
+        if authtype == "session" and session_service_uri:
+            try:
+                session_service = self._redfish_obj.get(session_service_uri)
+                if session_service.status == 200 and session_service.dict.get("ServiceEnabled") is False:
+                    logger.info("The session service is disabled; using one session")
+                    return
+            except RequestBudgetExhausted:
+                raise
+            except Exception:
+                pass
+
+        for _ in range(count):
+            client = redfish.redfish_client(
+                base_url=self._rhost,
+                username=username,
+                password=password,
+                proxies=self._proxies,
+                timeout=self._timeout,
+                max_retry=3,
+                check_connectivity=False,
+            )
+            client.root = primary.root
+            client.root_resp = primary.root_resp
+            client.login_url = primary.login_url
+            self._redfish_obj.budget.take()
+            try:
+                client.login(auth=authtype)
+            except Exception as err:
+                logger.info("Could not open more than {} sessions; {}".format(self.session_count, err))
+                return
+            self._redfish_obj.add_client(client)
+        logger.debug("Opened {} sessions with the service".format(self.session_count))
+
     def logout(self):
         """
-        Logs out of the Redfish service
+        Logs out of the Redfish service, including every session in the pool
         """
         try:
             self._redfish_obj.logout()
@@ -243,7 +603,7 @@ class SystemUnderTest(object):
         Returns:
             A boolean indicating if the URI is from an annotation
         """
-        return uri in self._annotation_uris
+        return crawler.canonical_uri(uri) in self._annotation_uris
 
     def is_uri_from_collection_capabilities(self, uri):
         """
@@ -255,25 +615,426 @@ class SystemUnderTest(object):
         Returns:
             A boolean indicating if the URI is from a collection capabilities annotation
         """
-        return uri in self._collection_capabilities_uris
+        return crawler.canonical_uri(uri) in self._collection_capabilities_uris
+
+    def get_uri_spelling(self, uri):
+        """
+        Gets the spelling of a URI to use when reading and reporting a resource
+
+        Design note: The resource cache is keyed by the canonical form of each URI so that spellings that only differ
+        in trailing slashes, percent-encoding, or the order of query parameters are read once.  The first spelling
+        found is used for the request; the resource is identified in the reports and in its tests by the URI from
+        get_resource_identity.
+
+        Args:
+            uri: The URI found in a payload
+
+        Returns:
+            The first spelling found for the resource
+        """
+        return self._uri_spellings.setdefault(crawler.canonical_uri(uri), uri)
+
+    def get_resource_identity(self, uri, payload):
+        """
+        Gets the URI that identifies a resource in the reports and in the tests that build on its URI, such as the
+        JSON pointer check for embedded objects
+
+        Args:
+            uri: The URI used to read the resource
+            payload: The payload of the resource; None if it could not be read
+
+        Returns:
+            The '@odata.id' of the payload if it's a spelling of the URI read, otherwise the canonical URI
+        """
+        key = crawler.canonical_uri(uri)
+        odata_id = payload.get("@odata.id") if payload is not None else None
+        if isinstance(odata_id, str) and crawler.canonical_uri(odata_id) == key:
+            return odata_id
+        return key
 
-    def get_resource(self, uri):
+    def get_resource(self, uri, link_check=False):
         """
         Gets a resource for a URI
 
         Args:
             uri: The URI to get
+            link_check: Indicates if the resource is only read for checking a reference link
 
         Returns:
             An object containing resource information about the URI
         """
-        # Check if we attempted this URI
-        if uri in self._resources:
-            return self._resources[uri]
+        # Check if we attempted this URI, or if another worker is already reading it
+        while True:
+            resource, pending = self.claim_resource(uri)
+            if resource is not None:
+                return resource
+            if pending is None:
+                break
+            pending.wait()
 
         # Not cached; go read it
+        try:
+            resource, request_uri, headers = self.start_resource_read(uri)
+            if request_uri is not None:
+                try:
+                    try:
+                        response, response_time, retries = self._redfish_obj.get_timed(
+                            request_uri, headers=headers, link_check=link_check
+                        )
+                    except NotRecordedError:
+                        if request_uri == uri:
+                            raise
+                        response, response_time, retries = None, None, 0
+                    if self.needs_full_read(uri, request_uri, response):
+                        response, response_time, more_retries = self._redfish_obj.get_timed(
+                            uri, headers=headers, link_check=link_check
+                        )
+                        retries += more_retries
+                    self.set_resource_response(uri, resource, response, response_time, retries)
+                except RequestBudgetExhausted:
+                    # Nothing was read; leave the URI uncached
+                    raise
+                except Exception as err:
+                    self.set_resource_exception(uri, resource, err)
+            return self.cache_resource(uri, resource)
+        finally:
+            self.end_circuit_trial(uri)
+            self.release_resource(uri)
+
+    def start_resource_read(self, uri):
+        """
+        Starts reading a resource claimed with claim_resource; the steps for reading a resource are shared by the crawl
+        engines, which only differ in how requests are sent
+
+        Args:
+            uri: The URI to read
+
+        Returns:
+            The resource information to fill in
+            The URI to request from the service; None if the resource was read from a mockup or is skipped
+            The HTTP headers for the request
+        """
         logger.debug("Caching {}...".format(uri))
-        self._resources[uri] = {
+        resource = self.create_resource_entry(uri)
+        if self.read_mockup(uri, resource) or self.check_circuit(uri, resource):
+            return resource, None, None
+        return resource, self.get_request_uri(uri), self.get_conditional_headers(uri)
+
+    def needs_full_read(self, uri, request_uri, response):
+        """
+        Checks if a resource needs to be read again without the query parameters added to the request for it
+
+        Args:
+            uri: The URI of the resource
+            request_uri: The URI requested from the service
+            response: The response from the service; None if the request was not recorded in the traffic archive
+
+        Returns:
+            A boolean indicating if the full resource needs to be read
+        """
+        if request_uri == uri:
+            return False
+        if response is None:
+            # The archive was recorded without the query; the full collection may have been recorded
+            logger.debug("Could not use {}; it was not recorded in the traffic archive".format(request_uri))
+            return True
+        if response.status in [200, 304]:
+            return False
+        logger.debug("Could not use {}; HTTP status: {}".format(request_uri, response.status))
+        return True
+
+    def read_setup_resource(self, uri):
+        """
+        Reads a resource needed to set up the run
+
+        Design note: A successful read is added to the resource cache so the resource isn't read again when it's
+        tested; a failure isn't cached so the read is tried again during testing instead of being reported as the
+        result of testing the resource
+
+        Args:
+            uri: The URI to get
+
+        Returns:
+            The response for the resource
+        """
+        resource = self.create_resource_entry(uri)
+        if not self.read_mockup(uri, resource):
+            response, response_time, retries = self._redfish_obj.get_timed(
+                uri, headers=self.get_conditional_headers(uri)
+            )
+            if response.status not in [200, 304]:
+                return response
+            self.set_resource_response(uri, resource, response, response_time, retries)
+        response = resource["Response"]
+        if response is not None and response.status == 200 and resource["Oversized"] is None:
+            response = self.cache_resource(uri, resource)["Response"]
+        return response
+
+    def get_link_resource(self, uri, prop_name):
+        """
+        Gets a resource for checking the type of a reference link
+
+        Design note: If the resource is not going to be tested, only the properties needed to check its type are read
+        with $select; the full resource is read with get_resource otherwise so it's not read twice
+
+        Args:
+            uri: The URI of the reference link
+            prop_name: The name of the navigation property containing the reference link
+
+        Returns:
+            An object containing resource information about the URI
+        """
+        resource = self.get_cached_link_resource(uri)
+        if resource is not None:
+            return resource
+        select_uri = self.get_link_select_uri(uri, prop_name)
+        if select_uri is None:
+            return self.get_resource(uri, link_check=not self.is_resource_tested(uri, prop_name))
+
+        # Check if another worker is already reading the link
+        while True:
+            _, pending = self.claim_resource(select_uri)
+            if pending is None:
+                break
+            pending.wait()
+
+        # Not cached; go read it
+        try:
+            resource = self.get_cached_link_resource(uri)
+            if resource is not None:
+                return resource
+            logger.debug("Caching {} for a reference link check...".format(uri))
+            resource = self.create_resource_entry(uri)
+            if not self.check_circuit(uri, resource):
+                try:
+                    response, response_time, retries = self._redfish_obj.get_timed(select_uri, link_check=True)
+                    if not self.is_link_response_usable(select_uri, response):
+                        return self.get_resource(uri, link_check=True)
+                    self.set_resource_response(uri, resource, response, response_time, retries)
+                except RequestBudgetExhausted:
+                    raise
+                except NotRecordedError as err:
+                    # The archive was recorded without $select for this link; the full resource may have been recorded
+                    logger.debug("Could not use {}; {}".format(select_uri, err))
+                    return self.get_resource(uri, link_check=True)
+                except Exception as err:
+                    self.set_resource_exception(uri, resource, err)
+            return self.cache_link_resource(uri, resource)
+        finally:
+            self.end_circuit_trial(uri)
+            self.release_resource(select_uri)
+
+    def get_cached_link_resource(self, uri):
+        """
+        Gets a resource already read for a reference link check or for testing
+
+        Args:
+            uri: The URI of the reference link
+
+        Returns:
+            An object containing resource information about the URI; None if the URI has not been read
+        """
+        key = crawler.canonical_uri(uri)
+        with self._resource_lock:
+            if key in self._resources:
+                return self._resources[key]
+            return self._link_resources.get(key)
+
+    def get_link_select_uri(self, uri, prop_name):
+        """
+        Gets the URI for reading only the type of the resource referenced by a reference link
+
+        Args:
+            uri: The URI of the reference link
+            prop_name: The name of the navigation property containing the reference link
+
+        Returns:
+            The URI to read; None if the full resource needs to be read
+        """
+        if not self._select_supported or self.is_resource_tested(uri, prop_name):
+            return None
+        return "{}{}$select=@odata.type".format(uri, "&" if "?" in uri else "?")
+
+    def is_link_response_usable(self, select_uri, response):
+        """
+        Checks if a response to a request with $select can be used to check the type of a reference link
+
+        Args:
+            select_uri: The URI read with $select
+            response: The response from the service
+
+        Returns:
+            A boolean indicating if the response can be used; the full resource needs to be read otherwise
+        """
+        usable = response.status == 404
+        if response.status == 200:
+            try:
+                usable = isinstance(response.dict.get("@odata.type"), str)
+            except Exception:
+                usable = False
+        if not usable:
+            logger.debug("Could not use {}; HTTP status: {}".format(select_uri, response.status))
+        return usable
+
+    def cache_link_resource(self, uri, resource):
+        """
+        Adds a resource read only for a reference link check to the cache of link resources
+
+        Args:
+            uri: The URI of the reference link
+            resource: The resource information to cache
+
+        Returns:
+            The cached resource information
+        """
+        with self._resource_lock:
+            return self._link_resources.setdefault(crawler.canonical_uri(uri), resource)
+
+    def find_link_uris(self, payload, prop_name=None, link_uris=None):
+        """
+        Finds the reference links in a payload whose targets are read when the payload is validated
+
+        Args:
+            payload: The payload to scan
+            prop_name: The name of the property holding the payload
+            link_uris: The list to update with the reference links found
+
+        Returns:
+            A list of tuples of the URI and the name of the navigation property for each reference link
+        """
+        if link_uris is None:
+            link_uris = []
+        if isinstance(payload, dict):
+            odata_id = payload.get("@odata.id")
+            if (
+                prop_name is not None
+                and len(payload) == 1
+                and isinstance(odata_id, str)
+                and odata_id.startswith("/")
+                and "#" not in odata_id
+            ):
+                link_uris.append((odata_id, prop_name))
+                return link_uris
+            for item, value in payload.items():
+                # Skip OEM extensions if needed
+                if item == "Oem" and self._no_oem:
+                    continue
+                if isinstance(value, dict) or isinstance(value, list):
+                    self.find_link_uris(value, item, link_uris)
+        elif isinstance(payload, list):
+            for value in payload:
+                if isinstance(value, dict) or isinstance(value, list):
+                    self.find_link_uris(value, prop_name, link_uris)
+        return link_uris
+
+    def set_traversal(self, mode, start_uri):
+        """
+        Sets the traversal used to tell which resources are going to be tested
+
+        Args:
+            mode: The traversal mode for the service
+            start_uri: The starting URI for validation
+        """
+        self._traversal = (mode, start_uri)
+
+    def is_resource_tested(self, uri, prop_name):
+        """
+        Checks if a resource referenced by a navigation property is going to be tested as part of the traversal
+
+        Args:
+            uri: The URI of the reference link
+            prop_name: The name of the navigation property containing the reference link
+
+        Returns:
+            A boolean indicating if the resource is going to be tested
+        """
+        if self._traversal is None:
+            return True
+        mode, start_uri = self._traversal
+        if mode == "Single" or prop_name == "OriginOfCondition":
+            # Nothing else is tested in 'Single' mode; OriginOfCondition is never followed
+            return False
+        if not self._uri_filter.allows(uri):
+            return False
+        if mode == "Tree":
+            return uri.startswith(start_uri)
+        return True
+
+    def is_resource_claimed(self, uri):
+        """
+        Checks if a URI has been read or is being read
+
+        Args:
+            uri: The URI to check
+
+        Returns:
+            A boolean indicating if the URI is in the resource cache or has a request in flight
+        """
+        key = crawler.canonical_uri(uri)
+        with self._resource_lock:
+            return key in self._resources or key in self._in_flight
+
+    def claim_resource(self, uri):
+        """
+        Claims a URI for reading so that concurrent callers for the same URI share a single request
+
+        Args:
+            uri: The URI to claim
+
+        Returns:
+            The cached resource information if the URI has already been read, otherwise None
+            An event to wait on if another caller is reading the URI, otherwise None; if both are None, the caller
+            owns the request and needs to call release_resource when finished
+        """
+        key = crawler.canonical_uri(uri)
+        with self._resource_lock:
+            if key in self._resources:
+                return self._resources[key], None
+            if key in self._in_flight:
+                logger.debug("Waiting on the in-flight request for {}...".format(uri))
+                return None, self._in_flight[key]
+            self._in_flight[key] = threading.Event()
+            return None, None
+
+    def release_resource(self, uri):
+        """
+        Releases a URI claimed for reading and wakes up any callers waiting on it
+
+        Args:
+            uri: The URI to release
+        """
+        with self._resource_lock:
+            pending = self._in_flight.pop(crawler.canonical_uri(uri), None)
+        if pending is not None:
+            pending.set()
+
+    def cache_resource(self, uri, resource):
+        """
+        Adds a resource to the resource cache
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information to cache
+
+        Returns:
+            The cached resource information; another worker might have cached the URI first, in which case that copy
+            is kept
+        """
+        with self._resource_lock:
+            return self._resources.setdefault(crawler.canonical_uri(uri), resource)
+
+    def create_resource_entry(self, uri=None):
+        """
+        Creates a new entry for the resource cache
+
+        Args:
+            uri: The spelling of the URI used to read the resource
+
+        Returns:
+            An object for tracking resource information
+        """
+        return {
+            "Uri": uri,
             "Response": None,
             "Validated": False,
             "Exception": None,
@@ -285,36 +1046,184 @@ class SystemUnderTest(object):
             "Mockup": False,
             "StatusCode": None,
             "ResponseTime": None,
+            "Retries": 0,
+            "CircuitOpen": None,
+            "NotRecorded": False,
+            "BytesSent": None,
+            "BytesReceived": None,
+            "BytesUncompressed": None,
+            "Oversized": None,
+            "Unchanged": False,
+            "Restored": False,
         }
+
+    def read_mockup(self, uri, resource):
+        """
+        Populates a resource from the mockup directory, if available
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information to update
+
+        Returns:
+            A boolean indicating if the resource was populated from a mockup
+        """
+        if not self._mockup_dir:
+            return False
         try:
-            if self._mockup_dir:
-                # If a mockup directory was given, see if the resource exists in it
-                uri_dirs = [uri.rstrip("/"), uri.rstrip("/")]
-                uri_dirs[1] = uri_dirs[1].replace("/redfish/v1", "")
-                for directory in uri_dirs:
-                    mockup_file = Path(self._mockup_dir + directory + "/index.json")
-                    if mockup_file.is_file():
-                        # Mockup found; use its contents
-                        with open(mockup_file) as mockup_data:
-                            logger.debug("Found mockup of {}...".format(uri))
-                            mockup_resp = {"Status": 200, "Content": mockup_data.read()}
-                            self._resources[uri]["Response"] = redfish.rest.v1.StaticRestResponse(**mockup_resp)
-                            self._resources[uri]["Mockup"] = True
-                            self._resources[uri]["StatusCode"] = 200
-                            self._resources[uri]["ResponseTime"] = 0
-                            return self._resources[uri]
-            _t0 = time.time()
-            self._resources[uri]["Response"] = self._redfish_obj.get(uri)
-            self._resources[uri]["ResponseTime"] = round((time.time() - _t0) * 1000)  # ms
-            self._resources[uri]["StatusCode"] = self._resources[uri]["Response"].status
-            if self._resources[uri]["Response"].status != 200:
-                logger.critical(
-                    "Could not access {}; HTTP status: {}".format(uri, self._resources[uri]["Response"].status)
-                )
+            # If a mockup directory was given, see if the resource exists in it
+            uri_dirs = [uri.rstrip("/"), uri.rstrip("/")]
+            uri_dirs[1] = uri_dirs[1].replace("/redfish/v1", "")
+            for directory in uri_dirs:
+                mockup_file = Path(self._mockup_dir + directory + "/index.json")
+                if mockup_file.is_file():
+                    if self._max_payload_bytes is not None and mockup_file.stat().st_size > self._max_payload_bytes:
+                        # Not worth reading in; flagged the same way as an oversized response
+                        logger.critical("The mockup of {} is larger than {} bytes".format(uri, self._max_payload_bytes))
+                        resource["Response"] = redfish.rest.v1.StaticRestResponse(Status=200, Content="")
+                        resource["Mockup"] = True
+                        resource["StatusCode"] = 200
+                        resource["ResponseTime"] = 0
+                        resource["Oversized"] = self._max_payload_bytes
+                        return True
+                    # Mockup found; use its contents
+                    with open(mockup_file) as mockup_data:
+                        logger.debug("Found mockup of {}...".format(uri))
+                        mockup_resp = {"Status": 200, "Content": mockup_data.read()}
+                        resource["Response"] = redfish.rest.v1.StaticRestResponse(**mockup_resp)
+                        resource["Mockup"] = True
+                        resource["StatusCode"] = 200
+                        resource["ResponseTime"] = 0
+                        return True
         except Exception as err:
-            self._resources[uri]["Exception"] = err
-            logger.critical("Could not access {}; {}".format(uri, err))
-        return self._resources[uri]
+            self.set_resource_exception(uri, resource, err)
+            return True
+        return False
+
+    def set_resource_response(self, uri, resource, response, response_time, retries=0):
+        """
+        Populates a resource with the response from the service
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information to update
+            response: The response from the service
+            response_time: The time, in milliseconds, for the service to respond
+            retries: The number of retries performed to get the response
+        """
+        self.add_resource_transfer(resource, getattr(response, "transfer", None))
+        if response.status == 304 and self._result_cache is not None:
+            # Not modified since the previous run; use the payload from then
+            cached_response = self._result_cache.get_response(uri)
+            if cached_response is not None:
+                logger.debug("{} is unchanged since the previous run".format(uri))
+                response = cached_response
+                resource["Unchanged"] = True
+        resource["Response"] = response
+        resource["ResponseTime"] = response_time
+        resource["Retries"] = retries
+        resource["StatusCode"] = response.status
+        if getattr(response, "oversized", False):
+            resource["Oversized"] = self._max_payload_bytes
+            logger.critical("The response from {} is larger than {} bytes".format(uri, self._max_payload_bytes))
+        elif response.status != 200:
+            logger.critical("Could not access {}; HTTP status: {}".format(uri, response.status))
+        self._circuit_breaker.record(uri, status=response.status)
+
+    def add_resource_transfer(self, resource, transfer):
+        """
+        Adds the bytes transferred for a request to a resource
+
+        Args:
+            resource: The resource information to update
+            transfer: A dictionary of byte counts; None if nothing was measured
+        """
+        if transfer is None:
+            return
+        for name, count in transfer.items():
+            resource[name] = (resource[name] or 0) + count
+
+    def set_resource_exception(self, uri, resource, err):
+        """
+        Populates a resource with the exception encountered when reading it
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information to update
+            err: The exception
+        """
+        resource["Exception"] = err
+        if isinstance(err, NotRecordedError):
+            # A gap in the traffic archive says nothing about the service
+            resource["NotRecorded"] = True
+            logger.warning("Not testing {}; it was not recorded in the traffic archive".format(uri))
+            return
+        logger.critical("Could not access {}; {}".format(uri, err))
+        self._circuit_breaker.record(uri, error=err)
+
+    def check_circuit(self, uri, resource):
+        """
+        Checks if a resource is to be skipped because requests under one of its parents kept failing
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information to update if the resource is skipped
+
+        Returns:
+            A boolean indicating if the resource is skipped
+        """
+        prefix = self._circuit_breaker.check(uri)
+        if prefix is None:
+            return False
+        logger.debug("Skipping {}; the circuit breaker for {} is open".format(uri, prefix))
+        resource["CircuitOpen"] = prefix
+        return True
+
+    def end_circuit_trial(self, uri):
+        """
+        Ends a circuit breaker trial for a resource if reading it stopped before the outcome was recorded
+
+        Args:
+            uri: The URI of the resource
+        """
+        self._circuit_breaker.release(uri)
+
+    def get_conditional_headers(self, uri):
+        """
+        Gets the HTTP headers for reading a resource only if it changed since the previous run
+
+        Args:
+            uri: The URI of the resource
+
+        Returns:
+            A dictionary of HTTP headers; None if the resource needs to be read in full
+        """
+        if self._result_cache is None:
+            return None
+        etag = self._result_cache.get_etag(uri)
+        if etag is None:
+            return None
+        return {"If-None-Match": etag}
+
+    def get_auth_headers(self, client=None):
+        """
+        Gets the HTTP headers needed to authenticate with the service outside of the Redfish session
+
+        Args:
+            client: The Redfish client holding the session to use; the next client in the pool if not specified
+
+        Returns:
+            A dictionary of HTTP headers
+        """
+        if client is None:
+            client = self._redfish_obj.next_client()
+        session_key = client.get_session_key()
+        if session_key:
+            return {"X-Auth-Token": session_key}
+        authorization_key = client.get_authorization_key()
+        if authorization_key:
+            return {"Authorization": authorization_key}
+        return {}
 
     def get_allow_header(self, uri):
         """
@@ -326,13 +1235,14 @@ class SystemUnderTest(object):
         Returns:
             A string containing the Allow header
         """
-        if uri not in self._resources:
+        resource = self._resources.get(crawler.canonical_uri(uri))
+        if resource is None:
             return None
-        if self._resources[uri]["Response"] is None:
+        if resource["Response"] is None:
             return None
-        if self._resources[uri]["Mockup"]:
+        if resource["Mockup"]:
             return None
-        return self._resources[uri]["Response"].getheader("Allow")
+        return resource["Response"].getheader("Allow")
 
     def is_mockup(self, uri):
         """
@@ -344,9 +1254,10 @@ class SystemUnderTest(object):
         Returns:
             A boolean indicating if the response is from a mockup
         """
-        if uri not in self._resources:
+        resource = self._resources.get(crawler.canonical_uri(uri))
+        if resource is None:
             return False
-        return self._resources[uri]["Mockup"]
+        return resource["Mockup"]
 
     def add_resource_result(self, uri, prop, present, value, result):
         """
@@ -359,12 +1270,13 @@ class SystemUnderTest(object):
             value: The value of the property that was tested
             result: A tuple containing the test results
         """
-        if uri in self._resources:
-            if prop in self._resources[uri]["Results"]:
+        resource = self._resources.get(crawler.canonical_uri(uri))
+        if resource is not None:
+            if prop in resource["Results"]:
                 # Only log the first results request
                 return
             # Add the results
-            self._resources[uri]["Results"][prop] = {"Result": result[0], "Value": None, "Message": result[1]}
+            resource["Results"][prop] = {"Result": result[0], "Value": None, "Message": result[1]}
             # Build up a test report-friendly value to uses
             if prop != "":
                 if present:
@@ -383,40 +1295,72 @@ class SystemUnderTest(object):
                         value_str = str(value)
                 else:
                     value_str = "[Not Present]"
-                self._resources[uri]["Results"][prop]["Value"] = value_str
+                resource["Results"][prop]["Value"] = value_str
                 combined_msg = "{} - {} ({}): {}".format(result[0], prop, value_str, result[1])
             else:
-                self._resources[uri]["Results"][prop]["Value"] = "[Resource-level]"
+                resource["Results"][prop]["Value"] = "[Resource-level]"
                 combined_msg = "{} - {}".format(result[0], result[1])
-            # Tally the results
-            if result[0] == "FAIL":
-                self._fail_count += 1
-                self._resources[uri]["Fail"] += 1
-                logger.error(combined_msg)
-            elif result[0] == "WARN":
-                self._warn_count += 1
-                self._resources[uri]["Warn"] += 1
-                logger.warning(combined_msg)
-            elif result[0] == "SKIP":
-                self._skip_count += 1
-                self._resources[uri]["Skip"] += 1
-                logger.info(combined_msg)
+            self.tally_resource_result(resource, result[0], result[1], combined_msg)
+
+    def tally_resource_result(self, resource, result, message, combined_msg):
+        """
+        Adds a test result to the totals for the resource and the service
+
+        Args:
+            resource: The resource information to update
+            result: The result of the test
+            message: The message for the result
+            combined_msg: The message to log for the result
+        """
+        if result == "FAIL":
+            self._fail_count += 1
+            resource["Fail"] += 1
+            logger.error(combined_msg)
+        elif result == "WARN":
+            self._warn_count += 1
+            resource["Warn"] += 1
+            logger.warning(combined_msg)
+        elif result == "SKIP":
+            self._skip_count += 1
+            resource["Skip"] += 1
+            logger.info(combined_msg)
+        else:
+            self._pass_count += 1
+            resource["Pass"] += 1
+            logger.info(combined_msg)
+        # Update the error bucket
+        if result == "FAIL" or result == "WARN":
+            try:
+                error_type = message.split(":")[0]
+                dest = self._error_classes
+                if result == "WARN":
+                    dest = self._warning_classes
+                if error_type not in dest:
+                    dest[error_type] = 0
+                dest[error_type] += 1
+            except:
+                logger.critical("Error message string '{}' is not formatted correctly".format(message))
+
+    def restore_resource_results(self, uri, results):
+        """
+        Adds the test results of a resource from a previous run
+
+        Args:
+            uri: The URI of the resource
+            results: A dictionary of the results from the previous run, keyed by property path
+        """
+        resource = self._resources.get(crawler.canonical_uri(uri))
+        if resource is None:
+            return
+        for prop, entry in results.items():
+            if prop in resource["Results"]:
+                continue
+            resource["Results"][prop] = dict(entry)
+            if prop != "":
+                combined_msg = "{} - {} ({}): {}".format(entry["Result"], prop, entry["Value"], entry["Message"])
             else:
-                self._pass_count += 1
-                self._resources[uri]["Pass"] += 1
-                logger.info(combined_msg)
-            # Update the error bucket
-            if result[0] == "FAIL" or result[0] == "WARN":
-                try:
-                    error_type = result[1].split(":")[0]
-                    dest = self._error_classes
-                    if result[0] == "WARN":
-                        dest = self._warning_classes
-                    if error_type not in dest:
-                        dest[error_type] = 0
-                    dest[error_type] += 1
-                except:
-                    logger.critical("Error message string '{}' is not formatted correctly".format(result[1]))
+                combined_msg = "{} - {}".format(entry["Result"], entry["Message"])
+            self.tally_resource_result(resource, entry["Result"], entry["Message"], combined_msg)
 
     def set_resource_validated(self, uri):
         """
@@ -425,14 +1369,15 @@ class SystemUnderTest(object):
         Args:
             uri: The URI of the resource
         """
-        if uri in self._resources:
-            self._resources[uri]["Validated"] = True
+        resource = self._resources.get(crawler.canonical_uri(uri))
+        if resource is not None:
+            resource["Validated"] = True
             logger.log_print(
                 "  - Pass: {}, Warn: {}, Fail: {}, Skip: {}".format(
-                    self._resources[uri]["Pass"],
-                    self._resources[uri]["Warn"],
-                    self._resources[uri]["Fail"],
-                    self._resources[uri]["Skip"],
+                    resource["Pass"],
+                    resource["Warn"],
+                    resource["Fail"],
+                    resource["Skip"],
                 )
             )
 
@@ -471,12 +1416,19 @@ class SystemUnderTest(object):
                     or item == "TargetComponentURI"
                 ):
                     if isinstance(payload[item], str):
-                        if payload[item].startswith("/") and "#" not in payload[item]:
-                            uri_list.append(payload[item])
-                            if from_annotation and payload[item] not in self._annotation_uris:
-                                self._annotation_uris.append(payload[item])
-                            if from_collection_capabilities and payload[item] not in self._collection_capabilities_uris:
-                                self._collection_capabilities_uris.append(payload[item])
+                        # Filtered URIs are left out here so they're never requested
+                        if (
+                            payload[item].startswith("/")
+                            and "#" not in payload[item]
+                            and self._uri_filter.allows(payload[item])
+                        ):
+                            # Other spellings of a URI already found are followed with the first spelling
+                            uri_list.append(self.get_uri_spelling(payload[item]))
+                            key = crawler.canonical_uri(payload[item])
+                            if from_annotation and key not in self._annotation_uris:
+                                self._annotation_uris.append(key)
+                            if from_collection_capabilities and key not in self._collection_capabilities_uris:
+                                self._collection_capabilities_uris.append(key)
 
                 # If the item is an object or array, scan one level deeper
                 elif isinstance(payload[item], dict) or isinstance(payload[item], list):
@@ -491,55 +1443,434 @@ class SystemUnderTest(object):
                 if isinstance(item, dict) or isinstance(item, list):
                     self.find_uris(item, uri_list, from_annotation, from_collection_capabilities)
 
-    def validate(self, mode, start_uri, uri):
+    def validate(self, mode, start_uri, uri, order="DFS"):
         """
-        Performs validation of the service, recursively
+        Performs validation of the service
+
+        Design note: URIs waiting to be tested are held in a work queue rather than on the call stack so that deep
+        chains of links do not run into the recursion limit.  The links in each resource are added to the work queue
+        as soon as its payload arrives, and the next resource in the queue is read on a background thread while the
+        resource is validated, so it's usually cached by the time it's tested.
 
         Args:
             mode: The traversal mode for the service
             start_uri: The starting URI for validation
             uri: The URI to test
+            order: The order for visiting URIs
+        """
+        frontier = crawler.Frontier(order, self._history.get_priority(order))
+        frontier.push([self.get_uri_spelling(uri)])
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        prefetched = None
+
+        def prefetch(uris):
+            nonlocal prefetched
+            frontier.push(uris)
+            next_uri = frontier.peek()
+            if next_uri is None:
+                return
+            if prefetched is not None:
+                # Only the next resource is worth reading ahead; drop the last one if it hasn't started
+                prefetched.cancel()
+            prefetched = prefetcher.submit(crawler.read_resource, self, next_uri)
+
+        try:
+            while len(frontier) > 0:
+                if self.time_is_up():
+                    self.set_unvisited(frontier.remaining())
+                    break
+                # The next URIs are added to the frontier by prefetch
+                self.validate_resource(mode, start_uri, frontier.pop(), prefetch)
+                self.save_progress(frontier.remaining)
+        finally:
+            # Finish the request in flight, but drop anything not started
+            prefetcher.shutdown(cancel_futures=True)
+            self.save_progress(frontier.remaining, force=True)
+
+    def time_is_up(self):
+        """
+        Checks if the time allowed for testing has run out
+
+        Returns:
+            A boolean indicating if new resources are not to be tested
+        """
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def set_unvisited(self, uris):
+        """
+        Records the resources left untested when testing stopped at the time limit
+
+        Args:
+            uris: The URIs waiting to be tested
+        """
+        unvisited = []
+        seen = set()
+        for uri in uris:
+            key = crawler.canonical_uri(uri)
+            resource = self._resources.get(key)
+            if key not in seen and (resource is None or not resource["Validated"]):
+                unvisited.append(uri)
+            seen.add(key)
+        self._unvisited = unvisited
+        logger.critical("Stopping the test at the time limit; {} resources were not tested".format(len(unvisited)))
+
+    def validate_resource(self, mode, start_uri, uri, prefetch=None):
+        """
+        Performs validation of a single resource and finds the next URIs to test
+
+        Args:
+            mode: The traversal mode for the service
+            start_uri: The starting URI for validation
+            uri: The URI to test
+            prefetch: A function to call with the next URIs to test before the resource is validated
+
+        Returns:
+            A list of URIs found in the resource that need to be tested
         """
         # Get the URI
+        self.set_traversal(mode, start_uri)
         resource = self.get_resource(uri)
         if resource["Validated"]:
-            # Already tested
-            return
+            if not resource["Restored"]:
+                # Already tested
+                return []
+            # Tested before the run was resumed; follow its links again to pick up the traversal where it stopped
+            resource["Restored"] = False
+            payload, _ = validate.validate_response(resource)
+            if payload is None:
+                return []
+            self.apply_collection_limits(payload, uri)
+            self.expand_collection(uri)
+            next_uris = self.find_next_uris(mode, start_uri, payload)
+            if prefetch is not None:
+                prefetch(next_uris)
+            return next_uris
         logger.log_print("Validating {}...".format(uri))
 
         # Check for exception cases that would fail the entire resource
         payload, result = validate.validate_response(resource)
+        resource["Uri"] = self.get_resource_identity(uri, payload)
         if payload is None:
             # Can't perform validation; stop here
             self.add_resource_result(uri, "", False, None, result)
             self.set_resource_validated(uri)
+            self.keep_resource_results(uri, resource)
+            return []
+
+        # Validate the payload; read collection members up front so reference link checks are served from the cache
+        self.apply_collection_limits(payload, uri)
+        self.expand_collection(uri)
+        next_uris = self.find_next_uris(mode, start_uri, payload)
+        if prefetch is not None:
+            prefetch(next_uris)
+        if resource["Unchanged"]:
+            # The service reported the resource is unchanged since the previous run, so the results are too
+            self.restore_resource_results(uri, self._result_cache.get_results(uri))
+            self.set_resource_validated(uri)
+            self.keep_resource_results(uri, resource)
+            return next_uris
+        try:
+            validate.validate_object(self, resource["Uri"], payload, payload, None, None, None, "")
+        except RequestBudgetExhausted:
+            # Keep what was tested so far
+            self.add_resource_result(
+                uri, "", False, None, ("SKIP", "Not Tested: The request budget ran out while testing the resource.")
+            )
+            self.set_resource_validated(uri)
+            raise
+        if resource["Mockup"]:
+            self.add_resource_result(
+                uri, "", False, None, ("WARN", "Mockup Used Warning: Response was populated from a mockup file.")
+            )
+        self.set_resource_validated(uri)
+        self.keep_resource_results(uri, resource)
+
+        return next_uris
+
+    def keep_resource_results(self, uri, resource):
+        """
+        Keeps the results of a fully tested resource in the checkpoint, and so they can be reused in the next run if
+        it doesn't change
+
+        Args:
+            uri: The URI of the resource
+            resource: The resource information after testing
+        """
+        if self._checkpoint is not None:
+            self._checkpoint.add_resource(uri, resource)
+        if self._result_cache is not None:
+            self._result_cache.add(uri, resource)
+
+    def save_progress(self, get_pending, force=False):
+        """
+        Saves the progress of the run to the checkpoint if it's time to do so
+
+        Args:
+            get_pending: A function that gets the URIs found but not tested yet
+            force: Indicates if the progress is saved regardless of the time since it was last saved
+        """
+        if self._checkpoint is None or not (force or self._checkpoint.is_due()):
             return
+        counters = {
+            "Pass": self._pass_count,
+            "Warn": self._warn_count,
+            "Fail": self._fail_count,
+            "Skip": self._skip_count,
+            "ErrorClasses": dict(self._error_classes),
+            "WarningClasses": dict(self._warning_classes),
+            "Transfer": self.transfer,
+        }
+        self._checkpoint.save_progress(get_pending(), counters)
+
+    def restore_checkpoint(self, resources):
+        """
+        Adds the resources tested before the run was resumed
 
-        # For resource collection, apply collection limits by removing members from the payload
+        Args:
+            resources: A dictionary of the resources saved in the checkpoint, keyed by URI
+        """
+        for uri, saved in resources.items():
+            key = crawler.canonical_uri(uri)
+            self.get_uri_spelling(uri)
+            resource = checkpoint.restore_resource(saved)
+            resource["Validated"] = True
+            resource["Restored"] = True
+            with self._resource_lock:
+                counted = key in self._resources
+                self._resources[key] = resource
+            if not counted:
+                # Resources read while setting up this run are already in the totals
+                self._redfish_obj.add_transfer({name: resource[name] or 0 for name in new_transfer()})
+            self.restore_resource_results(uri, saved["Results"])
+            if self._result_cache is not None:
+                self._result_cache.add(uri, resource)
+        logger.info("Resuming the run; {} resources were already tested".format(len(resources)))
+
+    def get_collection_member_type(self, payload):
+        """
+        Gets the type of members in a resource collection
+
+        Args:
+            payload: The payload to inspect
+
+        Returns:
+            The member type if the payload is a resource collection, otherwise None
+        """
         resource_type = payload.get("@odata.type")
         if isinstance(resource_type, str):
             match = re.match(r"^#(.+)Collection\..+Collection$", resource_type)
-            if match and match[1] in self._collection_limits:
-                if "Members" in payload and isinstance(payload["Members"], list):
-                    payload["Members"] = payload["Members"][: self._collection_limits[match[1]]]
-                payload.pop("Members@odata.nextLink", None)
+            if match:
+                return match[1]
+        return None
 
-        # Validate the payload
-        validate.validate_object(self, uri, payload, payload, None, None, None, "")
-        if resource["Mockup"]:
-            self.add_resource_result(
-                uri, "", False, None, ("WARN", "Mockup Used Warning: Response was populated from a mockup file.")
-            )
-        self.set_resource_validated(uri)
+    def apply_collection_limits(self, payload, uri=None):
+        """
+        For resource collections, applies collection limits by removing members from the payload; log entry
+        collections without a limit only keep the entries added since the previous run and a few older ones
+
+        Args:
+            payload: The payload to update
+            uri: The URI of the resource
+        """
+        member_type = self.get_collection_member_type(payload)
+        if member_type in self._collection_limits:
+            if "Members" in payload and isinstance(payload["Members"], list):
+                payload["Members"] = payload["Members"][: self._collection_limits[member_type]]
+            payload.pop("Members@odata.nextLink", None)
+        elif member_type == "LogEntry" and uri is not None and isinstance(payload.get("Members"), list):
+            payload["Members"] = self._log_history.select_members(uri, payload)
+
+    def get_collection_limit(self, uri):
+        """
+        Gets the collection limit for a URI based on the URI patterns of the limited resource collections in schema
+
+        Args:
+            uri: The URI to check
 
-        # Go through its contents and get the next URIs to test
+        Returns:
+            The collection limit if the URI is for a limited resource collection, otherwise None
+        """
+        if self._collection_limit_uris is None:
+            # Schema files are parsed after the service is set up; build the patterns on first use after that
+            if not metadata.parsed_schemas:
+                return None
+            collection_limit_uris = []
+            for member_type, limit in self._collection_limits.items():
+                collection_type = "{0}Collection.{0}Collection".format(member_type)
+                collection_def = metadata.get_object_definition(collection_type, collection_type)
+                if collection_def is not None and collection_def["AllowedURIs"]:
+                    for allowed_uri in collection_def["AllowedURIs"]:
+                        collection_limit_uris.append((re.compile(allowed_uri), limit))
+            self._collection_limit_uris = collection_limit_uris
+        path = uri.split("?")[0]
+        for allowed_uri, limit in self._collection_limit_uris:
+            if allowed_uri.match(path):
+                return limit
+        return None
+
+    def get_request_uri(self, uri):
+        """
+        Gets the URI to request from the service when reading a resource; if the service supports $top, collection
+        limits are passed to the service so it doesn't send members that would be thrown away
+
+        Args:
+            uri: The URI of the resource
+
+        Returns:
+            The URI to request
+        """
+        if not self._top_supported or "$top=" in uri or "$skip=" in uri:
+            return uri
+        limit = self.get_collection_limit(uri)
+        if limit is None:
+            return uri
+        return "{}{}$top={}".format(uri, "&" if "?" in uri else "?", limit)
+
+    def get_expand_uri(self, uri):
+        """
+        Gets the URI for reading the members of a resource collection with $expand
+
+        Args:
+            uri: The URI of the resource collection
+
+        Returns:
+            The URI to read, or None if the members are to be read one at a time
+        """
+        if self._expand_query is None or self._circuit_breaker.is_open(uri):
+            return None
+        with self._resource_lock:
+            resource = self._resources.get(crawler.canonical_uri(uri))
+        if resource is None or resource["Response"] is None or resource["Response"].status != 200:
+            return None
+        try:
+            payload = resource["Response"].dict
+        except Exception:
+            return None
+        if not isinstance(payload, dict) or not isinstance(payload.get("Members"), list):
+            return None
+        member_type = self.get_collection_member_type(payload)
+        if member_type is None:
+            return None
+        member_count = len(payload["Members"])
+        self.apply_collection_limits(payload, uri)
+        if len(payload["Members"]) < member_count:
+            # Expanding would read members that are not going to be tested; the service didn't page the collection
+            return None
+
+        # Only worth it if it saves requests
+        uncached = 0
+        for member in payload["Members"]:
+            if isinstance(member, dict) and isinstance(member.get("@odata.id"), str):
+                member_uri = member["@odata.id"]
+                if self.get_conditional_headers(member_uri) is not None:
+                    # Members kept from the previous run are read one at a time so unchanged ones aren't sent again
+                    return None
+                if not self.is_resource_claimed(member_uri) and self._uri_filter.allows(member_uri):
+                    uncached += 1
+        if uncached < 2:
+            return None
+        request_uri = self.get_request_uri(uri)
+        return "{}{}{}".format(request_uri, "&" if "?" in request_uri else "?", self._expand_query)
+
+    def expand_collection(self, uri):
+        """
+        Reads the members of a resource collection with $expand and adds them to the resource cache
+
+        Args:
+            uri: The URI of the resource collection
+        """
+        expand_uri = self.get_expand_uri(uri)
+        if expand_uri is None:
+            return
+        _, pending = self.claim_resource(expand_uri)
+        if pending is not None:
+            # Another worker is already reading the members
+            pending.wait()
+            return
+        try:
+            if self.get_expand_uri(uri) is None:
+                # Another worker read the members in the meantime
+                return
+            logger.debug("Caching members of {} with $expand...".format(uri))
+            try:
+                response = self._redfish_obj.get(expand_uri)
+            except Exception as err:
+                logger.debug("Could not read {}; {}".format(expand_uri, err))
+                return
+            self.cache_expanded_members(uri, expand_uri, response)
+        finally:
+            self.release_resource(expand_uri)
+
+    def cache_expanded_members(self, uri, expand_uri, response):
+        """
+        Adds the members of a resource collection read with $expand to the resource cache
+
+        Design note: Members are cached under their own '@odata.id' so link checks and traversal find them as if they
+        were read one at a time; members that were already read are left alone.  The bytes transferred for the request
+        are added to the resource collection since the members don't have a response of their own.
+
+        Args:
+            uri: The URI of the resource collection
+            expand_uri: The URI used to read the resource collection
+            response: The response from the service
+        """
+        with self._resource_lock:
+            collection = self._resources.get(crawler.canonical_uri(uri))
+            if collection is not None:
+                self.add_resource_transfer(collection, getattr(response, "transfer", None))
+        try:
+            members = response.dict.get("Members") if response.status == 200 else None
+        except Exception:
+            members = None
+        if not isinstance(members, list):
+            # Members will be read one at a time instead
+            logger.debug("Could not use the response from {}; HTTP status: {}".format(expand_uri, response.status))
+            return
+        count = 0
+        for member in members:
+            if not isinstance(member, dict) or not isinstance(member.get("@odata.id"), str):
+                continue
+            if "@odata.type" not in member:
+                # The service only returned the reference
+                continue
+            resource = self.create_resource_entry(member["@odata.id"])
+            resource["Response"] = redfish.rest.v1.StaticRestResponse(Status=200, Content=json.dumps(member), Headers={})
+            resource["StatusCode"] = 200
+            etag = member.get("@odata.etag")
+            if (
+                self._result_cache is not None
+                and etag is not None
+                and etag == self._result_cache.get_etag(member["@odata.id"])
+            ):
+                # The same version as in the previous run, so the results are too
+                logger.debug("{} is unchanged since the previous run".format(member["@odata.id"]))
+                resource["Unchanged"] = True
+            key = crawler.canonical_uri(member["@odata.id"])
+            with self._resource_lock:
+                if key in self._resources or key in self._in_flight:
+                    continue
+                self._resources[key] = resource
+            count += 1
+        logger.debug("Cached {} members from {}".format(count, expand_uri))
+
+    def find_next_uris(self, mode, start_uri, payload):
+        """
+        Finds the URIs in a payload that need to be tested based on the traversal mode
+
+        Args:
+            mode: The traversal mode for the service
+            start_uri: The starting URI for validation
+            payload: The payload to scan
+
+        Returns:
+            A list of URIs to test
+        """
         if mode == "Single":
             # Nothing else to do; don't scan deeper
-            return
+            return []
         next_uris = []
         self.find_uris(payload, next_uris, False, False)
-        for next_uri in next_uris:
-            if mode == "Tree" and not next_uri.startswith(start_uri):
-                # In 'Tree' mode, skip URIs that are not subordinate to the starting URI
-                continue
-            self.validate(mode, start_uri, next_uri)
+        if mode == "Tree":
+            # In 'Tree' mode, skip URIs that are not subordinate to the starting URI
+            next_uris = [next_uri for next_uri in next_uris if next_uri.startswith(start_uri)]
+        return next_uris
@@ -0,0 +1,254 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Traffic Archive
+
+File : traffic_archive.py
+
+Brief : This file contains the definitions and functionalities for recording
+        the responses from the service and replaying them without the
+        service.
+"""
+
+import json
+import threading
+import zipfile
+
+import redfish
+
+from redfish_service_validator import logger
+from redfish_service_validator.crawler import canonical_uri
+
+ARCHIVE_VERSION = 1
+INDEX_FILE = "index.json"
+
+# Response headers not worth keeping; they only make sense for the session that received them
+SKIPPED_HEADERS = [
+    "set-cookie",
+    "x-auth-token",
+    "connection",
+    "keep-alive",
+    "transfer-encoding",
+    "content-encoding",
+    "content-length",
+]
+
+
+class NotRecordedError(Exception):
+    """
+    Raised when replaying a request for a URI that was not recorded in the traffic archive
+    """
+
+    pass
+
+
+class TrafficRecorder(object):
+    """
+    Records the GET responses from the service to an archive
+
+    Design note: The archive is a ZIP file with each response body in its own compressed member, written as responses
+    arrive, and an index of the responses by URI, written when recording is closed.  Requests are keyed by their
+    canonical URI, including query parameters, so '$expand', '$select', and '$top' reads are kept apart; if a URI is
+    read more than once, the last response is kept.
+
+    Args:
+        path: The path of the archive to create
+        rhost: The address of the Redfish service
+    """
+
+    def __init__(self, path, rhost):
+        self._path = path
+        self._rhost = rhost
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._index = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def add(self, uri, response, response_time):
+        """
+        Adds a response to the archive
+
+        Args:
+            uri: The URI requested
+            response: The response from the service
+            response_time: The time, in milliseconds, for the service to respond
+        """
+        headers = {}
+        for name, value in response.getheaders():
+            if name.lower() not in SKIPPED_HEADERS:
+                headers[name] = value
+        entry = {
+            "Uri": uri,
+            "Status": response.status,
+            "Headers": headers,
+            "ResponseTime": response_time,
+            "Transfer": getattr(response, "transfer", None),
+            "Oversized": getattr(response, "oversized", False),
+        }
+        body = response.text.encode("utf-8")
+        with self._lock:
+            if self._zip is None:
+                return
+            self._count += 1
+            entry["Member"] = "responses/{:06d}.json".format(self._count)
+            self._zip.writestr(entry["Member"], body)
+            self._index[canonical_uri(uri)] = entry
+
+    def close(self):
+        """
+        Writes the index and closes the archive
+        """
+        with self._lock:
+            if self._zip is None:
+                return
+            index = {"Version": ARCHIVE_VERSION, "Service": self._rhost, "Responses": self._index}
+            self._zip.writestr(INDEX_FILE, json.dumps(index, indent=1, sort_keys=True))
+            self._zip.close()
+            self._zip = None
+        logger.info("Recorded {} responses to {}".format(len(self._index), self._path))
+
+
+class TrafficArchive(object):
+    """
+    Serves responses recorded with TrafficRecorder
+
+    Args:
+        path: The path of the archive to read
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._zip = zipfile.ZipFile(path, "r")
+        self._lock = threading.Lock()
+        try:
+            index = json.loads(self._zip.read(INDEX_FILE))
+        except KeyError:
+            raise ValueError("{} does not have an index; the recording did not finish".format(path))
+        if index.get("Version") != ARCHIVE_VERSION:
+            raise ValueError("{} is not a supported traffic archive".format(path))
+        self._service = index.get("Service")
+        self._index = index["Responses"]
+        logger.info("Replaying {} responses recorded from {}".format(len(self._index), self._service))
+
+    @property
+    def service(self):
+        """
+        Accesses the address of the Redfish service that was recorded
+
+        Returns:
+            The address of the Redfish service
+        """
+        return self._service
+
+    def get(self, uri):
+        """
+        Gets the recorded response for a URI; raises NotRecordedError if the URI was not recorded
+
+        Args:
+            uri: The URI requested
+
+        Returns:
+            The recorded response
+            The time, in milliseconds, the service took to respond when recorded
+        """
+        entry = self._index.get(canonical_uri(uri))
+        if entry is None:
+            raise NotRecordedError("{} was not recorded in {}".format(uri, self._path))
+        with self._lock:
+            # ZIP members are read one at a time
+            body = self._zip.read(entry["Member"]).decode("utf-8")
+        response = redfish.rest.v1.StaticRestResponse(Status=entry["Status"], Content=body, Headers=entry["Headers"])
+        response.transfer = entry["Transfer"]
+        response.oversized = entry["Oversized"]
+        return response, entry["ResponseTime"]
+
+
+class ReplayClient(object):
+    """
+    Stands in for the Redfish client when replaying an archive; nothing is sent over the network and there is no
+    session to log in to
+
+    Args:
+        archive: The traffic archive
+        default_prefix: The URI of the service root
+    """
+
+    def __init__(self, archive, default_prefix="/redfish/v1/"):
+        self._archive = archive
+        self.default_prefix = default_prefix
+        self.login_url = None
+        try:
+            self.root_resp, self.root_time = archive.get(default_prefix)
+        except NotRecordedError:
+            raise ValueError("The archive does not have the service root")
+        if self.root_resp.status != 200:
+            raise ValueError("The archive does not have the service root")
+        self.root = self.root_resp.dict
+
+    def get(self, path, args=None, headers=None, timeout=None, max_retry=None):
+        """
+        Performs a GET request on the archive
+
+        Args:
+            path: The URI to get
+            args: Query parameters; not used
+            headers: Request headers; not used
+            timeout: The HTTP timeout; not used
+            max_retry: The number of retries; not used
+
+        Returns:
+            The recorded response; its 'response_time' attribute holds the time recorded for it
+        """
+        response, response_time = self._archive.get(path)
+        response.response_time = response_time
+        return response
+
+    def login(self, *args, **kwargs):
+        """
+        Logs in to the service; nothing to do for an archive
+        """
+        pass
+
+    def logout(self):
+        """
+        Logs out of the service; nothing to do for an archive
+        """
+        pass
+
+    def get_session_key(self):
+        """
+        Accesses the session key
+
+        Returns:
+            None; there is no session
+        """
+        return None
+
+    def set_session_key(self, session_key):
+        """
+        Sets the session key; nothing to do for an archive
+
+        Args:
+            session_key: The session key
+        """
+        pass
+
+    def set_session_location(self, session_location):
+        """
+        Sets the session location; nothing to do for an archive
+
+        Args:
+            session_location: The session location
+        """
+        pass
+
+    def get_authorization_key(self):
+        """
+        Accesses the authorization key
+
+        Returns:
+            None; there are no credentials
+        """
+        return None
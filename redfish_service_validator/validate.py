@@ -57,9 +57,26 @@ def validate_response(resource):
         A dictionary of the JSON payload contents of the response; None if invalid
         A tuple containing error information; None if no errors
     """
+    if resource.get("CircuitOpen"):
+        # Skipped since requests under a parent kept failing
+        return None, (
+            "SKIP",
+            "Not Tested: Circuit open; requests under {} failed repeatedly.".format(resource["CircuitOpen"]),
+        )
+    if resource.get("NotRecorded"):
+        # Replaying an archive that doesn't have the response
+        return None, ("SKIP", "Not Tested: Replay gap; the URI was not recorded in the traffic archive.")
     if resource["Response"] is None:
         # We need a response...
         return None, ("FAIL", "Resource Error: Exception when accessing the URI ({}).".format(resource["Exception"]))
+    if resource.get("Oversized"):
+        # The body was dropped for going over the payload size limit
+        return None, (
+            "WARN",
+            "Payload Size Warning: The response is larger than the limit of {} bytes; the payload was not tested.".format(
+                resource["Oversized"]
+            ),
+        )
     if resource["Response"].status != 200:
         # The response need to return a 200...
         return None, (
@@ -627,7 +644,7 @@ def validate_value(
                     # Verify the referenced link contains the correct type of resource
                     if value["@odata.id"].startswith("/") and "#" not in value["@odata.id"]:
                         # Get the referenced resource
-                        resource = sut.get_resource(value["@odata.id"])
+                        resource = sut.get_link_resource(value["@odata.id"], prop_name)
 
                         # Special handling for OriginOfCondition with 404 responses
                         # In logs, OriginOfCondition can reference a resource that no longer exists
@@ -33,4 +33,5 @@ setup(
         ]
     },
     install_requires=["redfish>=3.1.5", "redfish_utilities>=3.4.8", "requests", "colorama", "openpyxl>=3.1.3"],
+    extras_require={"asyncio": ["aiohttp"]},
 )
@@ -0,0 +1,234 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Fake Service
+
+File : fake_service.py
+
+Brief : This file contains a small Redfish service on the loopback interface
+        for testing the crawl engines without a real service.
+"""
+
+import collections
+import contextlib
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import unquote
+
+from redfish_service_validator.system_under_test import SystemUnderTest
+
+
+def make_resources():
+    """
+    Builds the resources of the fake service
+
+    Returns:
+        A dictionary of payloads, keyed by URI
+    """
+    resources = {}
+
+    def add(uri, resource_type, **properties):
+        resources[uri] = {"@odata.id": uri, "@odata.type": resource_type, "Id": uri.rsplit("/", 1)[-1], "Name": "Fake"}
+        resources[uri].update(properties)
+
+    def add_collection(uri, member_type, members):
+        add(
+            uri,
+            "#{0}Collection.{0}Collection".format(member_type),
+            Members=[{"@odata.id": member} for member in members],
+            **{"Members@odata.count": len(members)},
+        )
+
+    add(
+        "/redfish/v1",
+        "#ServiceRoot.v1_5_0.ServiceRoot",
+        Systems={"@odata.id": "/redfish/v1/Systems"},
+        Chassis={"@odata.id": "/redfish/v1/Chassis"},
+        Managers={"@odata.id": "/redfish/v1/Managers"},
+    )
+    add_collection("/redfish/v1/Systems", "ComputerSystem", ["/redfish/v1/Systems/1", "/redfish/v1/Systems/2"])
+    add(
+        "/redfish/v1/Systems/1",
+        "#ComputerSystem.v1_5_0.ComputerSystem",
+        Bios={"@odata.id": "/redfish/v1/Systems/1/Bios"},
+        LogServices={"@odata.id": "/redfish/v1/Systems/1/LogServices"},
+        Links={"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}]},
+    )
+    add(
+        "/redfish/v1/Systems/2",
+        "#ComputerSystem.v1_5_0.ComputerSystem",
+        # Another spelling of a URI found elsewhere
+        Links={"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1/"}]},
+    )
+    add("/redfish/v1/Systems/1/Bios", "#Bios.v1_0_0.Bios", AttributeRegistry="Fake")
+    add_collection("/redfish/v1/Systems/1/LogServices", "LogService", ["/redfish/v1/Systems/1/LogServices/Log"])
+    add(
+        "/redfish/v1/Systems/1/LogServices/Log",
+        "#LogService.v1_1_0.LogService",
+        Entries={"@odata.id": "/redfish/v1/Systems/1/LogServices/Log/Entries"},
+    )
+    entries = ["/redfish/v1/Systems/1/LogServices/Log/Entries/{}".format(index) for index in range(3, 0, -1)]
+    add_collection("/redfish/v1/Systems/1/LogServices/Log/Entries", "LogEntry", entries)
+    for entry in entries:
+        add(
+            entry,
+            "#LogEntry.v1_4_0.LogEntry",
+            EntryType="Event",
+            Links={"OriginOfCondition": {"@odata.id": "/redfish/v1/Systems/1"}},
+        )
+    # The second chassis is listed, but reading it fails
+    add_collection("/redfish/v1/Chassis", "Chassis", ["/redfish/v1/Chassis/1", "/redfish/v1/Chassis/2"])
+    add(
+        "/redfish/v1/Chassis/1",
+        "#Chassis.v1_5_0.Chassis",
+        ChassisType="RackMount",
+        Links={"ComputerSystems": [{"@odata.id": "/redfish/v1/Systems/1"}, {"@odata.id": "/redfish/v1/Systems/2"}]},
+    )
+    add_collection("/redfish/v1/Managers", "Manager", ["/redfish/v1/Managers/1"])
+    add("/redfish/v1/Managers/1", "#Manager.v1_5_0.Manager", FirmwareVersion="1.0.0", Model="Fake")
+    return resources
+
+
+class FakeService(object):
+    """
+    Serves Redfish resources over HTTP on the loopback interface and counts the requests for each URI
+
+    Args:
+        resources: A dictionary of payloads, keyed by URI; the resources from make_resources if not specified
+        delay: The time, in seconds, to wait before each response
+    """
+
+    def __init__(self, resources=None, delay=0):
+        self.resources = make_resources() if resources is None else resources
+        self.delay = delay
+        self.requests = collections.Counter()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with service._lock:
+                    service.requests[self.path] += 1
+                if service.delay:
+                    time.sleep(service.delay)
+                uri = unquote(self.path.split("?")[0]).rstrip("/")
+                if uri == "/redfish":
+                    self.send_json(200, {"v1": "/redfish/v1/"})
+                elif uri in service.resources:
+                    self.send_json(200, service.resources[uri])
+                else:
+                    self.send_json(404, {"error": {"code": "Base.1.0.GeneralError", "message": "Not found"}})
+
+            def do_POST(self):
+                self.send_json(201, {}, {"X-Auth-Token": "token", "Location": "/redfish/v1/SessionService/Sessions/1"})
+
+            def do_DELETE(self):
+                self.send_json(204, {})
+
+            def send_json(self, status, payload, headers=None):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def rhost(self):
+        """
+        Accesses the address of the service
+
+        Returns:
+            The address of the service (with scheme)
+        """
+        return "http://127.0.0.1:{}".format(self._server.server_address[1])
+
+    def get_count(self, uri):
+        """
+        Gets the number of GET requests received for a URI
+
+        Args:
+            uri: The URI, including any query parameters
+
+        Returns:
+            The number of requests
+        """
+        with self._lock:
+            return self.requests[uri]
+
+    def reset(self):
+        """
+        Forgets the requests received so far
+        """
+        with self._lock:
+            self.requests.clear()
+
+
+def make_sut(service, **kwargs):
+    """
+    Builds a system under test for the fake service
+
+    Args:
+        service: The fake service
+        kwargs: Additional arguments for the system under test
+
+    Returns:
+        The system under test
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SystemUnderTest(service.rhost, "admin", "password", 10, "Basic", None, None, None, [], False, **kwargs)
+
+
+def run_quietly(function, *args):
+    """
+    Runs a traversal without printing its progress
+
+    Args:
+        function: The function performing the traversal
+        args: The arguments for the function
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        function(*args)
+
+
+def get_outcome(sut):
+    """
+    Gets what a traversal tested
+
+    Args:
+        sut: The system under test after the traversal
+
+    Returns:
+        The set of canonical URIs of the tested resources
+        A tuple of the pass, warning, fail, and skip counts
+    """
+    tested = set(uri for uri, resource in sut._resources.items() if resource["Validated"])
+    return tested, (sut.pass_count, sut.warn_count, sut.fail_count, sut.skip_count)
@@ -0,0 +1,100 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Async Crawler Unit Tests
+
+File : test_async_crawler.py
+
+Brief : This file contains the unit tests for the asyncio crawl engine.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from fake_service import FakeService
+from fake_service import get_outcome
+from fake_service import make_sut as make_service_sut
+from fake_service import run_quietly
+
+from redfish_service_validator import async_crawler
+from redfish_service_validator.request_control import ConcurrencyController
+from redfish_service_validator.request_control import RequestBudget
+from redfish_service_validator.request_control import RetryPolicy
+
+
+def make_sut(controller, budget):
+    """
+    Builds a system under test with only what's needed to send requests
+
+    Args:
+        controller: The concurrency controller
+        budget: The request budget
+
+    Returns:
+        The system under test
+    """
+    sut = mock.Mock(rhost="http://127.0.0.1:1", proxies=None, timeout=None)
+    sut.session.controller = controller
+    sut.session.budget = budget
+    sut.session.retry_policy = RetryPolicy()
+    sut.get_auth_headers.return_value = {}
+    return sut
+
+
+@unittest.skipIf(async_crawler.aiohttp is None, "aiohttp is not installed")
+class AsyncTransportTest(unittest.TestCase):
+    def test_slot_released_when_cancelled_during_rate_limit(self):
+        controller = ConcurrencyController(1)
+        budget = RequestBudget(max_rps=0.1)
+        budget.reserve()
+        transport = async_crawler.AsyncTransport(make_sut(controller, budget), 1)
+
+        async def cancel_send():
+            transport._loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(transport._send("/redfish/v1/Systems"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_send())
+        self.assertTrue(controller.try_acquire())
+
+
+@unittest.skipIf(async_crawler.aiohttp is None, "aiohttp is not installed")
+class CrawlTest(unittest.TestCase):
+    def test_same_outcome_as_serial_traversal(self):
+        with FakeService() as service:
+            sut = make_service_sut(service)
+            run_quietly(sut.validate, None, "/redfish/v1/", "/redfish/v1/")
+            expected = get_outcome(sut)
+            sut.logout()
+
+            sut = make_service_sut(service, workers=4)
+            service.reset()
+            run_quietly(async_crawler.crawl, sut, None, "/redfish/v1/", 4)
+            sut.logout()
+        self.assertEqual(get_outcome(sut), expected)
+        self.assertIn("/redfish/v1/Chassis/2", expected[0])
+        # Every resource is read once, whichever spelling of its URI was found first
+        self.assertEqual(max(service.requests.values()), 1)
+
+    def test_untested_link_targets_read_before_validation(self):
+        with FakeService() as service:
+            sut = make_service_sut(service, workers=4)
+            service.reset()
+            run_quietly(async_crawler.crawl, sut, "Tree", "/redfish/v1/Systems/1/LogServices", 4)
+            # OriginOfCondition is outside of the tree, so it's only read for the reference link check
+            self.assertEqual(service.get_count("/redfish/v1/Systems/1"), 1)
+            resource = sut.get_link_resource("/redfish/v1/Systems/1", "OriginOfCondition")
+            self.assertEqual(resource["Response"].status, 200)
+            self.assertEqual(service.get_count("/redfish/v1/Systems/1"), 1)
+            sut.logout()
+        self.assertNotIn("/redfish/v1/Systems/1", get_outcome(sut)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
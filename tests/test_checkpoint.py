@@ -0,0 +1,115 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Checkpoint Unit Tests
+
+File : test_checkpoint.py
+
+Brief : This file contains the unit tests for saving and resuming the
+        progress of a run.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import redfish
+
+from redfish_service_validator import checkpoint
+
+RUN = {"Service": "https://192.168.1.100", "TestTime": 1700000000.0, "Traversal": [None, "/redfish/v1/"], "Settings": {}}
+
+
+def make_resource(uri, payload):
+    """
+    Builds the resource information for a tested resource
+
+    Args:
+        uri: The URI of the resource
+        payload: The payload of the resource
+
+    Returns:
+        The resource information
+    """
+    return {
+        "Uri": uri,
+        "Response": redfish.rest.v1.StaticRestResponse(
+            Status=200, Content=json.dumps(payload), Headers={"ETag": '"1"', "Set-Cookie": "session=secret"}
+        ),
+        "Validated": True,
+        "Exception": None,
+        "Results": {"/Id": {"Result": "PASS", "Message": "Pass: The property is valid.", "Value": "1"}},
+        "Pass": 1,
+        "Warn": 0,
+        "Fail": 0,
+        "Skip": 0,
+        "ResponseTime": 12,
+    }
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, checkpoint.CHECKPOINT_FILE)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        payload = {"@odata.id": "/redfish/v1/Systems/1", "Id": "1"}
+        saved = checkpoint.CrawlCheckpoint(self.path, RUN)
+        saved.add_resource("/redfish/v1/Systems/1/", make_resource("/redfish/v1/Systems/1", payload))
+        saved.save_progress(["/redfish/v1/Chassis"], {"Pass": 1})
+        saved.close()
+
+        loaded = checkpoint.load(self.path)
+        self.assertEqual(loaded["Run"], dict(RUN, Version=checkpoint.CHECKPOINT_VERSION))
+        self.assertEqual(loaded["Progress"]["Pending"], ["/redfish/v1/Chassis"])
+        self.assertEqual(list(loaded["Resources"]), ["/redfish/v1/Systems/1"])
+
+        resource = checkpoint.restore_resource(loaded["Resources"]["/redfish/v1/Systems/1"])
+        self.assertEqual(resource["Response"].status, 200)
+        self.assertEqual(resource["Response"].dict, payload)
+        self.assertEqual(resource["Response"].getheader("ETag"), '"1"')
+        self.assertIsNone(resource["Response"].getheader("Set-Cookie"))
+        self.assertEqual(resource["ResponseTime"], 12)
+        # Results are added back along with their tallies
+        self.assertEqual(resource["Results"], {})
+        self.assertEqual(resource["Pass"], 0)
+
+    def test_resumed_run_appends(self):
+        saved = checkpoint.CrawlCheckpoint(self.path, RUN)
+        saved.add_resource("/redfish/v1", make_resource("/redfish/v1", {"Id": "RootService"}))
+        saved.close()
+        resumed = checkpoint.CrawlCheckpoint(self.path)
+        resumed.add_resource("/redfish/v1/Systems", make_resource("/redfish/v1/Systems", {"Members": []}))
+        resumed.close()
+        self.assertEqual(sorted(checkpoint.load(self.path)["Resources"]), ["/redfish/v1", "/redfish/v1/Systems"])
+
+    def test_interrupted_record_is_ignored(self):
+        saved = checkpoint.CrawlCheckpoint(self.path, RUN)
+        saved.add_resource("/redfish/v1", make_resource("/redfish/v1", {"Id": "RootService"}))
+        saved.close()
+        with open(self.path, "a") as checkpoint_file:
+            checkpoint_file.write('{"Resource": {"Uri": "/redfish/v1/Sys')
+        self.assertEqual(list(checkpoint.load(self.path)["Resources"]), ["/redfish/v1"])
+
+    def test_exception_is_saved_as_text(self):
+        resource = make_resource("/redfish/v1/Systems/1", {})
+        resource["Response"] = None
+        resource["Exception"] = ConnectionError("Connection refused")
+        saved = checkpoint.save_resource("/redfish/v1/Systems/1", resource)
+        self.assertEqual(json.loads(json.dumps(saved))["Exception"], "Connection refused")
+
+    def test_not_a_checkpoint(self):
+        with open(self.path, "w") as checkpoint_file:
+            checkpoint_file.write(json.dumps({"Checkpoint": {"Version": 0}}) + "\n")
+        with self.assertRaises(ValueError):
+            checkpoint.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,306 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Crawler Unit Tests
+
+File : test_crawler.py
+
+Brief : This file contains the unit tests for the URI handling, the work
+        queue, the log entry history, and the worker pool used during a
+        traversal.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import redfish
+
+from fake_service import FakeService
+from fake_service import get_outcome
+from fake_service import make_resources
+from fake_service import make_sut
+from fake_service import run_quietly
+
+from redfish_service_validator import crawler
+
+ENTRIES_URI = "/redfish/v1/Systems/1/LogServices/Log/Entries"
+RHOST = "https://192.168.1.100"
+
+
+def make_entries(ids, next_link=None):
+    """
+    Builds the payload of a log entry collection
+
+    Args:
+        ids: The identifiers of the members, in the order listed
+        next_link: The link to the next page; None if there are no more pages
+
+    Returns:
+        The payload
+    """
+    payload = {
+        "@odata.id": ENTRIES_URI,
+        "@odata.type": "#LogEntryCollection.LogEntryCollection",
+        "Members": [{"@odata.id": "{}/{}".format(ENTRIES_URI, entry_id)} for entry_id in ids],
+    }
+    if next_link is not None:
+        payload["Members@odata.nextLink"] = next_link
+    return payload
+
+
+def make_tested_entry(entry_id):
+    """
+    Builds the resource information for a tested log entry
+
+    Args:
+        entry_id: The identifier of the log entry
+
+    Returns:
+        The resource information
+    """
+    payload = {"@odata.id": "{}/{}".format(ENTRIES_URI, entry_id), "@odata.type": "#LogEntry.v1_4_0.LogEntry"}
+    return {
+        "Validated": True,
+        "CircuitOpen": None,
+        "NotRecorded": False,
+        "Oversized": None,
+        "Response": redfish.rest.v1.StaticRestResponse(Status=200, Content=json.dumps(payload), Headers={}),
+    }
+
+
+def get_ids(members):
+    """
+    Gets the identifiers of log entry members
+
+    Args:
+        members: The members of a log entry collection
+
+    Returns:
+        The list of identifiers
+    """
+    return [int(member["@odata.id"].rsplit("/", 1)[-1]) for member in members]
+
+
+class CanonicalUriTest(unittest.TestCase):
+    def test_trailing_and_repeated_slashes(self):
+        self.assertEqual(crawler.canonical_uri("/redfish/v1/Systems/1/"), "/redfish/v1/Systems/1")
+        self.assertEqual(crawler.canonical_uri("/redfish//v1///Systems"), "/redfish/v1/Systems")
+        self.assertEqual(crawler.canonical_uri("/"), "/")
+
+    def test_percent_encoding(self):
+        self.assertEqual(crawler.canonical_uri("/redfish/v1/Systems/%31"), "/redfish/v1/Systems/1")
+        self.assertEqual(crawler.canonical_uri("/redfish/v1/Systems/a%2fb"), "/redfish/v1/Systems/a%2Fb")
+        self.assertNotEqual(crawler.canonical_uri("/redfish/v1/Systems/a%2Fb"), "/redfish/v1/Systems/a/b")
+
+    def test_query_parameters(self):
+        self.assertEqual(
+            crawler.canonical_uri("/redfish/v1/Systems?$top=2&$skip=4"),
+            crawler.canonical_uri("/redfish/v1/Systems/?$skip=4&$top=2"),
+        )
+        self.assertEqual(crawler.canonical_uri("/redfish/v1/Systems?"), "/redfish/v1/Systems")
+
+
+class FrontierTest(unittest.TestCase):
+    def test_dfs_visits_first_link_first(self):
+        frontier = crawler.Frontier("DFS")
+        frontier.push(["/redfish/v1/Systems", "/redfish/v1/Chassis"])
+        self.assertEqual(frontier.pop(), "/redfish/v1/Systems")
+        frontier.push(["/redfish/v1/Systems/1", "/redfish/v1/Systems/2"])
+        self.assertEqual(frontier.peek(), "/redfish/v1/Systems/1")
+        self.assertEqual(
+            frontier.remaining(), ["/redfish/v1/Systems/1", "/redfish/v1/Systems/2", "/redfish/v1/Chassis"]
+        )
+
+    def test_bfs_visits_in_order_found(self):
+        frontier = crawler.Frontier("BFS")
+        frontier.push(["/redfish/v1/Systems", "/redfish/v1/Chassis"])
+        self.assertEqual(frontier.pop(), "/redfish/v1/Systems")
+        frontier.push(["/redfish/v1/Systems/1", "/redfish/v1/Chassis"])
+        self.assertEqual(frontier.remaining(), ["/redfish/v1/Chassis", "/redfish/v1/Systems/1"])
+        self.assertEqual(len(frontier), 2)
+
+    def test_priority_visits_shallowest_first(self):
+        frontier = crawler.Frontier("Priority")
+        frontier.push(["/redfish/v1/Systems/1/Bios", "/redfish/v1/Systems", "/redfish/v1/Chassis"])
+        self.assertEqual(frontier.pop(), "/redfish/v1/Systems")
+        self.assertEqual(frontier.pop(), "/redfish/v1/Chassis")
+        self.assertEqual(frontier.pop(), "/redfish/v1/Systems/1/Bios")
+        self.assertIsNone(frontier.peek())
+
+    def test_unknown_order(self):
+        with self.assertRaises(ValueError):
+            crawler.Frontier("Random")
+
+    def test_deep_chain_does_not_recurse(self):
+        resources = make_resources()
+        chain = ["/redfish/v1/Chassis/{}".format(index) for index in range(1, 301)]
+        resources["/redfish/v1/Chassis"]["Members"] = [{"@odata.id": chain[0]}]
+        for uri, next_uri in zip(chain, chain[1:] + [None]):
+            links = {"Contains": [{"@odata.id": next_uri}]} if next_uri else {}
+            resources[uri] = {"@odata.id": uri, "@odata.type": "#Chassis.v1_5_0.Chassis", "Id": "1", "Links": links}
+        limit = sys.getrecursionlimit()
+        with FakeService(resources) as service:
+            sut = make_sut(service)
+            sys.setrecursionlimit(200)
+            try:
+                run_quietly(sut.validate, "Tree", "/redfish/v1/Chassis", "/redfish/v1/Chassis")
+            finally:
+                sys.setrecursionlimit(limit)
+                sut.logout()
+        self.assertIn(chain[-1], get_outcome(sut)[0])
+
+
+class LogEntryHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, crawler.LOG_HISTORY_FILE)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_history(self, ids, tested=None, recheck=5):
+        """
+        Picks the entries to test from a single page and saves the tested entries as a run would
+
+        Args:
+            ids: The identifiers of the members, newest first
+            tested: The identifiers of the entries tested; None if every selected entry is tested
+            recheck: The number of older entries to test again
+
+        Returns:
+            The identifiers of the selected entries
+        """
+        history = crawler.LogEntryHistory(self.path, RHOST, recheck)
+        selected = get_ids(history.select_members(ENTRIES_URI, make_entries(ids)))
+        if tested is None:
+            tested = selected
+        history.update({"{}/{}".format(ENTRIES_URI, entry_id): make_tested_entry(entry_id) for entry_id in tested})
+        history.save()
+        return selected
+
+    def test_first_run_tests_newest_entries(self):
+        history = crawler.LogEntryHistory(self.path, RHOST)
+        payload = make_entries(range(50, 0, -1), next_link=ENTRIES_URI + "?$skip=50")
+        selected = get_ids(history.select_members(ENTRIES_URI, payload))
+        self.assertEqual(selected, list(range(50, 50 - crawler.LOG_ENTRY_FALLBACK_LIMIT, -1)))
+        self.assertNotIn("Members@odata.nextLink", payload)
+
+    def test_later_run_tests_new_entries_and_recheck_sample(self):
+        self.run_history(range(30, 0, -1))
+        selected = self.run_history(range(40, 0, -1), recheck=3)
+        new_ids = [entry_id for entry_id in selected if entry_id > 30]
+        old_ids = [entry_id for entry_id in selected if entry_id <= 30]
+        self.assertEqual(new_ids, list(range(40, 30, -1)))
+        self.assertEqual(len(old_ids), 3)
+        with open(self.path) as history_file:
+            state = json.load(history_file)[RHOST][ENTRIES_URI]
+        self.assertEqual(state, {"LastId": 40, "Runs": 2})
+
+    def test_recheck_sample_is_repeatable_within_a_run(self):
+        self.run_history(range(30, 0, -1))
+        history = crawler.LogEntryHistory(self.path, RHOST)
+        first = history.select_members(ENTRIES_URI, make_entries(range(30, 0, -1)))
+        second = history.select_members(ENTRIES_URI, make_entries(range(30, 0, -1)))
+        self.assertEqual(first, second)
+
+    def test_paging_stops_at_previous_newest_entry(self):
+        self.run_history(range(30, 0, -1))
+        history = crawler.LogEntryHistory(self.path, RHOST)
+        all_new = make_entries(range(45, 35, -1), next_link=ENTRIES_URI + "?$skip=10")
+        history.select_members(ENTRIES_URI, all_new)
+        self.assertIn("Members@odata.nextLink", all_new)
+        reaches_old = make_entries(range(35, 25, -1), next_link=ENTRIES_URI + "?$skip=20")
+        history.select_members(ENTRIES_URI + "?$skip=10", reaches_old)
+        self.assertNotIn("Members@odata.nextLink", reaches_old)
+
+    def test_paging_continues_when_listed_oldest_first(self):
+        self.run_history(range(30, 0, -1))
+        history = crawler.LogEntryHistory(self.path, RHOST)
+        payload = make_entries(range(1, 11), next_link=ENTRIES_URI + "?$skip=10")
+        self.assertEqual(len(history.select_members(ENTRIES_URI, payload)), 5)
+        self.assertIn("Members@odata.nextLink", payload)
+
+    def test_untested_new_entries_hold_back_the_newest_entry(self):
+        self.run_history(range(30, 0, -1))
+        self.run_history(range(40, 0, -1), tested=[31, 32, 33, 35])
+        with open(self.path) as history_file:
+            state = json.load(history_file)[RHOST][ENTRIES_URI]
+        self.assertEqual(state["LastId"], 33)
+
+    def test_cleared_log_starts_over(self):
+        self.run_history(range(30, 0, -1))
+        selected = self.run_history(range(5, 0, -1))
+        self.assertEqual(selected, [5, 4, 3, 2, 1])
+        with open(self.path) as history_file:
+            state = json.load(history_file)[RHOST][ENTRIES_URI]
+        self.assertEqual(state["LastId"], 5)
+
+    def test_non_numeric_identifiers_use_fallback_limit(self):
+        history = crawler.LogEntryHistory(self.path, RHOST)
+        payload = {
+            "Members": [{"@odata.id": "{}/Entry{}".format(ENTRIES_URI, index)} for index in range(30)],
+            "Members@odata.nextLink": ENTRIES_URI + "?$skip=30",
+        }
+        self.assertEqual(len(history.select_members(ENTRIES_URI, payload)), crawler.LOG_ENTRY_FALLBACK_LIMIT)
+        self.assertNotIn("Members@odata.nextLink", payload)
+
+    def test_history_is_kept_per_service(self):
+        self.run_history(range(30, 0, -1))
+        history = crawler.LogEntryHistory(self.path, "https://192.168.1.101")
+        selected = history.select_members(ENTRIES_URI, make_entries(range(30, 0, -1)))
+        self.assertEqual(len(selected), crawler.LOG_ENTRY_FALLBACK_LIMIT)
+
+
+class CrawlTest(unittest.TestCase):
+    def test_same_outcome_as_serial_traversal(self):
+        with FakeService() as service:
+            sut = make_sut(service)
+            run_quietly(sut.validate, None, "/redfish/v1/", "/redfish/v1/")
+            expected = get_outcome(sut)
+            sut.logout()
+
+            sut = make_sut(service, workers=4)
+            service.reset()
+            run_quietly(crawler.crawl, sut, None, "/redfish/v1/", 4)
+            sut.logout()
+        self.assertEqual(get_outcome(sut), expected)
+        self.assertIn("/redfish/v1/Chassis/2", expected[0])
+        # Every resource is read once, whichever spelling of its URI was found first
+        self.assertEqual(max(service.requests.values()), 1)
+
+    def test_validation_held_until_links_are_read(self):
+        with FakeService() as service:
+            sut = make_sut(service, workers=4)
+            scheduler = crawler.CrawlScheduler(sut, None, "/redfish/v1/")
+            root = scheduler.next_uri()
+            scheduler.add_response(crawler.read_resource(sut, root))
+            self.assertFalse(scheduler.has_ready())
+            links = [scheduler.next_uri() for _ in range(3)]
+            self.assertFalse(scheduler.has_frontier())
+            for uri in links:
+                scheduler.add_response(crawler.read_resource(sut, uri))
+                self.assertEqual(scheduler.has_ready(), uri == links[-1])
+            # Resources are handed out in the order they were found
+            self.assertEqual(scheduler.next_ready(), root)
+            sut.logout()
+
+    def test_failed_read_is_raised(self):
+        with FakeService() as service:
+            sut = make_sut(service, workers=4)
+            service.reset()
+            with mock.patch.object(crawler, "read_resource", side_effect=RuntimeError("Read failed")):
+                with self.assertRaises(RuntimeError):
+                    run_quietly(crawler.crawl, sut, None, "/redfish/v1/Systems", 4)
+            # The resource isn't read again on the calling thread
+            self.assertEqual(service.get_count("/redfish/v1/Systems"), 0)
+            sut.logout()
+
+
+if __name__ == "__main__":
+    unittest.main()
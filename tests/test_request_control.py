@@ -0,0 +1,189 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Request Control Unit Tests
+
+File : test_request_control.py
+
+Brief : This file contains the unit tests for the controls on the requests
+        sent to the service.
+"""
+
+import unittest
+from unittest import mock
+
+from redfish_service_validator import request_control
+from redfish_service_validator.request_control import CircuitBreaker
+from redfish_service_validator.request_control import ConcurrencyController
+from redfish_service_validator.request_control import RequestBudget
+from redfish_service_validator.request_control import RequestBudgetExhausted
+
+LOGS_URI = "/redfish/v1/Systems/1/LogServices/Log/Entries"
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = 1000.0
+        patcher = mock.patch.object(request_control.time, "monotonic", lambda: self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(threshold=2, cooldown=60.0)
+        for index in range(2):
+            self.breaker.record("{}/{}".format(LOGS_URI, index), status=503)
+
+    def test_opens_after_threshold(self):
+        self.assertTrue(self.breaker.is_open(LOGS_URI + "/5"))
+        self.assertEqual(self.breaker.check(LOGS_URI + "/5"), LOGS_URI)
+        self.assertFalse(self.breaker.is_open("/redfish/v1/Chassis/1"))
+
+    def test_failures_beneath_service_root_do_not_open(self):
+        breaker = CircuitBreaker(threshold=1)
+        breaker.record("/redfish/v1/Systems", status=500)
+        self.assertFalse(breaker.is_open("/redfish/v1/Chassis"))
+
+    def test_trial_after_cooldown_closes_on_success(self):
+        self.clock += 61
+        self.assertIsNone(self.breaker.check(LOGS_URI + "/5"))
+        # Only the trial is sent until it completes
+        self.assertEqual(self.breaker.check(LOGS_URI + "/6"), LOGS_URI)
+        self.breaker.record(LOGS_URI + "/5", status=200)
+        self.assertFalse(self.breaker.is_open(LOGS_URI + "/6"))
+        self.assertIsNone(self.breaker.check(LOGS_URI + "/6"))
+
+    def test_trial_owner_passes_again(self):
+        self.clock += 61
+        self.assertIsNone(self.breaker.check(LOGS_URI + "/5"))
+        # Such as the fallback to the full resource after a $select request
+        self.assertIsNone(self.breaker.check(LOGS_URI + "/5"))
+        self.breaker.record(LOGS_URI + "/5", status=200)
+        self.assertFalse(self.breaker.is_open(LOGS_URI + "/5"))
+
+    def test_trial_failure_opens_again(self):
+        self.clock += 61
+        self.assertIsNone(self.breaker.check(LOGS_URI + "/5"))
+        self.breaker.record(LOGS_URI + "/5", status=503)
+        self.assertEqual(self.breaker.check(LOGS_URI + "/6"), LOGS_URI)
+        self.clock += 30
+        self.assertEqual(self.breaker.check(LOGS_URI + "/6"), LOGS_URI)
+
+    def test_trial_released_without_outcome(self):
+        self.clock += 61
+        self.assertIsNone(self.breaker.check(LOGS_URI + "/5"))
+        # Such as when the request budget ran out before the trial was sent
+        self.breaker.release(LOGS_URI + "/5")
+        self.assertTrue(self.breaker.is_open(LOGS_URI + "/6"))
+        self.assertIsNone(self.breaker.check(LOGS_URI + "/6"))
+
+    def test_not_implemented_is_not_a_failure(self):
+        breaker = CircuitBreaker(threshold=1)
+        breaker.record(LOGS_URI + "/1", status=501)
+        self.assertFalse(breaker.is_open(LOGS_URI + "/2"))
+
+
+class RequestBudgetTest(unittest.TestCase):
+    def test_max_requests(self):
+        budget = RequestBudget(max_requests=2)
+        budget.reserve()
+        budget.reserve()
+        self.assertFalse(budget.exhausted)
+        with self.assertRaises(RequestBudgetExhausted):
+            budget.reserve()
+        self.assertTrue(budget.exhausted)
+        self.assertEqual(budget.count, 2)
+
+    def test_rate_spaces_requests(self):
+        clock = [50.0]
+        with mock.patch.object(request_control.time, "monotonic", lambda: clock[0]):
+            budget = RequestBudget(max_rps=4)
+            self.assertEqual(budget.reserve(), 0)
+            self.assertAlmostEqual(budget.reserve(), 0.25)
+            self.assertAlmostEqual(budget.reserve(), 0.5)
+            clock[0] += 2.0
+            self.assertEqual(budget.reserve(), 0)
+
+    def test_no_limits(self):
+        budget = RequestBudget()
+        for _ in range(100):
+            self.assertEqual(budget.reserve(), 0)
+
+
+class ConcurrencyControllerTest(unittest.TestCase):
+    def test_listeners_called_on_release(self):
+        controller = ConcurrencyController(4)
+        calls = []
+        listener = lambda: calls.append(controller.try_acquire())
+        self.assertTrue(controller.try_acquire())
+        self.assertFalse(controller.try_acquire())
+        controller.add_listener(listener)
+        controller.release(10, 200)
+        self.assertEqual(calls, [True])
+        controller.remove_listener(listener)
+        controller.release(10, 200)
+        self.assertEqual(calls, [True])
+
+    def test_limit_cut_on_503(self):
+        controller = ConcurrencyController(8)
+        for _ in range(40):
+            controller.acquire()
+            controller.release(10, 200)
+        grown = controller.limit
+        self.assertGreater(grown, 1)
+        controller.acquire()
+        controller.release(10, 503)
+        self.assertEqual(controller.limit, max(1, grown // 2))
+
+    def run_rounds(self, controller, response_time, rounds):
+        """
+        Sends as many requests as the limit allows and waits for all of them to complete, one round at a time
+
+        Args:
+            controller: The concurrency controller
+            response_time: The time, in milliseconds, for each response
+            rounds: The number of rounds
+        """
+        for _ in range(rounds):
+            in_flight = 0
+            while controller.try_acquire():
+                in_flight += 1
+            self.clock += response_time / 1000
+            for _ in range(in_flight):
+                controller.release(response_time, 200)
+
+    def test_lasting_latency_step_becomes_typical(self):
+        self.clock = 1000.0
+        with mock.patch.object(request_control.time, "monotonic", lambda: self.clock):
+            controller = ConcurrencyController(8)
+            self.run_rounds(controller, 10, 20)
+            self.assertEqual(controller.limit, 8)
+            # The service gets slower for the rest of the run
+            self.run_rounds(controller, 100, 20)
+        cuts = [entry for entry in controller.history if entry["Reason"].startswith("Latency spike")]
+        self.assertEqual(len(cuts), 1)
+        self.assertEqual(controller.limit, 8)
+
+    def test_one_cut_per_window(self):
+        self.clock = 1000.0
+        with mock.patch.object(request_control.time, "monotonic", lambda: self.clock):
+            controller = ConcurrencyController(16)
+            self.run_rounds(controller, 10, 30)
+            self.assertEqual(controller.limit, 16)
+            # Every request in flight at the time of the spike sees the same slow response
+            for _ in range(16):
+                controller.acquire()
+            self.clock += 0.2
+            controller.release(200, 200)
+            self.assertEqual(controller.limit, 8)
+            for _ in range(15):
+                controller.release(200, 200)
+            self.assertEqual(controller.limit, 8)
+            # A spike for a request sent after the cut cuts again
+            controller.acquire()
+            self.clock += 0.5
+            controller.release(500, 200)
+        self.assertEqual(controller.limit, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
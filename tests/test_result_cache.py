@@ -0,0 +1,156 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Result Cache Unit Tests
+
+File : test_result_cache.py
+
+Brief : This file contains the unit tests for reusing the results of
+        resources the service reports as unchanged.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import redfish
+
+from redfish_service_validator import result_cache
+from redfish_service_validator.request_control import CircuitBreaker
+from redfish_service_validator.system_under_test import SystemUnderTest
+
+RHOST = "https://192.168.1.100"
+SYSTEM_URI = "/redfish/v1/Systems/1"
+PAYLOAD = {"@odata.id": SYSTEM_URI, "@odata.type": "#ComputerSystem.v1_5_0.ComputerSystem", "Id": "1"}
+RESULTS = {"/Id": {"Result": "PASS", "Message": "Pass: The property is valid.", "Value": "1"}}
+
+
+def make_resource(etag='"abc"', payload=PAYLOAD):
+    """
+    Builds the resource information for a tested resource
+
+    Args:
+        etag: The ETag header of the response; None for no header
+        payload: The payload of the resource
+
+    Returns:
+        The resource information
+    """
+    headers = {"Allow": "GET"}
+    if etag is not None:
+        headers["ETag"] = etag
+    return {
+        "Uri": SYSTEM_URI,
+        "Response": redfish.rest.v1.StaticRestResponse(Status=200, Content=json.dumps(payload), Headers=headers),
+        "Mockup": False,
+        "Oversized": None,
+        "CircuitOpen": None,
+        "Results": RESULTS,
+    }
+
+
+def make_sut(cache):
+    """
+    Builds a system under test with only what's needed to handle responses
+
+    Args:
+        cache: The result cache
+
+    Returns:
+        The system under test
+    """
+    sut = SystemUnderTest.__new__(SystemUnderTest)
+    sut._result_cache = cache
+    sut._circuit_breaker = CircuitBreaker()
+    sut._max_payload_bytes = None
+    return sut
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, result_cache.CACHE_FILE)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def save_run(self, resource, fingerprint="1"):
+        """
+        Saves the results of a run holding a single resource
+
+        Args:
+            resource: The resource information after testing
+            fingerprint: The fingerprint of the run
+        """
+        cache = result_cache.ResultCache(self.path, RHOST)
+        cache.start(fingerprint)
+        cache.add(SYSTEM_URI, resource)
+        cache.save()
+
+    def test_entries_reused_with_same_fingerprint(self):
+        self.save_run(make_resource())
+        cache = result_cache.ResultCache(self.path, RHOST)
+        cache.start("1")
+        self.assertEqual(cache.get_etag(SYSTEM_URI + "/"), '"abc"')
+        self.assertEqual(cache.get_response(SYSTEM_URI).dict, PAYLOAD)
+        self.assertEqual(cache.get_response(SYSTEM_URI).getheader("Allow"), "GET")
+        self.assertEqual(cache.get_results(SYSTEM_URI), RESULTS)
+
+    def test_entries_ignored_with_different_fingerprint(self):
+        self.save_run(make_resource())
+        cache = result_cache.ResultCache(self.path, RHOST)
+        cache.start("2")
+        self.assertIsNone(cache.get_etag(SYSTEM_URI))
+        self.assertIsNone(cache.get_results(SYSTEM_URI))
+
+    def test_entries_kept_per_service(self):
+        self.save_run(make_resource())
+        cache = result_cache.ResultCache(self.path, "https://192.168.1.101")
+        cache.start("1")
+        self.assertIsNone(cache.get_etag(SYSTEM_URI))
+
+    def test_odata_etag_used_without_header(self):
+        self.save_run(make_resource(etag=None, payload=dict(PAYLOAD, **{"@odata.etag": '"def"'})))
+        cache = result_cache.ResultCache(self.path, RHOST)
+        cache.start("1")
+        self.assertEqual(cache.get_etag(SYSTEM_URI), '"def"')
+
+    def test_resource_without_etag_not_kept(self):
+        self.save_run(make_resource(etag=None))
+        cache = result_cache.ResultCache(self.path, RHOST)
+        cache.start("1")
+        self.assertIsNone(cache.get_etag(SYSTEM_URI))
+
+    def test_not_modified_reuses_previous_payload(self):
+        self.save_run(make_resource())
+        cache = result_cache.ResultCache(self.path, RHOST)
+        cache.start("1")
+        sut = make_sut(cache)
+        self.assertEqual(sut.get_conditional_headers(SYSTEM_URI), {"If-None-Match": '"abc"'})
+
+        resource = sut.create_resource_entry(SYSTEM_URI)
+        response = redfish.rest.v1.StaticRestResponse(Status=304, Content="", Headers={"ETag": '"abc"'})
+        sut.set_resource_response(SYSTEM_URI, resource, response, 5)
+        self.assertTrue(resource["Unchanged"])
+        self.assertEqual(resource["Response"].status, 200)
+        self.assertEqual(resource["Response"].dict, PAYLOAD)
+        self.assertEqual(resource["ResponseTime"], 5)
+
+    def test_changed_resource_is_tested_again(self):
+        self.save_run(make_resource())
+        cache = result_cache.ResultCache(self.path, RHOST)
+        cache.start("1")
+        sut = make_sut(cache)
+        resource = sut.create_resource_entry(SYSTEM_URI)
+        changed = dict(PAYLOAD, Name="System")
+        response = redfish.rest.v1.StaticRestResponse(Status=200, Content=json.dumps(changed), Headers={"ETag": '"x"'})
+        sut.set_resource_response(SYSTEM_URI, resource, response, 5)
+        self.assertFalse(resource["Unchanged"])
+        self.assertEqual(resource["Response"].dict, changed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+System Under Test Unit Tests
+
+File : test_system_under_test.py
+
+Brief : This file contains the unit tests for reading resources from the
+        service, including resources only read to check reference links.
+"""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from fake_service import FakeService
+from fake_service import make_resources
+from fake_service import make_sut
+
+SYSTEM_URI = "/redfish/v1/Systems/1"
+
+
+class GetResourceTest(unittest.TestCase):
+    def test_concurrent_reads_share_one_request(self):
+        with FakeService(delay=0.2) as service:
+            sut = make_sut(service, workers=4)
+            service.reset()
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                resources = list(executor.map(sut.get_resource, [SYSTEM_URI, SYSTEM_URI, SYSTEM_URI + "/", SYSTEM_URI]))
+            self.assertEqual(sum(service.requests.values()), 1)
+            sut.logout()
+        for resource in resources:
+            self.assertIs(resource, resources[0])
+        self.assertEqual(resources[0]["Response"].status, 200)
+
+    def test_failed_read_is_shared(self):
+        with FakeService(delay=0.2) as service:
+            sut = make_sut(service, workers=4)
+            service.reset()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                resources = list(executor.map(sut.get_resource, ["/redfish/v1/Chassis/2"] * 2))
+            self.assertEqual(service.get_count("/redfish/v1/Chassis/2"), 1)
+            sut.logout()
+        self.assertIs(resources[0], resources[1])
+        self.assertEqual(resources[0]["Response"].status, 404)
+
+
+class SetupTest(unittest.TestCase):
+    def test_manager_read_at_setup_is_reused(self):
+        with FakeService() as service:
+            sut = make_sut(service)
+            self.assertEqual(service.get_count("/redfish/v1/Managers/1"), 1)
+            service.reset()
+            for uri in ["/redfish/v1/Managers", "/redfish/v1/Managers/1"]:
+                self.assertEqual(sut.get_resource(uri)["Response"].status, 200)
+            self.assertEqual(sum(service.requests.values()), 0)
+            sut.logout()
+
+
+class GetLinkResourceTest(unittest.TestCase):
+    def test_untested_link_read_with_select(self):
+        resources = make_resources()
+        resources["/redfish/v1"]["ProtocolFeaturesSupported"] = {"SelectQuery": True}
+        with FakeService(resources) as service:
+            sut = make_sut(service)
+            sut.set_traversal("Single", SYSTEM_URI + "/Bios")
+            service.reset()
+            resource = sut.get_link_resource(SYSTEM_URI, "OriginOfCondition")
+            self.assertEqual(dict(service.requests), {SYSTEM_URI + "?$select=@odata.type": 1})
+            # Read again from the cache
+            self.assertIs(sut.get_link_resource(SYSTEM_URI, "OriginOfCondition"), resource)
+            self.assertEqual(sum(service.requests.values()), 1)
+            sut.logout()
+        self.assertEqual(resource["Response"].dict["@odata.type"], "#ComputerSystem.v1_5_0.ComputerSystem")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Copyright Notice:
+# Copyright 2016-2026 DMTF. All rights reserved.
+# License: BSD 3-Clause License. For full text see link: https://github.com/DMTF/Redfish-Service-Validator/blob/main/LICENSE.md
+
+"""
+Traffic Archive Unit Tests
+
+File : test_traffic_archive.py
+
+Brief : This file contains the unit tests for recording responses from the
+        service and replaying them.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+import redfish
+
+from redfish_service_validator import traffic_archive
+from redfish_service_validator.traffic_archive import NotRecordedError
+from redfish_service_validator.traffic_archive import ReplayClient
+from redfish_service_validator.traffic_archive import TrafficArchive
+from redfish_service_validator.traffic_archive import TrafficRecorder
+
+RHOST = "https://192.168.1.100"
+ROOT = {"@odata.id": "/redfish/v1", "@odata.type": "#ServiceRoot.v1_5_0.ServiceRoot", "Id": "RootService"}
+SYSTEMS = {"@odata.id": "/redfish/v1/Systems", "Members": [{"@odata.id": "/redfish/v1/Systems/1"}]}
+
+
+def make_response(status, payload, headers=None):
+    """
+    Builds a response from the service
+
+    Args:
+        status: The HTTP status
+        payload: The payload as a dictionary
+        headers: The response headers
+
+    Returns:
+        The response
+    """
+    response = redfish.rest.v1.StaticRestResponse(Status=status, Content=json.dumps(payload), Headers=headers or {})
+    response.transfer = {"BytesSent": 100, "BytesReceived": 200, "BytesUncompressed": 300}
+    response.oversized = False
+    return response
+
+
+class TrafficArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "service.zip")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, responses):
+        """
+        Records responses to the archive
+
+        Args:
+            responses: A list of tuples of the URI, the response, and the response time
+        """
+        recorder = TrafficRecorder(self.path, RHOST)
+        for uri, response, response_time in responses:
+            recorder.add(uri, response, response_time)
+        recorder.close()
+
+    def test_replay(self):
+        headers = {"ETag": '"1"', "X-Auth-Token": "secret", "Content-Encoding": "gzip"}
+        self.record(
+            [
+                ("/redfish/v1/", make_response(200, ROOT), 15),
+                ("/redfish/v1/Systems", make_response(200, SYSTEMS, headers), 40),
+                ("/redfish/v1/Systems/2", make_response(404, {"error": {}}), 3),
+            ]
+        )
+        archive = TrafficArchive(self.path)
+        self.assertEqual(archive.service, RHOST)
+
+        response, response_time = archive.get("/redfish/v1/Systems/")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.dict, SYSTEMS)
+        self.assertEqual(response_time, 40)
+        self.assertEqual(response.transfer["BytesReceived"], 200)
+        self.assertEqual(response.getheader("ETag"), '"1"')
+        self.assertIsNone(response.getheader("X-Auth-Token"))
+        self.assertIsNone(response.getheader("Content-Encoding"))
+
+        # Recorded errors from the service are replayed as they were
+        response, _ = archive.get("/redfish/v1/Systems/2")
+        self.assertEqual(response.status, 404)
+
+    def test_not_recorded(self):
+        self.record([("/redfish/v1/", make_response(200, ROOT), 15)])
+        archive = TrafficArchive(self.path)
+        with self.assertRaises(NotRecordedError):
+            archive.get("/redfish/v1/Systems")
+        with self.assertRaises(NotRecordedError):
+            archive.get("/redfish/v1/?$select=Name")
+
+    def test_replay_client(self):
+        self.record(
+            [("/redfish/v1/", make_response(200, ROOT), 15), ("/redfish/v1/Systems", make_response(200, SYSTEMS), 40)]
+        )
+        client = ReplayClient(TrafficArchive(self.path))
+        self.assertEqual(client.root, ROOT)
+        self.assertEqual(client.root_time, 15)
+        response = client.get("/redfish/v1/Systems", headers={"If-None-Match": '"1"'})
+        self.assertEqual(response.dict, SYSTEMS)
+        self.assertEqual(response.response_time, 40)
+
+    def test_replay_client_needs_service_root(self):
+        self.record([("/redfish/v1/Systems", make_response(200, SYSTEMS), 40)])
+        with self.assertRaises(ValueError):
+            ReplayClient(TrafficArchive(self.path))
+
+    def test_unfinished_recording(self):
+        # Responses without the index, as when the recording run was killed
+        with zipfile.ZipFile(self.path, "w") as archive_file:
+            archive_file.writestr("responses/000001.json", json.dumps(ROOT))
+        with self.assertRaises(ValueError):
+            TrafficArchive(self.path)
+
+    def test_unsupported_version(self):
+        with zipfile.ZipFile(self.path, "w") as archive_file:
+            index = {"Version": traffic_archive.ARCHIVE_VERSION + 1, "Service": RHOST, "Responses": {}}
+            archive_file.writestr(traffic_archive.INDEX_FILE, json.dumps(index))
+        with self.assertRaises(ValueError):
+            TrafficArchive(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()